@@ -4,15 +4,25 @@ from flask_cors import CORS
 from flask_migrate import Migrate
 from flask_wtf.csrf import CSRFProtect, generate_csrf
 from flask_login import LoginManager
-from .models import db, User
+from .models import db, User, SessionUser
 from .api.user_routes import user_routes
 from .api.auth_routes import auth_routes
 from .api.category_routes import category_routes
 from .api.transaction_routes import transaction_routes
 from .api.budget_routes import budget_routes
 from .api.savings_routes import savings_routes
+from .api.report_routes import report_routes
+from .api.ops_routes import ops_routes
+from .api.analytics_routes import analytics_routes
+from .api.recurring_routes import recurring_routes
+from .api.job_routes import job_routes
 from .seeds import seed_commands
+from .commands import rollup_commands, query_commands, recurring_commands
 from .config import Config
+from .cache import response_cache, user_cache
+from .instrumentation import query_instrumentation
+from .scheduler import scheduler
+from .jobs import job_runner
 
 app = Flask(__name__, static_folder='../react-vite/dist', static_url_path='/')
 
@@ -23,19 +33,42 @@ login.login_view = 'auth.unauthorized'
 
 @login.user_loader
 def load_user(id):
-    return User.query.get(int(id))
+    # Serve the session user from a short-TTL cache; only a miss (or a
+    # change to the user, which evicts it) costs a query on users
+    key = f'user:{id}'
+    data = user_cache.get(key)
+    if data is None:
+        user = User.query.get(int(id))
+        if not user:
+            return None
+        data = user.to_dict()
+        user_cache.set(key, data)
+    return SessionUser(data)
 
 
 # Tell flask about our seed commands
 app.cli.add_command(seed_commands)
+app.cli.add_command(rollup_commands)
+app.cli.add_command(query_commands)
+app.cli.add_command(recurring_commands)
 
 app.config.from_object(Config)
+response_cache.init_app(app)
+user_cache.init_app(app)
+query_instrumentation.init_app(app)
+scheduler.init_app(app)
+job_runner.init_app(app)
 app.register_blueprint(user_routes, url_prefix='/api/users')
 app.register_blueprint(auth_routes, url_prefix='/api/auth')
 app.register_blueprint(category_routes, url_prefix='/api/categories')
 app.register_blueprint(transaction_routes, url_prefix='/api/transactions')
 app.register_blueprint(budget_routes, url_prefix='/api/budgets')
 app.register_blueprint(savings_routes, url_prefix='/api/savings')
+app.register_blueprint(report_routes, url_prefix='/api/reports')
+app.register_blueprint(ops_routes, url_prefix='/api/ops')
+app.register_blueprint(analytics_routes, url_prefix='/api/analytics')
+app.register_blueprint(recurring_routes, url_prefix='/api/recurring')
+app.register_blueprint(job_routes, url_prefix='/api/jobs')
 db.init_app(app)
 Migrate(app, db)
 
@@ -5,6 +5,11 @@ from .category_routes import category_routes
 from .transaction_routes import transaction_routes
 from .budget_routes import budget_routes
 from .savings_routes import savings_routes
+from .report_routes import report_routes
+from .ops_routes import ops_routes
+from .analytics_routes import analytics_routes
+from .recurring_routes import recurring_routes
+from .job_routes import job_routes
 
 api = Blueprint('api', __name__)
 
@@ -13,4 +18,9 @@ api.register_blueprint(auth_routes, url_prefix='/auth')
 api.register_blueprint(category_routes, url_prefix='/categories')
 api.register_blueprint(transaction_routes, url_prefix='/transactions')
 api.register_blueprint(budget_routes, url_prefix='/api/budgets')
-api.register_blueprint(savings_routes, url_prefix='/api/savings')
\ No newline at end of file
+api.register_blueprint(savings_routes, url_prefix='/api/savings')
+api.register_blueprint(report_routes, url_prefix='/reports')
+api.register_blueprint(ops_routes, url_prefix='/ops')
+api.register_blueprint(analytics_routes, url_prefix='/analytics')
+api.register_blueprint(recurring_routes, url_prefix='/recurring')
+api.register_blueprint(job_routes, url_prefix='/jobs')
\ No newline at end of file
@@ -0,0 +1,276 @@
+from app.models import db, Transaction, ResourceVersion
+from app.cache import LocalCache
+from datetime import date
+import numpy as np
+
+DEFAULT_MONTHS = 12
+MAX_MONTHS = 120
+DEFAULT_Z_THRESHOLD = 3.0
+DEFAULT_ANOMALY_LIMIT = 50
+MAX_ANOMALY_LIMIT = 500
+# Categories with fewer transactions than this have no meaningful spread
+MIN_ANOMALY_SAMPLE = 5
+TRANSACTION_TYPES = ('income', 'expense')
+
+# Loaded ledgers, keyed by user and the version of their transactions, so
+# a user's rows are read from the database once per change. Kept small:
+# a ledger of 500k rows takes about 15 MB.
+ledger_cache = LocalCache(max_entries=16, default_ttl=600)
+
+
+class Ledger:
+    """
+    One user's transactions as parallel NumPy arrays: id, category, whether
+    it is an expense, amount and month (as year * 12 + month - 1). Every
+    analysis below is a handful of vectorized passes over these arrays.
+    """
+
+    def __init__(self, user_id, ids, category_ids, is_expense, amounts, months):
+        self.user_id = user_id
+        self.ids = ids
+        self.category_ids = category_ids
+        self.is_expense = is_expense
+        self.amounts = amounts
+        self.months = months
+
+    @classmethod
+    def load(cls, user_id):
+        ledger_key = f'{user_id}:{ResourceVersion.etag(user_id, ("transactions",))}'
+        ledger = ledger_cache.get(ledger_key)
+        if ledger is not None:
+            return ledger
+
+        year = db.cast(db.extract('year', Transaction.transaction_date), db.Integer)
+        month = db.cast(db.extract('month', Transaction.transaction_date), db.Integer)
+        query = db.select(
+            Transaction.id,
+            Transaction.category_id,
+            db.case((Transaction.type == 'expense', 1), else_=0),
+            db.cast(Transaction.amount, db.Float),
+            year * 12 + month - 1
+        ).where(Transaction.user_id == user_id)
+        rows = db.session.connection().execute(query).all()
+
+        # Plain tuples convert to an array many times faster than Rows
+        columns = np.array([tuple(row) for row in rows], dtype=float).reshape(-1, 5).T
+        ledger = cls(
+            user_id=user_id,
+            ids=columns[0].astype(np.int64),
+            category_ids=columns[1].astype(np.int64),
+            is_expense=columns[2].astype(bool),
+            amounts=columns[3],
+            months=columns[4].astype(np.int64)
+        )
+        ledger_cache.set(ledger_key, ledger)
+        return ledger
+
+    def select(self, type):
+        # Boolean mask of the transactions of one type
+        return self.is_expense if type == 'expense' else ~self.is_expense
+
+    def monthly_matrix(self, type, months):
+        """
+        Totals per category (rows) and month (columns) for the given months,
+        plus the sorted category ids. One bincount over the whole ledger.
+        """
+        mask = self.select(type)
+        categories, category_index = np.unique(self.category_ids[mask], return_inverse=True)
+        first = months[0]
+        position = self.months[mask] - first
+        in_range = (position >= 0) & (position < len(months))
+        flat = category_index[in_range] * len(months) + position[in_range]
+        matrix = np.bincount(
+            flat, weights=self.amounts[mask][in_range], minlength=len(categories) * len(months)
+        ).reshape(len(categories), len(months))
+        return categories, matrix
+
+
+def month_window(count, today=None):
+    # The last `count` month indexes, oldest first, ending with this month
+    today = today or date.today()
+    last = today.year * 12 + today.month - 1
+    return np.arange(last - count + 1, last + 1)
+
+
+def month_labels(months):
+    return [{'year': int(month // 12), 'month': int(month % 12 + 1)} for month in months]
+
+
+def rolling_mean(matrix, window):
+    """
+    Trailing mean over `window` columns for every row at once. The first
+    columns average over the months available so far.
+    """
+    cumulative = np.cumsum(matrix, axis=1)
+    shifted = np.zeros_like(cumulative)
+    shifted[:, window:] = cumulative[:, :-window]
+    counts = np.minimum(np.arange(1, matrix.shape[1] + 1), window)
+    return (cumulative - shifted) / counts
+
+
+def rounded(values):
+    return np.round(values, 2).tolist()
+
+
+def trends(ledger, type, months):
+    """
+    Monthly totals per category with trailing 3- and 12-month averages.
+    Eleven months before the window are loaded so the 12-month average is
+    complete from its first month.
+    """
+    history = np.arange(months[0] - 11, months[-1] + 1)
+    categories, matrix = ledger.monthly_matrix(type, history)
+    average_3 = rolling_mean(matrix, 3)[:, 11:]
+    average_12 = rolling_mean(matrix, 12)[:, 11:]
+    matrix = matrix[:, 11:]
+    return {
+        'months': month_labels(months),
+        'categories': [
+            {
+                'category_id': int(category_id),
+                'totals': rounded(matrix[n]),
+                'average_3': rounded(average_3[n]),
+                'average_12': rounded(average_12[n])
+            }
+            for n, category_id in enumerate(categories)
+        ]
+    }
+
+
+def shares(ledger, type, months):
+    # Each category's percentage of the month's total, and of the window's
+    categories, matrix = ledger.monthly_matrix(type, months)
+    month_totals = matrix.sum(axis=0)
+    monthly_share = np.divide(
+        matrix * 100, month_totals, out=np.zeros_like(matrix), where=month_totals > 0
+    )
+    window_total = matrix.sum()
+    window_share = matrix.sum(axis=1) * 100 / window_total if window_total > 0 else np.zeros(len(categories))
+    return {
+        'months': month_labels(months),
+        'totals': rounded(month_totals),
+        'categories': [
+            {
+                'category_id': int(category_id),
+                'shares': rounded(monthly_share[n]),
+                'share': round(float(window_share[n]), 2)
+            }
+            for n, category_id in enumerate(categories)
+        ]
+    }
+
+
+def deltas(ledger, type, months):
+    """
+    Change from the previous month per category and overall, as an amount
+    and as a percentage (null when the previous month was zero)
+    """
+    history = np.arange(months[0] - 1, months[-1] + 1)
+    categories, matrix = ledger.monthly_matrix(type, history)
+    totals = matrix.sum(axis=0, keepdims=True)
+
+    def changes(values):
+        previous = values[:, :-1]
+        change = np.diff(values, axis=1)
+        percent = np.divide(change * 100, previous, out=np.full_like(change, np.nan), where=previous > 0)
+        percent = np.round(percent, 2).astype(object)
+        percent[np.isnan(percent.astype(float))] = None
+        return np.round(change, 2).tolist(), percent.tolist()
+
+    total_change, total_percent = changes(totals)
+    category_changes = changes(matrix)
+    return {
+        'months': month_labels(months),
+        'total': {'change': total_change[0], 'percent': total_percent[0]},
+        'categories': [
+            {
+                'category_id': int(category_id),
+                'change': category_changes[0][n],
+                'percent': category_changes[1][n]
+            }
+            for n, category_id in enumerate(categories)
+        ]
+    }
+
+
+def anomalies(ledger, type, threshold, limit):
+    """
+    Transactions whose amount is at least `threshold` standard deviations
+    from the mean of their category, largest first. Means and deviations
+    come from per-category bincounts over the whole ledger.
+    """
+    mask = ledger.select(type)
+    ids = ledger.ids[mask]
+    amounts = ledger.amounts[mask]
+    categories, index = np.unique(ledger.category_ids[mask], return_inverse=True)
+
+    counts = np.bincount(index, minlength=len(categories))
+    sums = np.bincount(index, weights=amounts, minlength=len(categories))
+    squares = np.bincount(index, weights=amounts * amounts, minlength=len(categories))
+    means = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+    variances = np.divide(squares, counts, out=np.zeros_like(squares), where=counts > 0) - means ** 2
+    stds = np.sqrt(np.maximum(variances, 0))
+
+    usable = (counts >= MIN_ANOMALY_SAMPLE) & (stds > 0)
+    z_scores = np.divide(amounts - means[index], stds[index], out=np.zeros_like(amounts), where=usable[index])
+    outliers = np.flatnonzero(np.abs(z_scores) >= threshold)
+    outliers = outliers[np.argsort(-np.abs(z_scores[outliers]), kind='stable')][:limit]
+
+    # Fetch the details of just the flagged rows, still the user's own:
+    # the ledger may be a little older than the table
+    details = {
+        transaction.id: transaction
+        for transaction in Transaction.query.filter(
+            Transaction.user_id == ledger.user_id,
+            Transaction.id.in_(ids[outliers].tolist())
+        )
+    }
+    results = []
+    for n in outliers:
+        transaction = details.get(int(ids[n]))
+        if transaction is None:
+            continue
+        results.append({
+            **transaction.to_dict(include_category=False),
+            'z_score': round(float(z_scores[n]), 2),
+            'category_mean': round(float(means[index[n]]), 2),
+            'category_std': round(float(stds[index[n]]), 2)
+        })
+    return {'threshold': threshold, 'anomalies': results}
+
+
+def parse_type(args):
+    type = args.get('type', 'expense')
+    if type not in TRANSACTION_TYPES:
+        raise ValueError('Type must be either "income" or "expense"')
+    return type
+
+
+def parse_months(args):
+    try:
+        months = int(args.get('months', DEFAULT_MONTHS))
+    except ValueError:
+        raise ValueError('Months must be an integer')
+    if not (1 <= months <= MAX_MONTHS):
+        raise ValueError(f'Months must be between 1 and {MAX_MONTHS}')
+    return month_window(months)
+
+
+def parse_threshold(args):
+    try:
+        threshold = float(args.get('z', DEFAULT_Z_THRESHOLD))
+    except ValueError:
+        raise ValueError('z must be a number')
+    if not threshold > 0:
+        raise ValueError('z must be greater than 0')
+    return threshold
+
+
+def parse_anomaly_limit(args):
+    try:
+        limit = int(args.get('limit', DEFAULT_ANOMALY_LIMIT))
+    except ValueError:
+        raise ValueError('Limit must be an integer')
+    if not (1 <= limit <= MAX_ANOMALY_LIMIT):
+        raise ValueError(f'Limit must be between 1 and {MAX_ANOMALY_LIMIT}')
+    return limit
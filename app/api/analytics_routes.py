@@ -0,0 +1,76 @@
+from flask import Blueprint, jsonify, request
+from flask_login import current_user, login_required
+from app.api.serializers import json_response
+from app.api.analytics import (
+    Ledger, trends, shares, deltas, anomalies,
+    parse_type, parse_months, parse_threshold, parse_anomaly_limit
+)
+
+analytics_routes = Blueprint('analytics', __name__)
+
+# Get monthly totals per category with rolling 3- and 12-month averages
+@analytics_routes.route('/trends', methods=['GET'])
+@login_required
+def get_trends():
+    """
+    Totals per category for each of the last ?months= months (default 12,
+    ending with this month) of ?type= transactions (default expense)
+    """
+    try:
+        type = parse_type(request.args)
+        months = parse_months(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    return json_response(trends(Ledger.load(current_user.id), type, months))
+
+# Get each category's share of the monthly total
+@analytics_routes.route('/shares', methods=['GET'])
+@login_required
+def get_shares():
+    """
+    Each category's percentage of the monthly total for the last ?months=
+    months (default 12) of ?type= transactions (default expense), and of
+    the whole window
+    """
+    try:
+        type = parse_type(request.args)
+        months = parse_months(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    return json_response(shares(Ledger.load(current_user.id), type, months))
+
+# Get month-over-month changes per category and overall
+@analytics_routes.route('/deltas', methods=['GET'])
+@login_required
+def get_deltas():
+    """
+    Change from the previous month, as an amount and a percentage, per
+    category and overall for the last ?months= months (default 12) of
+    ?type= transactions (default expense)
+    """
+    try:
+        type = parse_type(request.args)
+        months = parse_months(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    return json_response(deltas(Ledger.load(current_user.id), type, months))
+
+# Get transactions that are unusually large or small for their category
+@analytics_routes.route('/anomalies', methods=['GET'])
+@login_required
+def get_anomalies():
+    """
+    Transactions at least ?z= standard deviations (default 3) from their
+    category's mean, up to ?limit= of them (default 50), largest first
+    """
+    try:
+        type = parse_type(request.args)
+        threshold = parse_threshold(request.args)
+        limit = parse_anomaly_limit(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    return json_response(anomalies(Ledger.load(current_user.id), type, threshold, limit))
@@ -27,8 +27,13 @@ def login():
     # form manually to validate_on_submit can be used
     form['csrf_token'].data = request.cookies['csrf_token']
     if form.validate_on_submit():
+        # The form already loaded the user while validating
+        user = form.user
+        # Upgrade the stored hash if the configured method or cost changed
+        if user.needs_rehash():
+            user.password = form.data['password']
+            db.session.commit()
         # Add the user to the session, we are logged in!
-        user = User.query.filter(User.email == form.data['email']).first()
         login_user(user)
         return user.to_dict()
     return form.errors, 401
@@ -1,6 +1,10 @@
 from flask import Blueprint, jsonify, request
 from flask_login import current_user, login_required
-from app.models import db, Budget, Category
+from app.models import db, Budget, Category, MonthlyCategoryTotal, ResourceVersion
+from app.api.conditional import conditional_get
+from app.api.category_routes import categories_by_id
+from app.api.serializers import fetch, budget_query, serialize_budgets, json_response
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime
 
 budget_routes = Blueprint('budgets', __name__)
@@ -8,9 +12,73 @@ budget_routes = Blueprint('budgets', __name__)
 # Get all budgets for current user
 @budget_routes.route('', methods=['GET'])
 @login_required
+@conditional_get('budgets', 'categories', cache=True)
 def get_budgets():
-    budgets = Budget.query.filter(Budget.user_id == current_user.id).all()
-    return jsonify([budget.to_dict() for budget in budgets])
+    # ?sideload=categories returns {budgets, categories} with each category
+    # once in a map keyed by id; otherwise categories are embedded, selected
+    # in the same query
+    if request.args.get('sideload') == 'categories':
+        rows = fetch(budget_query(include_category=False).filter(Budget.user_id == current_user.id))
+        return json_response({
+            'budgets': serialize_budgets(rows, include_category=False),
+            'categories': categories_by_id({row.category_id for row in rows})
+        })
+
+    rows = fetch(budget_query().filter(Budget.user_id == current_user.id))
+    return json_response(serialize_budgets(rows))
+
+# Get budgeted vs. actual spending for every budget, optionally for one month
+@budget_routes.route('/status', methods=['GET'])
+@login_required
+@conditional_get('budgets', 'transactions')
+def get_budget_status():
+    """
+    Budgeted, spent, remaining and percent used for each budget of the
+    current user, filtered by ?month= and ?year= when given
+    """
+    try:
+        month = int(request.args['month']) if request.args.get('month') else None
+        year = int(request.args['year']) if request.args.get('year') else None
+    except ValueError:
+        return jsonify({'error': 'Month and year must be integers'}), 400
+
+    if month is not None and not (1 <= month <= 12):
+        return jsonify({'error': 'Month must be between 1 and 12'}), 400
+
+    # Each budget joins its expense row in the monthly rollup, which is
+    # already summed by (category_id, year, month), in a single query
+    spent = MonthlyCategoryTotal
+    query = db.session.query(
+        Budget,
+        db.func.coalesce(spent.total, 0).label('spent')
+    ).outerjoin(spent, db.and_(
+        spent.user_id == Budget.user_id,
+        spent.category_id == Budget.category_id,
+        spent.year == Budget.year,
+        spent.month == Budget.month,
+        spent.type == 'expense'
+    )).filter(Budget.user_id == current_user.id)
+    if year is not None:
+        query = query.filter(Budget.year == year)
+    if month is not None:
+        query = query.filter(Budget.month == month)
+
+    statuses = []
+    for budget, spent_amount in query.order_by(Budget.year, Budget.month, Budget.id).all():
+        budgeted = float(budget.amount)
+        spent_amount = float(spent_amount)
+        statuses.append({
+            'budget_id': budget.id,
+            'category_id': budget.category_id,
+            'month': budget.month,
+            'year': budget.year,
+            'budgeted': budgeted,
+            'spent': spent_amount,
+            'remaining': budgeted - spent_amount,
+            'percent': round(spent_amount / budgeted * 100, 2) if budgeted > 0 else 0
+        })
+
+    return jsonify(statuses)
 
 # Get a specific budget
 @budget_routes.route('/<int:id>', methods=['GET'])
@@ -71,7 +139,13 @@ def create_budget():
     )
     
     db.session.add(new_budget)
-    db.session.commit()
+    ResourceVersion.bump(current_user.id, 'budgets')
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # A concurrent request created the same budget first
+        db.session.rollback()
+        return jsonify({'error': 'A budget for this category and month already exists'}), 400
     
     return jsonify(new_budget.to_dict()), 201
 
@@ -111,7 +185,13 @@ def update_budget(id):
         budget.year = data['year']
     
     budget.updated_at = datetime.utcnow()
-    db.session.commit()
+    ResourceVersion.bump(current_user.id, 'budgets')
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Moving the budget onto a category and month that already has one
+        db.session.rollback()
+        return jsonify({'error': 'A budget for this category and month already exists'}), 400
     
     return jsonify(budget.to_dict())
 
@@ -128,6 +208,7 @@ def delete_budget(id):
         return jsonify({'error': 'Unauthorized'}), 403
     
     db.session.delete(budget)
+    ResourceVersion.bump(current_user.id, 'budgets')
     db.session.commit()
     
     return jsonify({'message': 'Budget successfully deleted'})
\ No newline at end of file
@@ -1,16 +1,29 @@
 from flask import Blueprint, jsonify, request
 from flask_login import current_user, login_required
-from app.models import db, Category
+from app.models import db, Category, ResourceVersion
+from app.api.conditional import conditional_get
+from app.api.serializers import fetch, category_query, serialize_categories, json_response
 from datetime import datetime
 
 category_routes = Blueprint('categories', __name__)
 
+
+# Serialized categories for the given ids, keyed by id, for list endpoints
+# that sideload categories instead of embedding them in every row
+def categories_by_id(ids):
+    if not ids:
+        return {}
+    rows = fetch(category_query().filter(Category.id.in_(ids)))
+    return {category['id']: category for category in serialize_categories(rows)}
+
+
 # Get all categories for current user
 @category_routes.route('', methods=['GET'])
 @login_required
+@conditional_get('categories', cache=True)
 def get_categories():
-    categories = Category.query.filter(Category.user_id == current_user.id).all()
-    return jsonify([category.to_dict() for category in categories])
+    rows = fetch(category_query().filter(Category.user_id == current_user.id))
+    return json_response(serialize_categories(rows))
 
 # Get a specific category
 @category_routes.route('/<int:id>', methods=['GET'])
@@ -42,6 +55,7 @@ def create_category():
     )
     
     db.session.add(new_category)
+    ResourceVersion.bump(current_user.id, 'categories')
     db.session.commit()
     
     return jsonify(new_category.to_dict()), 201
@@ -67,6 +81,7 @@ def update_category(id):
         category.description = data['description']
     
     category.updated_at = datetime.utcnow()
+    ResourceVersion.bump(current_user.id, 'categories')
     db.session.commit()
     
     return jsonify(category.to_dict())
@@ -84,6 +99,8 @@ def delete_category(id):
         return jsonify({'error': 'Unauthorized'}), 403
     
     db.session.delete(category)
+    # Deleting a category cascades to its transactions and budgets
+    ResourceVersion.bump(current_user.id, 'categories', 'transactions', 'budgets')
     db.session.commit()
     
     return jsonify({'message': 'Category successfully deleted'})
\ No newline at end of file
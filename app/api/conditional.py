@@ -0,0 +1,43 @@
+from flask import make_response, request
+from flask_login import current_user
+from app.models import ResourceVersion
+from app.cache import response_cache
+from functools import wraps
+
+
+def conditional_get(*resources, cache=False):
+    """
+    Decorates a list endpoint whose response depends only on the given
+    resources of the current user. Responds 304 when the client's
+    If-None-Match matches the current ETag, without calling the view.
+
+    With cache=True the response body is also kept in the response cache
+    under its ETag. A write bumps the version of the resources it touches,
+    which changes the ETag, so the stale entry is never served again and
+    ages out of the LRU; entries of other users and resources are kept.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            etag = ResourceVersion.etag(current_user.id, resources)
+            if etag in request.if_none_match:
+                response = make_response('', 304)
+            else:
+                key = f'{request.endpoint}:{etag}:{request.query_string.decode()}'
+                cached = response_cache.get(key) if cache else None
+                if cached is not None:
+                    body, mimetype = cached
+                    response = make_response(body)
+                    response.mimetype = mimetype
+                else:
+                    response = make_response(view(*args, **kwargs))
+                    if response.status_code != 200:
+                        return response
+                    if cache and not response.is_streamed:
+                        response_cache.set(key, (response.get_data(), response.mimetype))
+            response.set_etag(etag)
+            # Let the browser keep the body but revalidate on every use
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,124 @@
+from flask import current_app
+from app.models import db, Transaction, Category, MonthlyCategoryTotal, ResourceVersion
+from app.api.transaction_import import import_transactions
+from app.jobs import job_runner
+from datetime import date
+import os
+
+# Kinds that take an uploaded file; they are enqueued by their own
+# endpoint, which stores the file, rather than from JSON params
+UPLOAD_KINDS = ('import',)
+ANNUAL_REPORT_LARGEST_EXPENSES = 10
+
+
+def upload_path(name):
+    return os.path.join(current_app.config['JOB_UPLOAD_DIR'], name)
+
+
+def remove_upload(params):
+    path = upload_path(params['upload'])
+    if os.path.exists(path):
+        os.remove(path)
+
+
+@job_runner.kind('import', cleanup=remove_upload)
+def import_job(job, params, progress):
+    """
+    import_transactions() over an upload saved by POST /api/jobs/import.
+    Progress is the share of the file read so far. The file is removed
+    when the job ends, whatever the outcome.
+    """
+    path = upload_path(params['upload'])
+    try:
+        size = os.path.getsize(path) or 1
+        with open(path, 'rb') as stream:
+            result = import_transactions(
+                job.user_id, stream, params['format'], params.get('category_id'),
+                on_batch=lambda: progress(stream.tell() / size)
+            )
+        ResourceVersion.bump(job.user_id, 'transactions')
+        db.session.commit()
+    finally:
+        remove_upload(params)
+    return result
+
+
+@job_runner.kind('rollup_rebuild')
+def rollup_rebuild_job(job, params, progress):
+    # Recomputes the user's monthly rollup from their transactions
+    MonthlyCategoryTotal.rebuild(job.user_id)
+    ResourceVersion.bump(job.user_id, 'transactions')
+    db.session.commit()
+    return {'rows': MonthlyCategoryTotal.query.filter(MonthlyCategoryTotal.user_id == job.user_id).count()}
+
+
+def parse_annual_report(params):
+    try:
+        year = int(params.get('year', date.today().year))
+    except (TypeError, ValueError):
+        raise ValueError('year must be a number')
+    if not (1900 <= year <= 9999):
+        raise ValueError('year must be between 1900 and 9999')
+    return {'year': year}
+
+
+@job_runner.kind('annual_report', parse=parse_annual_report)
+def annual_report_job(job, params, progress):
+    """
+    A year's income, expense and balance, in total and per month, each
+    category's totals and share of its type, and the largest expenses.
+    Totals come from the monthly rollup; only the largest expenses read
+    transactions, through the (user_id, amount) index.
+    """
+    year = params['year']
+    rows = db.session.query(
+        MonthlyCategoryTotal.month,
+        MonthlyCategoryTotal.category_id,
+        MonthlyCategoryTotal.type,
+        MonthlyCategoryTotal.total,
+        MonthlyCategoryTotal.count
+    ).filter(
+        MonthlyCategoryTotal.user_id == job.user_id,
+        MonthlyCategoryTotal.year == year
+    ).all()
+    progress(0.4)
+
+    names = dict(db.session.query(Category.id, Category.name).filter(Category.user_id == job.user_id))
+    months = [{'month': month, 'income': 0.0, 'expense': 0.0} for month in range(1, 13)]
+    categories = {}
+    totals = {'income': 0.0, 'expense': 0.0}
+    for month, category_id, type, total, count in rows:
+        total = float(total)
+        months[month - 1][type] += total
+        totals[type] += total
+        category = categories.setdefault((category_id, type), {
+            'category_id': category_id,
+            'name': names.get(category_id),
+            'type': type,
+            'total': 0.0,
+            'count': 0
+        })
+        category['total'] += total
+        category['count'] += count
+
+    for summary in months:
+        summary['balance'] = summary['income'] - summary['expense']
+    totals['balance'] = totals['income'] - totals['expense']
+    for category in categories.values():
+        category['share'] = category['total'] / totals[category['type']] if totals[category['type']] else 0.0
+    progress(0.7)
+
+    largest = Transaction.query.filter(
+        Transaction.user_id == job.user_id,
+        Transaction.type == 'expense',
+        Transaction.transaction_date >= date(year, 1, 1),
+        Transaction.transaction_date <= date(year, 12, 31)
+    ).order_by(Transaction.amount.desc(), Transaction.id.desc()).limit(ANNUAL_REPORT_LARGEST_EXPENSES).all()
+
+    return {
+        'year': year,
+        'totals': totals,
+        'months': months,
+        'categories': sorted(categories.values(), key=lambda category: (category['type'], -category['total'])),
+        'largest_expenses': [transaction.to_dict() for transaction in largest]
+    }
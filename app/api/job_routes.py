@@ -0,0 +1,108 @@
+from flask import Blueprint, current_app, jsonify, request
+from flask_login import current_user, login_required
+from app.models import Job
+from app.api.job_kinds import UPLOAD_KINDS, upload_path
+from app.api.transaction_import import detect_format
+from app.jobs import job_runner
+import os
+import uuid
+
+job_routes = Blueprint('jobs', __name__)
+
+JOB_LIST_LIMIT = 50
+
+
+def user_job(id):
+    # The job with this id, or the error response if it isn't the user's
+    job = Job.query.get(id)
+    if not job:
+        return None, (jsonify({'error': 'Job not found'}), 404)
+    if job.user_id != current_user.id:
+        return None, (jsonify({'error': 'Unauthorized'}), 403)
+    return job, None
+
+# Get the current user's most recent jobs
+@job_routes.route('', methods=['GET'])
+@login_required
+def get_jobs():
+    jobs = Job.query.filter(Job.user_id == current_user.id).order_by(
+        Job.created_at.desc(), Job.id.desc()
+    ).limit(JOB_LIST_LIMIT).all()
+    return jsonify({'jobs': [job_runner.job_dict(job) for job in jobs]})
+
+# Start a background job
+@job_routes.route('', methods=['POST'])
+@login_required
+def create_job():
+    """
+    Enqueues {"kind": ..., "params": {...}} and answers 202 straight away;
+    poll GET /api/jobs/<id> for status and progress
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Body must be a JSON object'}), 400
+    kind = data.get('kind')
+    if not isinstance(kind, str):
+        return jsonify({'error': 'kind must be a string'}), 400
+    if kind in UPLOAD_KINDS:
+        return jsonify({'error': f'Use /api/jobs/{kind} to upload a file'}), 400
+    try:
+        params = job_runner.parse(kind, data.get('params', {}))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    job = job_runner.enqueue(current_user.id, kind, params)
+    return jsonify(job_runner.job_dict(job)), 202
+
+# Import transactions from an uploaded file in the background
+@job_routes.route('/import', methods=['POST'])
+@login_required
+def create_import_job():
+    """
+    Takes the same upload and query string as POST /api/transactions/import
+    but only stores the file before answering 202; the import job's result
+    is what that endpoint would have returned
+    """
+    upload = request.files.get('file')
+    if not upload:
+        return jsonify({'error': 'A file is required'}), 400
+
+    try:
+        format = detect_format(upload.filename, request.args.get('format'))
+        category_id = int(request.args['category_id']) if request.args.get('category_id') else None
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    os.makedirs(current_app.config['JOB_UPLOAD_DIR'], exist_ok=True)
+    name = uuid.uuid4().hex
+    upload.save(upload_path(name))
+
+    job = job_runner.enqueue(current_user.id, 'import', {
+        'upload': name,
+        'filename': upload.filename,
+        'format': format,
+        'category_id': category_id
+    })
+    return jsonify(job_runner.job_dict(job)), 202
+
+# Get a job's status and progress
+@job_routes.route('/<int:id>', methods=['GET'])
+@login_required
+def get_job(id):
+    job, error = user_job(id)
+    if error:
+        return error
+    return jsonify(job_runner.job_dict(job))
+
+# Get the result of a finished job
+@job_routes.route('/<int:id>/result', methods=['GET'])
+@login_required
+def get_job_result(id):
+    job, error = user_job(id)
+    if error:
+        return error
+    if job.status == 'failed':
+        return jsonify({'error': job.error or 'Job failed'}), 409
+    if not job.finished:
+        return jsonify({'error': 'Job has not finished', 'status': job.status}), 409
+    return jsonify(job.result)
@@ -0,0 +1,42 @@
+from flask import Blueprint, current_app, jsonify, request
+from app.models import db
+from app.cache import response_cache
+from app.pool import pool_stats
+import hmac
+
+ops_routes = Blueprint('ops', __name__)
+
+
+@ops_routes.before_request
+def require_ops_token():
+    """
+    The ops endpoints answer to 'Authorization: Bearer <OPS_TOKEN>' rather
+    than a user session, so monitoring can scrape them and users can't;
+    without an OPS_TOKEN they are not served at all
+    """
+    token = current_app.config['OPS_TOKEN']
+    if not token:
+        return jsonify({'error': 'Not found'}), 404
+    scheme, _, given = request.headers.get('Authorization', '').partition(' ')
+    if scheme.lower() != 'bearer' or not hmac.compare_digest(given.encode(), token.encode()):
+        return jsonify({'error': 'Unauthorized'}), 403
+
+
+# Get hit/miss counters of this worker's response cache
+@ops_routes.route('/cache', methods=['GET'])
+def cache_stats():
+    """
+    Returns the response cache backend, entry count and hit/miss counters
+    of the worker serving the request
+    """
+    return jsonify(response_cache.stats())
+
+
+# Get connection pool occupancy and checkout wait times of this worker
+@ops_routes.route('/pool', methods=['GET'])
+def connection_pool_stats():
+    """
+    Returns the connection pool's size, connections in use, overflow and
+    checkout wait times in the worker serving the request
+    """
+    return jsonify(pool_stats(db.engine))
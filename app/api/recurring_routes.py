@@ -0,0 +1,227 @@
+from flask import Blueprint, jsonify, request
+from flask_login import current_user, login_required
+from app.models import db, Category, RecurringCandidate, RecurringRule, ResourceVersion
+from app.models.recurring_rule import CADENCES
+from app.models.transaction import MAX_AMOUNT
+from app.recurring import detect_users
+from datetime import date, timedelta
+from decimal import Decimal, InvalidOperation
+
+recurring_routes = Blueprint('recurring', __name__)
+
+RULE_FIELDS = ['category_id', 'amount', 'description', 'type', 'cadence', 'start_date']
+MAX_DESCRIPTION_LENGTH = RecurringRule.description.type.length
+# How far back a rule may start; every occurrence since is created by the
+# next materialize run
+MAX_BACKFILL_DAYS = 366
+
+
+def parse_min_confidence(args):
+    try:
+        min_confidence = float(args.get('min_confidence', 0))
+    except ValueError:
+        raise ValueError('min_confidence must be a number')
+    if not (0 <= min_confidence <= 1):
+        raise ValueError('min_confidence must be between 0 and 1')
+    return min_confidence
+
+
+def parse_rule(data, rule=None):
+    """
+    Validates the fields of a recurring rule given in data, all of them
+    required unless an existing rule is being updated. Returns the parsed
+    values; raises ValueError.
+    """
+    if not isinstance(data, dict):
+        raise ValueError('Body must be a JSON object')
+    if rule is None:
+        missing_fields = [field for field in RULE_FIELDS if field not in data]
+        if missing_fields:
+            raise ValueError(f'Missing required fields: {", ".join(missing_fields)}')
+
+    values = {}
+    if 'category_id' in data:
+        category_id = data['category_id']
+        is_id = isinstance(category_id, int) and not isinstance(category_id, bool)
+        category = Category.query.get(category_id) if is_id else None
+        if not category or category.user_id != current_user.id:
+            raise ValueError('Invalid category')
+        values['category_id'] = category.id
+    if 'amount' in data:
+        if isinstance(data['amount'], bool):
+            raise ValueError('Amount must be a number')
+        try:
+            values['amount'] = Decimal(str(data['amount']))
+        except InvalidOperation:
+            raise ValueError('Amount must be a number')
+        if not values['amount'].is_finite():
+            raise ValueError('Amount must be a number')
+        if values['amount'] <= 0:
+            raise ValueError('Amount must be greater than 0')
+        if values['amount'] > MAX_AMOUNT:
+            raise ValueError(f'Amount must be at most {MAX_AMOUNT:,}')
+    if 'description' in data:
+        description = data['description']
+        if not isinstance(description, str) or not description.strip():
+            raise ValueError('Description is required')
+        if len(description) > MAX_DESCRIPTION_LENGTH:
+            raise ValueError(f'Description must be at most {MAX_DESCRIPTION_LENGTH} characters')
+        values['description'] = description
+    if 'type' in data:
+        if data['type'] not in ['income', 'expense']:
+            raise ValueError('Type must be either "income" or "expense"')
+        values['type'] = data['type']
+    if 'cadence' in data:
+        if data['cadence'] not in CADENCES:
+            raise ValueError(f'Cadence must be one of: {", ".join(CADENCES)}')
+        values['cadence'] = data['cadence']
+    for field in ('start_date', 'end_date'):
+        if field in data:
+            try:
+                values[field] = date.fromisoformat(data[field]) if data[field] else None
+            except (TypeError, ValueError):
+                raise ValueError('Invalid date format. Use YYYY-MM-DD')
+    if 'start_date' in values and values['start_date'] is None:
+        raise ValueError('Start date is required')
+    if values.get('start_date') and values['start_date'] < date.today() - timedelta(days=MAX_BACKFILL_DAYS):
+        raise ValueError(f'Start date must be within the last {MAX_BACKFILL_DAYS} days')
+
+    start_date = values.get('start_date', rule.start_date if rule else None)
+    end_date = values.get('end_date', rule.end_date if rule else None)
+    if end_date and end_date < start_date:
+        raise ValueError('End date must be on or after the start date')
+    return values
+
+
+def user_candidates(min_confidence=0):
+    candidates = RecurringCandidate.query.filter(
+        RecurringCandidate.user_id == current_user.id,
+        RecurringCandidate.confidence >= min_confidence
+    ).order_by(RecurringCandidate.confidence.desc(), RecurringCandidate.id).all()
+    return [candidate.to_dict() for candidate in candidates]
+
+# Get the current user's likely recurring transactions
+@recurring_routes.route('/candidates', methods=['GET'])
+@login_required
+def get_candidates():
+    """
+    Recurring series found by the last detection run (nightly via `flask
+    recurring detect`, or on demand), most confident first, optionally
+    limited to ?min_confidence= (0-1)
+    """
+    try:
+        min_confidence = parse_min_confidence(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    return jsonify(user_candidates(min_confidence))
+
+# Re-run recurring detection over the current user's transactions now
+@recurring_routes.route('/candidates/detect', methods=['POST'])
+@login_required
+def detect_candidates():
+    detect_users([current_user.id])
+    db.session.commit()
+    return jsonify(user_candidates())
+
+# Get all recurring rules for current user
+@recurring_routes.route('/rules', methods=['GET'])
+@login_required
+def get_rules():
+    rules = RecurringRule.query.filter(
+        RecurringRule.user_id == current_user.id
+    ).order_by(RecurringRule.next_date, RecurringRule.id).all()
+    return jsonify([rule.to_dict() for rule in rules])
+
+# Get a specific recurring rule
+@recurring_routes.route('/rules/<int:id>', methods=['GET'])
+@login_required
+def get_rule(id):
+    rule = RecurringRule.query.get(id)
+
+    if not rule:
+        return jsonify({'error': 'Recurring rule not found'}), 404
+
+    if rule.user_id != current_user.id:
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    return jsonify(rule.to_dict())
+
+# Create a new recurring rule
+@recurring_routes.route('/rules', methods=['POST'])
+@login_required
+def create_rule():
+    """
+    Occurrences from start_date on are created as transactions by the next
+    `flask recurring materialize` run (or the scheduler), including any
+    that are already due
+    """
+    try:
+        values = parse_rule(request.json)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    rule = RecurringRule(user_id=current_user.id, next_date=values['start_date'], **values)
+    db.session.add(rule)
+    db.session.commit()
+
+    return jsonify(rule.to_dict()), 201
+
+# Update a recurring rule
+@recurring_routes.route('/rules/<int:id>', methods=['PUT'])
+@login_required
+def update_rule(id):
+    """
+    Changes apply to occurrences that have not been created yet; existing
+    transactions are left as they are
+    """
+    rule = RecurringRule.query.get(id)
+
+    if not rule:
+        return jsonify({'error': 'Recurring rule not found'}), 404
+
+    if rule.user_id != current_user.id:
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    try:
+        values = parse_rule(request.json, rule)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    # Occurrences before next_date have been created already; a new
+    # schedule carries on from there
+    materialized = rule.next_date > rule.start_date
+    created_before = rule.next_date
+    for field, value in values.items():
+        setattr(rule, field, value)
+    if 'cadence' in values or 'start_date' in values:
+        if materialized:
+            rule.next_date = rule.following(created_before - timedelta(days=1))
+        else:
+            rule.next_date = rule.start_date
+    db.session.commit()
+
+    return jsonify(rule.to_dict())
+
+# Delete a recurring rule
+@recurring_routes.route('/rules/<int:id>', methods=['DELETE'])
+@login_required
+def delete_rule(id):
+    """
+    Stops future occurrences; transactions already created are kept and
+    no longer linked to the rule
+    """
+    rule = RecurringRule.query.get(id)
+
+    if not rule:
+        return jsonify({'error': 'Recurring rule not found'}), 404
+
+    if rule.user_id != current_user.id:
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    db.session.delete(rule)
+    # Its transactions lose their recurring_rule_id
+    ResourceVersion.bump(current_user.id, 'transactions')
+    db.session.commit()
+
+    return jsonify({'message': 'Recurring rule successfully deleted'})
@@ -0,0 +1,74 @@
+from flask import Blueprint, jsonify, request
+from flask_login import current_user, login_required
+from app.models import MonthlyCategoryTotal
+from app.api.conditional import conditional_get
+
+report_routes = Blueprint('reports', __name__)
+
+
+def parse_month(value, name):
+    # Months are given as YYYY-MM and returned as (year, month)
+    try:
+        year, month = (int(part) for part in value.split('-'))
+    except ValueError:
+        raise ValueError(f'{name} must be a month in YYYY-MM format')
+    if not (1 <= month <= 12):
+        raise ValueError(f'{name} must be a month in YYYY-MM format')
+    return year, month
+
+
+# Get income, expense and per-category totals for each month
+@report_routes.route('/monthly', methods=['GET'])
+@login_required
+@conditional_get('transactions')
+def monthly_report():
+    """
+    Totals per month, per type and per category, optionally limited to
+    the months between ?start=YYYY-MM and ?end=YYYY-MM inclusive
+    """
+    # The rollup already holds one pre-summed row per (month, category,
+    # type), so the report never touches the transactions table
+    year = MonthlyCategoryTotal.year
+    month = MonthlyCategoryTotal.month
+
+    query = MonthlyCategoryTotal.query.filter(MonthlyCategoryTotal.user_id == current_user.id)
+
+    try:
+        if request.args.get('start'):
+            start_year, start_month = parse_month(request.args['start'], 'start')
+            query = query.filter(year * 100 + month >= start_year * 100 + start_month)
+        if request.args.get('end'):
+            end_year, end_month = parse_month(request.args['end'], 'end')
+            query = query.filter(year * 100 + month <= end_year * 100 + end_month)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    rows = query.order_by(year, month, MonthlyCategoryTotal.category_id).all()
+
+    categories = []
+    months = {}
+    totals = {'income': 0.0, 'expense': 0.0}
+    for row in rows:
+        key = (int(row.year), int(row.month))
+        total = float(row.total)
+        categories.append({
+            'year': key[0],
+            'month': key[1],
+            'category_id': row.category_id,
+            'type': row.type,
+            'total': total,
+            'count': row.count
+        })
+        summary = months.setdefault(key, {'year': key[0], 'month': key[1], 'income': 0.0, 'expense': 0.0})
+        summary[row.type] += total
+        totals[row.type] += total
+
+    for summary in months.values():
+        summary['balance'] = summary['income'] - summary['expense']
+    totals['balance'] = totals['income'] - totals['expense']
+
+    return jsonify({
+        'months': list(months.values()),
+        'categories': categories,
+        'totals': totals
+    })
@@ -0,0 +1,134 @@
+from app.models import db, Category, MonthlyCategoryTotal
+from datetime import date, timedelta
+import numpy as np
+
+DEFAULT_LOOKBACK_MONTHS = 6
+MAX_LOOKBACK_MONTHS = 36
+SAVINGS_CATEGORY = 'savings'
+DAYS_PER_MONTH = 365.25 / 12
+
+
+def parse_lookback(args):
+    try:
+        months = int(args.get('months', DEFAULT_LOOKBACK_MONTHS))
+    except ValueError:
+        raise ValueError('Months must be an integer')
+    if not (1 <= months <= MAX_LOOKBACK_MONTHS):
+        raise ValueError(f'Months must be between 1 and {MAX_LOOKBACK_MONTHS}')
+    return months
+
+
+def trailing_months(today, count):
+    # The last `count` (year, month) pairs, oldest first, ending with today's
+    index = today.year * 12 + today.month - 1
+    return [(n // 12, n % 12 + 1) for n in range(index - count + 1, index + 1)]
+
+
+def savings_history(user_id, months, today):
+    """
+    Net amount moved into the user's Savings categories in each of the last
+    `months` months (this one included): expenses booked to the category
+    count as contributions, income booked to it as withdrawals. Read from
+    the monthly rollup, so this is one small query however long the ledger.
+    """
+    window = trailing_months(today, months)
+    first_year, first_month = window[0]
+
+    year = MonthlyCategoryTotal.year
+    month = MonthlyCategoryTotal.month
+    rows = db.session.query(
+        year, month, MonthlyCategoryTotal.type, db.func.sum(MonthlyCategoryTotal.total)
+    ).join(Category, Category.id == MonthlyCategoryTotal.category_id).filter(
+        MonthlyCategoryTotal.user_id == user_id,
+        db.func.lower(Category.name) == SAVINGS_CATEGORY,
+        year * 100 + month >= first_year * 100 + first_month
+    ).group_by(year, month, MonthlyCategoryTotal.type).all()
+
+    totals = dict.fromkeys(window, 0.0)
+    for row_year, row_month, type, total in rows:
+        if (row_year, row_month) in totals:
+            totals[(row_year, row_month)] += float(total) if type == 'expense' else -float(total)
+    return [{'year': y, 'month': m, 'total': round(total, 2)} for (y, m), total in totals.items()]
+
+
+def project_goals(goals, monthly_rate, today):
+    """
+    Projects every goal at once. The monthly contribution rate is split
+    between unfinished goals in proportion to what each still needs, so the
+    goals finish together at the current pace. Returns one dict per goal
+    with the allocated contribution, the projected completion date (None
+    when nothing is going in, or it falls past date.max) and, for goals
+    with a target date, the monthly amount needed to meet it.
+    """
+    if not goals:
+        return []
+
+    target = np.array([goal['target_amount'] for goal in goals], dtype=float)
+    current = np.array([goal['current_amount'] for goal in goals], dtype=float)
+    has_target_date = np.array([goal['target_date'] is not None for goal in goals])
+    days_to_target = np.array([
+        (goal['target_date'] - today).days if goal['target_date'] is not None else 0
+        for goal in goals
+    ], dtype=float)
+
+    remaining = np.maximum(target - current, 0)
+    total_remaining = remaining.sum()
+    share = remaining / total_remaining if total_remaining > 0 else np.zeros_like(remaining)
+    contribution = max(monthly_rate, 0) * share
+
+    # Months until done at the allocated pace; inf when nothing is going in
+    months_to_complete = np.divide(
+        remaining, contribution, out=np.full_like(remaining, np.inf), where=contribution > 0
+    )
+    months_to_complete[remaining == 0] = 0
+
+    # Amount per month needed to finish by the target date; a date that has
+    # passed (or is this month) needs everything that is left right away
+    months_to_target = np.maximum(days_to_target / DAYS_PER_MONTH, 0)
+    required_monthly = np.divide(
+        remaining, months_to_target, out=remaining.copy(), where=months_to_target >= 1
+    )
+    # A finished goal is on track whatever its target date
+    on_track = (remaining == 0) | (months_to_complete * DAYS_PER_MONTH <= days_to_target)
+
+    # Days until done, where the date is representable; a trickle of
+    # contributions against a large balance can project past date.max
+    days_to_complete = np.ceil(months_to_complete * DAYS_PER_MONTH)
+    reachable = days_to_complete <= (date.max - today).days
+
+    projections = []
+    for n, goal in enumerate(goals):
+        finite = np.isfinite(months_to_complete[n])
+        projections.append({
+            'goal_id': goal['id'],
+            'name': goal['name'],
+            'target_amount': float(target[n]),
+            'current_amount': float(current[n]),
+            'remaining': round(float(remaining[n]), 2),
+            'target_date': goal['target_date'].isoformat() if has_target_date[n] else None,
+            'monthly_contribution': round(float(contribution[n]), 2),
+            'months_to_complete': round(float(months_to_complete[n]), 1) if finite else None,
+            'projected_completion_date': (
+                (today + timedelta(days=int(days_to_complete[n]))).isoformat() if reachable[n] else None
+            ),
+            'required_monthly': round(float(required_monthly[n]), 2) if has_target_date[n] else None,
+            'on_track': bool(on_track[n]) if has_target_date[n] else None
+        })
+    return projections
+
+
+def savings_projections(user_id, goals, months=DEFAULT_LOOKBACK_MONTHS, today=None):
+    """
+    Contribution history, the average monthly contribution over it and the
+    projection of each of the given goals (dicts as returned by
+    serialize_savings_goals, with target_date as a date)
+    """
+    today = today or date.today()
+    history = savings_history(user_id, months, today)
+    monthly_rate = sum(month['total'] for month in history) / months
+    return {
+        'lookback_months': months,
+        'monthly_contribution_rate': round(monthly_rate, 2),
+        'history': history,
+        'projections': project_goals(goals, monthly_rate, today)
+    }
@@ -1,6 +1,9 @@
 from flask import Blueprint, jsonify, request
 from flask_login import current_user, login_required
-from app.models import db, SavingsGoal
+from app.models import db, SavingsGoal, ResourceVersion
+from app.api.conditional import conditional_get
+from app.api.serializers import fetch, savings_goal_query, serialize_savings_goals, json_response
+from app.api.savings_projection import savings_projections, parse_lookback
 from datetime import datetime
 
 savings_routes = Blueprint('savings', __name__)
@@ -8,9 +11,50 @@ savings_routes = Blueprint('savings', __name__)
 # Get all savings goals for current user
 @savings_routes.route('', methods=['GET'])
 @login_required
+@conditional_get('savings', cache=True)
 def get_savings_goals():
-    goals = SavingsGoal.query.filter(SavingsGoal.user_id == current_user.id).all()
-    return jsonify([goal.to_dict() for goal in goals])
+    rows = fetch(savings_goal_query().filter(SavingsGoal.user_id == current_user.id))
+    return json_response(serialize_savings_goals(rows))
+
+# Get completion projections for all of the current user's savings goals
+@savings_routes.route('/projections', methods=['GET'])
+@login_required
+def get_savings_projections():
+    """
+    Projects every savings goal from the average monthly amount moved into
+    the user's Savings category over the last ?months= months (default 6)
+    """
+    try:
+        months = parse_lookback(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    goals = serialize_savings_goals(fetch(savings_goal_query().filter(SavingsGoal.user_id == current_user.id)))
+    return json_response(savings_projections(current_user.id, goals, months))
+
+# Get the completion projection for a specific savings goal
+@savings_routes.route('/<int:id>/projection', methods=['GET'])
+@login_required
+def get_savings_projection(id):
+    """
+    Projects one savings goal; the contribution rate is shared between all
+    of the user's goals as in /projections
+    """
+    try:
+        months = parse_lookback(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    goal = SavingsGoal.query.get(id)
+    if not goal:
+        return jsonify({'error': 'Savings goal not found'}), 404
+    if goal.user_id != current_user.id:
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    goals = serialize_savings_goals(fetch(savings_goal_query().filter(SavingsGoal.user_id == current_user.id)))
+    result = savings_projections(current_user.id, goals, months)
+    projection = next(projection for projection in result.pop('projections') if projection['goal_id'] == id)
+    return json_response({**result, 'projection': projection})
 
 # Get a specific savings goal
 @savings_routes.route('/<int:id>', methods=['GET'])
@@ -56,6 +100,7 @@ def create_savings_goal():
             return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
     
     db.session.add(new_goal)
+    ResourceVersion.bump(current_user.id, 'savings')
     db.session.commit()
     
     return jsonify(new_goal.to_dict()), 201
@@ -97,6 +142,7 @@ def update_savings_goal(id):
             goal.target_date = None
     
     goal.updated_at = datetime.utcnow()
+    ResourceVersion.bump(current_user.id, 'savings')
     db.session.commit()
     
     return jsonify(goal.to_dict())
@@ -114,6 +160,7 @@ def delete_savings_goal(id):
         return jsonify({'error': 'Unauthorized'}), 403
     
     db.session.delete(goal)
+    ResourceVersion.bump(current_user.id, 'savings')
     db.session.commit()
     
     return jsonify({'message': 'Savings goal successfully deleted'})
\ No newline at end of file
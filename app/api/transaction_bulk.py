@@ -0,0 +1,196 @@
+from app.models import db, Transaction, Category, MonthlyCategoryTotal
+from app.models.transaction import MAX_AMOUNT
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+
+MAX_BULK_OPERATIONS = 1000
+BULK_OPS = ('create', 'update', 'delete')
+TRANSACTION_FIELDS = ['category_id', 'amount', 'description', 'type', 'transaction_date']
+MAX_DESCRIPTION_LENGTH = Transaction.description.type.length
+
+
+def is_id(value):
+    # JSON true/false decode to bools, which are ints to isinstance()
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def parse_amount(value):
+    # A transaction amount from JSON as a Decimal the column can hold;
+    # raises ValueError
+    if isinstance(value, bool):
+        raise ValueError('Amount must be a number')
+    try:
+        amount = Decimal(str(value))
+    except InvalidOperation:
+        raise ValueError('Amount must be a number')
+    if not amount.is_finite():
+        raise ValueError('Amount must be a number')
+    if amount <= 0:
+        raise ValueError('Amount must be greater than 0')
+    if amount > MAX_AMOUNT:
+        raise ValueError(f'Amount must be at most {MAX_AMOUNT:,}')
+    return amount
+
+
+def validate_fields(data, category_ids, partial):
+    """
+    Validates transaction fields for a create (partial=False) or an update
+    (partial=True) and returns the cleaned values. Raises ValueError.
+    """
+    if not isinstance(data, dict):
+        raise ValueError('data must be an object')
+
+    if not partial:
+        missing_fields = [field for field in TRANSACTION_FIELDS if field not in data]
+        if missing_fields:
+            raise ValueError(f'Missing required fields: {", ".join(missing_fields)}')
+
+    values = {}
+    if 'category_id' in data:
+        if not is_id(data['category_id']) or data['category_id'] not in category_ids:
+            raise ValueError('Invalid category')
+        values['category_id'] = data['category_id']
+
+    if 'amount' in data:
+        values['amount'] = parse_amount(data['amount'])
+
+    if 'description' in data:
+        description = data['description']
+        if not isinstance(description, str) or not description.strip():
+            raise ValueError('Description is required')
+        if len(description) > MAX_DESCRIPTION_LENGTH:
+            raise ValueError(f'Description must be at most {MAX_DESCRIPTION_LENGTH} characters')
+        values['description'] = description
+
+    if 'type' in data:
+        if data['type'] not in ['income', 'expense']:
+            raise ValueError('Type must be either "income" or "expense"')
+        values['type'] = data['type']
+
+    if 'transaction_date' in data:
+        try:
+            values['transaction_date'] = date.fromisoformat(data['transaction_date'])
+        except (TypeError, ValueError):
+            raise ValueError('Invalid date format. Use YYYY-MM-DD')
+
+    if partial and not values:
+        raise ValueError('Nothing to update')
+
+    return values
+
+
+def apply_bulk_operations(user_id, operations):
+    """
+    Validates a list of create/update/delete operations against the user's
+    transactions and, if every one is valid, applies them with batched
+    inserts and set-based UPDATE/DELETE statements scoped to the user.
+    Returns (ok, results) with one result per operation. Does not commit.
+    """
+    # Load everything needed to validate the whole batch up front: the
+    # user's category ids and the current state of every targeted row
+    category_ids = {id for id, in db.session.query(Category.id).filter(Category.user_id == user_id)}
+    target_ids = [op.get('id') for op in operations if isinstance(op, dict) and op.get('op') in ('update', 'delete')]
+    existing = {
+        row.id: row for row in db.session.query(
+            Transaction.id,
+            Transaction.category_id,
+            Transaction.amount,
+            Transaction.type,
+            Transaction.transaction_date
+        ).filter(
+            Transaction.user_id == user_id,
+            Transaction.id.in_([id for id in target_ids if is_id(id)])
+        )
+    }
+
+    results = []
+    creates = []
+    updates = {}
+    deletes = []
+    seen_ids = set()
+    ok = True
+
+    for index, op in enumerate(operations):
+        result = {'index': index, 'op': op.get('op') if isinstance(op, dict) else None}
+        results.append(result)
+        try:
+            if not isinstance(op, dict) or op.get('op') not in BULK_OPS:
+                raise ValueError(f'op must be one of: {", ".join(BULK_OPS)}')
+
+            if op['op'] == 'create':
+                creates.append((result, validate_fields(op.get('data'), category_ids, partial=False)))
+                continue
+
+            id = op.get('id')
+            result['id'] = id
+            if not is_id(id) or id not in existing:
+                raise ValueError('Transaction not found')
+            if id in seen_ids:
+                raise ValueError('Transaction appears in more than one operation')
+            seen_ids.add(id)
+
+            if op['op'] == 'update':
+                values = validate_fields(op.get('data'), category_ids, partial=True)
+                # Updates that set the same values share one UPDATE statement
+                key = tuple(sorted(values.items()))
+                updates.setdefault(key, []).append(id)
+            else:
+                deletes.append(id)
+        except ValueError as e:
+            ok = False
+            result['status'] = 'error'
+            result['error'] = str(e)
+
+    if not ok:
+        for result in results:
+            result.setdefault('status', 'skipped')
+        return False, results
+
+    rollup_deltas = {}
+    table = Transaction.__table__
+
+    if creates:
+        transactions = [Transaction(user_id=user_id, **values) for _, values in creates]
+        db.session.add_all(transactions)
+        db.session.flush()
+        for (result, _), transaction in zip(creates, transactions):
+            result['id'] = transaction.id
+            MonthlyCategoryTotal.add_transaction_delta(rollup_deltas, transaction)
+
+    now = datetime.utcnow()
+    for key, ids in updates.items():
+        values = dict(key)
+        db.session.execute(
+            table.update()
+            .where(table.c.user_id == user_id, table.c.id.in_(ids))
+            .values(updated_at=now, **values)
+        )
+        for id in ids:
+            old = existing[id]
+            MonthlyCategoryTotal.add_delta(
+                rollup_deltas, user_id, old.category_id, old.transaction_date, old.type, old.amount, -1
+            )
+            MonthlyCategoryTotal.add_delta(
+                rollup_deltas, user_id,
+                values.get('category_id', old.category_id),
+                values.get('transaction_date', old.transaction_date),
+                values.get('type', old.type),
+                values.get('amount', old.amount)
+            )
+
+    if deletes:
+        db.session.execute(
+            table.delete().where(table.c.user_id == user_id, table.c.id.in_(deletes))
+        )
+        for id in deletes:
+            old = existing[id]
+            MonthlyCategoryTotal.add_delta(
+                rollup_deltas, user_id, old.category_id, old.transaction_date, old.type, old.amount, -1
+            )
+
+    MonthlyCategoryTotal.apply_deltas(rollup_deltas)
+
+    statuses = {'create': 'created', 'update': 'updated', 'delete': 'deleted'}
+    for result in results:
+        result['status'] = statuses[result['op']]
+    return True, results
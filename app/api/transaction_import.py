@@ -0,0 +1,211 @@
+from app.models import db, Transaction, Category, MonthlyCategoryTotal
+from app.models.transaction import MAX_AMOUNT
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+import codecs
+import csv
+import re
+
+IMPORT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+IMPORT_FORMATS = ('csv', 'ofx')
+
+
+def detect_format(filename, requested=None):
+    if requested:
+        if requested not in IMPORT_FORMATS:
+            raise ValueError(f'Format must be one of: {", ".join(IMPORT_FORMATS)}')
+        return requested
+    extension = (filename or '').rsplit('.', 1)[-1].lower()
+    if extension in ('ofx', 'qfx'):
+        return 'ofx'
+    return 'csv'
+
+
+def read_csv(stream):
+    """
+    Yields one dict per CSV row. Expects a header row with
+    transaction_date (or date), description, amount and optionally type,
+    category_id and category (matched by name).
+    """
+    # Decode lazily line by line so the upload is never read into memory
+    lines = codecs.iterdecode(stream, 'utf-8-sig')
+    for row in csv.DictReader(lines):
+        yield {
+            'transaction_date': row.get('transaction_date') or row.get('date'),
+            'description': row.get('description'),
+            'amount': row.get('amount'),
+            'type': row.get('type'),
+            'category_id': row.get('category_id'),
+            'category': row.get('category')
+        }
+
+
+OFX_TAG = re.compile(r'<(/?)([A-Za-z0-9.]+)>([^<]*)')
+
+
+def read_ofx(stream, chunk_size=64 * 1024):
+    """
+    Yields one dict per <STMTTRN> of an OFX/QFX statement. Handles both the
+    SGML flavour (unclosed leaf tags) and the XML one, reading in chunks.
+    """
+    decoder = codecs.getincrementaldecoder('latin-1')()
+    buffer = ''
+    current = None
+    while True:
+        chunk = stream.read(chunk_size)
+        buffer += decoder.decode(chunk, final=not chunk)
+        # Keep any trailing partial tag for the next chunk
+        cut = len(buffer) if not chunk else max(buffer.rfind('<'), 0)
+        for closing, tag, value in OFX_TAG.findall(buffer[:cut]):
+            tag = tag.upper()
+            if tag == 'STMTTRN':
+                if closing and current is not None:
+                    yield {
+                        'transaction_date': current.get('DTPOSTED', '')[:8],
+                        'description': current.get('NAME') or current.get('MEMO'),
+                        'amount': current.get('TRNAMT'),
+                        'type': None,
+                        'category_id': None,
+                        'category': None
+                    }
+                    current = None
+                elif not closing:
+                    current = {}
+            elif current is not None and not closing:
+                current[tag] = value.strip()
+        buffer = buffer[cut:]
+        if not chunk:
+            break
+
+
+def numbered_rows(reader, start):
+    """
+    Yields (line, row) from a reader. A file that cannot be decoded or
+    parsed at all raises ValueError naming the line it broke at, instead
+    of the reader's own exception.
+    """
+    line = start - 1
+    rows = iter(reader)
+    while True:
+        try:
+            row = next(rows)
+        except StopIteration:
+            return
+        except UnicodeDecodeError:
+            raise ValueError(f'Line {line + 1}: the file must be UTF-8 encoded')
+        except csv.Error as e:
+            raise ValueError(f'Line {line + 1}: {e}')
+        line += 1
+        yield line, row
+
+
+def parse_row(row, categories, default_category_id):
+    """
+    Validates one imported row against the user's categories and returns
+    the values to insert. Raises ValueError with a message on bad input.
+    """
+    raw_date = (row['transaction_date'] or '').strip()
+    try:
+        if len(raw_date) == 8 and raw_date.isdigit():
+            transaction_date = datetime.strptime(raw_date, '%Y%m%d').date()
+        else:
+            transaction_date = date.fromisoformat(raw_date)
+    except ValueError:
+        raise ValueError('Invalid date format. Use YYYY-MM-DD')
+
+    try:
+        amount = Decimal((row['amount'] or '').strip().replace(',', ''))
+    except InvalidOperation:
+        raise ValueError('Amount must be a number')
+    if not amount.is_finite():
+        raise ValueError('Amount must be a number')
+
+    # Without an explicit type, a negative amount is an expense
+    type = (row['type'] or '').strip().lower() or ('expense' if amount < 0 else 'income')
+    if type not in ['income', 'expense']:
+        raise ValueError('Type must be either "income" or "expense"')
+    amount = abs(amount)
+    # One amount too large for the column would fail the whole batch
+    if amount > MAX_AMOUNT:
+        raise ValueError(f'Amount must be at most {MAX_AMOUNT:,}')
+
+    description = (row['description'] or '').strip()
+    if not description:
+        raise ValueError('Description is required')
+
+    category_id = default_category_id
+    if row['category_id']:
+        try:
+            category_id = int(row['category_id'])
+        except ValueError:
+            raise ValueError('Invalid category')
+    elif row['category']:
+        category_id = categories['names'].get(row['category'].strip().lower())
+    if category_id not in categories['ids']:
+        raise ValueError('Invalid category')
+
+    return {
+        'category_id': category_id,
+        'amount': amount,
+        'description': description[:255],
+        'type': type,
+        'transaction_date': transaction_date
+    }
+
+
+def import_transactions(user_id, stream, format, default_category_id=None, on_batch=None):
+    """
+    Streams rows from an uploaded CSV or OFX file into the user's ledger in
+    batched multi-row inserts, keeping the monthly rollup current. Invalid
+    rows are skipped and reported by line number; a file that cannot be
+    read at all raises ValueError, after which the caller must roll back.
+    on_batch, if given, is called after each inserted batch (background
+    jobs report progress from it). Does not commit.
+    """
+    # Load the user's categories once instead of looking one up per row
+    categories = {'ids': set(), 'names': {}}
+    for id, name in db.session.query(Category.id, Category.name).filter(Category.user_id == user_id):
+        categories['ids'].add(id)
+        categories['names'][name.lower()] = id
+
+    reader = read_ofx(stream) if format == 'ofx' else read_csv(stream)
+    insert = Transaction.__table__.insert()
+    rollup_deltas = {}
+    batch = []
+    errors = []
+    imported = 0
+    failed = 0
+
+    def flush():
+        db.session.execute(insert, batch)
+        batch.clear()
+        if on_batch:
+            on_batch()
+
+    # CSV rows are numbered by file line (the header is line 1), OFX rows
+    # by their position among the statement's transactions
+    for line, row in numbered_rows(reader, start=2 if format == 'csv' else 1):
+        try:
+            values = parse_row(row, categories, default_category_id)
+        except ValueError as e:
+            failed += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({'line': line, 'error': str(e)})
+            continue
+
+        values['user_id'] = user_id
+        batch.append(values)
+        MonthlyCategoryTotal.add_delta(
+            rollup_deltas, user_id, values['category_id'], values['transaction_date'],
+            values['type'], values['amount']
+        )
+        imported += 1
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            flush()
+
+    if batch:
+        flush()
+    MonthlyCategoryTotal.apply_deltas(rollup_deltas)
+
+    return {'imported': imported, 'failed': failed, 'errors': errors}
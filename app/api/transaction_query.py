@@ -0,0 +1,153 @@
+from app.models import db, Transaction
+from datetime import date
+from decimal import Decimal, InvalidOperation
+import base64
+import json
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Sort keys clients may ask for, mapped to the column they order by.
+# Every sort is tie-broken on id so the order (and the cursor) is total.
+SORT_COLUMNS = {
+    'transaction_date': Transaction.transaction_date,
+    'amount': Transaction.amount,
+}
+SORT_ORDERS = ('asc', 'desc')
+TRANSACTION_TYPES = ('income', 'expense')
+
+
+def parse_date(value, name):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f'{name} must be a date in YYYY-MM-DD format')
+
+
+def parse_amount(value, name):
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f'{name} must be a number')
+
+
+def parse_category_ids(args):
+    # Accept both ?category_id=1&category_id=2 and ?category_id=1,2
+    ids = []
+    for value in args.getlist('category_id'):
+        for part in value.split(','):
+            if part.strip():
+                try:
+                    ids.append(int(part))
+                except ValueError:
+                    raise ValueError('category_id must be a list of integers')
+    return ids
+
+
+def apply_filters(query, args):
+    """
+    Narrows a transaction query by the date range, category, type and
+    amount range given in the request args. Raises ValueError on bad input.
+    """
+    if args.get('start_date'):
+        query = query.filter(Transaction.transaction_date >= parse_date(args['start_date'], 'start_date'))
+
+    if args.get('end_date'):
+        query = query.filter(Transaction.transaction_date <= parse_date(args['end_date'], 'end_date'))
+
+    category_ids = parse_category_ids(args)
+    if category_ids:
+        query = query.filter(Transaction.category_id.in_(category_ids))
+
+    if args.get('type'):
+        if args['type'] not in TRANSACTION_TYPES:
+            raise ValueError('Type must be either "income" or "expense"')
+        query = query.filter(Transaction.type == args['type'])
+
+    if args.get('min_amount'):
+        query = query.filter(Transaction.amount >= parse_amount(args['min_amount'], 'min_amount'))
+
+    if args.get('max_amount'):
+        query = query.filter(Transaction.amount <= parse_amount(args['max_amount'], 'max_amount'))
+
+    return query
+
+
+def parse_sort(args):
+    sort = args.get('sort', 'transaction_date')
+    if sort not in SORT_COLUMNS:
+        raise ValueError(f'Sort must be one of: {", ".join(SORT_COLUMNS)}')
+
+    order = args.get('order', 'desc')
+    if order not in SORT_ORDERS:
+        raise ValueError('Order must be either "asc" or "desc"')
+
+    return sort, order
+
+
+def parse_limit(args):
+    try:
+        limit = int(args.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise ValueError('Limit must be an integer')
+
+    if not (1 <= limit <= MAX_PAGE_SIZE):
+        raise ValueError(f'Limit must be between 1 and {MAX_PAGE_SIZE}')
+
+    return limit
+
+
+# Cursors are opaque to the client: a urlsafe base64 encoding of the sort
+# it was issued for and the (sort value, id) key of the last row returned
+def encode_cursor(transaction, sort, order):
+    value = getattr(transaction, sort)
+    value = value.isoformat() if sort == 'transaction_date' else str(value)
+    key = [sort, order, value, transaction.id]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def decode_cursor(cursor, sort, order):
+    try:
+        cursor_sort, cursor_order, value, id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if (cursor_sort, cursor_order) != (sort, order):
+            raise ValueError
+        if sort == 'transaction_date':
+            value = date.fromisoformat(value)
+        else:
+            value = Decimal(value)
+        return value, int(id)
+    except (ValueError, TypeError, InvalidOperation):
+        raise ValueError('Invalid cursor')
+
+
+def transaction_page_query(user_id, args, query=None):
+    """
+    Compiles the request args into a single keyset-paginated query for one
+    user's transactions, starting from the given query over the transactions
+    table (Transaction.query by default). Returns the query along with the
+    sort, order and limit it was built for. Raises ValueError on bad input.
+    """
+    sort, order = parse_sort(args)
+    limit = parse_limit(args)
+    column = SORT_COLUMNS[sort]
+
+    if query is None:
+        query = Transaction.query
+    query = apply_filters(query.filter(Transaction.user_id == user_id), args)
+
+    # Seek past the last row of the previous page instead of using OFFSET,
+    # so every page costs the same regardless of how deep it is
+    if args.get('cursor'):
+        value, id = decode_cursor(args['cursor'], sort, order)
+        if order == 'desc':
+            query = query.filter(db.or_(column < value, db.and_(column == value, Transaction.id < id)))
+        else:
+            query = query.filter(db.or_(column > value, db.and_(column == value, Transaction.id > id)))
+
+    if order == 'desc':
+        query = query.order_by(column.desc(), Transaction.id.desc())
+    else:
+        query = query.order_by(column.asc(), Transaction.id.asc())
+
+    # Fetch one extra row to know whether another page exists
+    return query.limit(limit + 1), sort, order, limit
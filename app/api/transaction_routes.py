@@ -1,16 +1,189 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 from flask_login import current_user, login_required
-from app.models import db, Transaction, Category
+from app.models import db, Transaction, Category, MonthlyCategoryTotal, ResourceVersion
+from app.api.conditional import conditional_get
+from app.api.transaction_query import transaction_page_query, encode_cursor, apply_filters
+from app.api.category_routes import categories_by_id
+from app.api.transaction_import import detect_format, import_transactions
+from app.api.transaction_bulk import apply_bulk_operations, parse_amount, MAX_BULK_OPERATIONS
+from app.api.transaction_search import search_query
+from app.api.serializers import fetch, transaction_query, serialize_transactions, json_response
 from datetime import datetime, date
+import csv
+import io
+import json
 
 transaction_routes = Blueprint('transactions', __name__)
 
-# Get all transactions for current user
+# Get a page of transactions for current user, filtered and sorted by the
+# query string (newest first by default)
 @transaction_routes.route('', methods=['GET'])
 @login_required
+@conditional_get('transactions', 'categories')
 def get_transactions():
-    transactions = Transaction.query.filter(Transaction.user_id == current_user.id).all()
-    return jsonify([transaction.to_dict() for transaction in transactions])
+    # ?sideload=categories returns each category once in a map keyed by
+    # id; otherwise categories are embedded, selected in the same query
+    sideload = request.args.get('sideload') == 'categories'
+
+    # Rows are selected as plain column tuples rather than ORM objects
+    try:
+        query, sort, order, limit = transaction_page_query(
+            current_user.id, request.args, transaction_query(include_category=not sideload)
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    rows = fetch(query)
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    page = {
+        'transactions': serialize_transactions(rows, include_category=not sideload),
+        'limit': limit,
+        'next_cursor': encode_cursor(rows[-1], sort, order) if has_more else None
+    }
+    if sideload:
+        page['categories'] = categories_by_id({row.category_id for row in rows})
+
+    return json_response(page)
+
+# Import transactions from an uploaded CSV or OFX file
+@transaction_routes.route('/import', methods=['POST'])
+@login_required
+def import_transactions_file():
+    """
+    Imports a multipart 'file' upload (CSV or OFX, per ?format= or the file
+    extension). ?category_id= is used for rows that name no category.
+    """
+    upload = request.files.get('file')
+    if not upload:
+        return jsonify({'error': 'A file is required'}), 400
+
+    try:
+        format = detect_format(upload.filename, request.args.get('format'))
+        default_category_id = int(request.args['category_id']) if request.args.get('category_id') else None
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        result = import_transactions(current_user.id, upload.stream, format, default_category_id)
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+    ResourceVersion.bump(current_user.id, 'transactions')
+    db.session.commit()
+
+    return jsonify(result), 201 if result['imported'] else 400
+
+# Apply many creates, updates and deletes in one request
+@transaction_routes.route('/bulk', methods=['POST'])
+@login_required
+def bulk_transactions():
+    """
+    Applies {"operations": [{"op": "create", "data": {...}},
+    {"op": "update", "id": 1, "data": {...}}, {"op": "delete", "id": 2}]}
+    all-or-nothing in one DB transaction, with a result per operation
+    """
+    data = request.json or {}
+    operations = data.get('operations')
+
+    if not isinstance(operations, list) or not operations:
+        return jsonify({'error': 'operations must be a non-empty list'}), 400
+
+    if len(operations) > MAX_BULK_OPERATIONS:
+        return jsonify({'error': f'At most {MAX_BULK_OPERATIONS} operations are allowed per request'}), 400
+
+    ok, results = apply_bulk_operations(current_user.id, operations)
+    if not ok:
+        db.session.rollback()
+        return jsonify({'error': 'No operations were applied', 'results': results}), 400
+
+    ResourceVersion.bump(current_user.id, 'transactions')
+    db.session.commit()
+    return jsonify({'results': results})
+
+EXPORT_FORMATS = {'csv': 'text/csv', 'ndjson': 'application/x-ndjson'}
+EXPORT_COLUMNS = ['id', 'transaction_date', 'type', 'amount', 'description', 'category_id', 'category']
+EXPORT_BATCH_SIZE = 1000
+
+# Export the current user's ledger as CSV or NDJSON
+@transaction_routes.route('/export', methods=['GET'])
+@login_required
+@conditional_get('transactions', 'categories')
+def export_transactions():
+    """
+    Streams every transaction matching the list filters, oldest first, as
+    ?format=csv (default) or ?format=ndjson
+    """
+    format = request.args.get('format', 'csv')
+    if format not in EXPORT_FORMATS:
+        return jsonify({'error': 'Format must be either "csv" or "ndjson"'}), 400
+
+    try:
+        query = apply_filters(db.session.query(
+            Transaction.id,
+            Transaction.transaction_date,
+            Transaction.type,
+            Transaction.amount,
+            Transaction.description,
+            Transaction.category_id,
+            Category.name
+        ).join(Category, Category.id == Transaction.category_id)
+         .filter(Transaction.user_id == current_user.id), request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    # yield_per fetches through a server-side cursor in fixed-size batches,
+    # so rows are written out as they arrive and memory stays flat
+    rows = query.order_by(Transaction.transaction_date, Transaction.id).yield_per(EXPORT_BATCH_SIZE)
+
+    def generate():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if format == 'csv':
+            writer.writerow(EXPORT_COLUMNS)
+        for count, row in enumerate(rows, start=1):
+            values = [row[0], row[1].isoformat(), row[2], str(row[3]), row[4], row[5], row[6]]
+            if format == 'csv':
+                writer.writerow(values)
+            else:
+                values[3] = float(row[3])
+                buffer.write(json.dumps(dict(zip(EXPORT_COLUMNS, values))) + '\n')
+            if count % EXPORT_BATCH_SIZE == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype=EXPORT_FORMATS[format],
+        headers={'Content-Disposition': f'attachment; filename=transactions.{format}'}
+    )
+
+# Search the current user's transactions by description
+@transaction_routes.route('/search', methods=['GET'])
+@login_required
+@conditional_get('transactions', 'categories')
+def search_transactions():
+    """
+    Transactions whose description contains every word of ?q=, most
+    relevant first, up to ?limit= of them. Served from the full-text index
+    (GIN on PostgreSQL, FTS5 on SQLite), never a scan of the ledger. The
+    list filters apply as well.
+    """
+    try:
+        query, limit = search_query(current_user.id, request.args, transaction_query())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    # The relevance score is selected last
+    rows = fetch(query)
+    transactions = serialize_transactions([row[:-1] for row in rows])
+    for transaction, row in zip(transactions, rows):
+        transaction['rank'] = row[-1]
+
+    return json_response({'transactions': transactions, 'limit': limit})
 
 # Get a specific transaction
 @transaction_routes.route('/<int:id>', methods=['GET'])
@@ -48,6 +221,11 @@ def create_transaction():
     if data['type'] not in ['income', 'expense']:
         return jsonify({'error': 'Type must be either "income" or "expense"'}), 400
     
+    try:
+        amount = parse_amount(data['amount'])
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     # Parse transaction date
     try:
         transaction_date = date.fromisoformat(data['transaction_date'])
@@ -57,13 +235,15 @@ def create_transaction():
     new_transaction = Transaction(
         user_id=current_user.id,
         category_id=data['category_id'],
-        amount=data['amount'],
+        amount=amount,
         description=data['description'],
         type=data['type'],
         transaction_date=transaction_date
     )
     
     db.session.add(new_transaction)
+    MonthlyCategoryTotal.record(new_transaction)
+    ResourceVersion.bump(current_user.id, 'transactions')
     db.session.commit()
     
     return jsonify(new_transaction.to_dict()), 201
@@ -82,6 +262,10 @@ def update_transaction(id):
     
     data = request.json
     
+    # Take the transaction out of its current rollup row; it is added back
+    # to whichever row it belongs to once the update is validated
+    rollup_deltas = MonthlyCategoryTotal.add_transaction_delta({}, transaction, -1)
+    
     # If category is being updated, validate it belongs to user
     if 'category_id' in data:
         category = Category.query.get(data['category_id'])
@@ -91,7 +275,10 @@ def update_transaction(id):
     
     # Update other fields if provided
     if 'amount' in data:
-        transaction.amount = data['amount']
+        try:
+            transaction.amount = parse_amount(data['amount'])
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
     
     if 'description' in data:
         transaction.description = data['description']
@@ -108,6 +295,9 @@ def update_transaction(id):
             return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
     
     transaction.updated_at = datetime.utcnow()
+    MonthlyCategoryTotal.add_transaction_delta(rollup_deltas, transaction)
+    MonthlyCategoryTotal.apply_deltas(rollup_deltas)
+    ResourceVersion.bump(current_user.id, 'transactions')
     db.session.commit()
     
     return jsonify(transaction.to_dict())
@@ -124,7 +314,9 @@ def delete_transaction(id):
     if transaction.user_id != current_user.id:
         return jsonify({'error': 'Unauthorized'}), 403
     
+    MonthlyCategoryTotal.record(transaction, -1)
     db.session.delete(transaction)
+    ResourceVersion.bump(current_user.id, 'transactions')
     db.session.commit()
     
     return jsonify({'message': 'Transaction successfully deleted'})
\ No newline at end of file
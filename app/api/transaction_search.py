@@ -0,0 +1,48 @@
+from app.models import db, Transaction
+from app.models.transaction_search import SEARCH_CONFIG, transactions_fts
+from app.api.transaction_query import apply_filters, parse_limit
+import re
+
+MAX_SEARCH_TERMS = 10
+WORD = re.compile(r'\w+', re.UNICODE)
+
+
+def parse_terms(args):
+    """
+    The words of ?q=, lowercased. Everything but letters and digits is
+    dropped, so no search syntax from the client reaches the index.
+    """
+    terms = WORD.findall(args.get('q', '').lower())[:MAX_SEARCH_TERMS]
+    if not terms:
+        raise ValueError('q must contain at least one word')
+    return terms
+
+
+def search_query(user_id, args, query):
+    """
+    Narrows a transaction query to the user's rows whose description has
+    every word of ?q= (each as a prefix, so 'groc' finds 'Groceries'),
+    adds a relevance score column and orders by it, best first. The list
+    filters (?type=, ?category_id=, dates, amounts) also apply. Returns the
+    query and the limit; raises ValueError on bad input.
+    """
+    terms = parse_terms(args)
+    limit = parse_limit(args)
+    query = apply_filters(query.filter(Transaction.user_id == user_id), args)
+
+    if db.session.get_bind().dialect.name == 'postgresql':
+        vector = db.func.to_tsvector(SEARCH_CONFIG, Transaction.description)
+        tsquery = db.func.to_tsquery(SEARCH_CONFIG, ' & '.join(f'{term}:*' for term in terms))
+        rank = db.func.ts_rank(vector, tsquery)
+        query = query.filter(vector.op('@@')(tsquery))
+    else:
+        # bm25() is lower for better matches; negate it so higher is better
+        # on both databases
+        rank = -db.func.bm25(transactions_fts.c.transactions_fts)
+        query = query.join(transactions_fts, transactions_fts.c.rowid == Transaction.id).filter(
+            transactions_fts.c.transactions_fts.op('MATCH')(' '.join(f'"{term}"*' for term in terms))
+        )
+
+    rank = db.cast(rank, db.Float).label('rank')
+    query = query.add_columns(rank).order_by(rank.desc(), Transaction.transaction_date.desc(), Transaction.id.desc())
+    return query.limit(limit), limit
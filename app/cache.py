@@ -0,0 +1,130 @@
+from collections import OrderedDict
+from werkzeug.utils import import_string
+import threading
+import time
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with per-entry TTL. Thread safe. Stands in
+    for a shared cache: any object with the same get/set/delete/clear
+    methods can be configured as the backend instead.
+    """
+
+    def __init__(self, max_entries=1024, default_ttl=300):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (ttl or self.default_ttl)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class NullCache:
+    # Backend that never stores anything, for turning caching off
+    def __init__(self, max_entries=None, default_ttl=None):
+        pass
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, ttl=None):
+        pass
+
+    def delete(self, key):
+        pass
+
+    def clear(self):
+        pass
+
+    def __len__(self):
+        return 0
+
+
+CACHE_BACKENDS = {'local': LocalCache, 'null': NullCache}
+
+
+class Cache:
+    """
+    Front for the configured cache backend that counts hits and misses.
+    The backend setting (CACHE_BACKEND unless given) is 'local', 'null' or
+    the import path of a backend class.
+    """
+
+    def __init__(self, backend_setting='CACHE_BACKEND', ttl_setting='CACHE_TTL'):
+        self.backend_setting = backend_setting
+        self.ttl_setting = ttl_setting
+        self.backend = LocalCache()
+        self.hits = 0
+        self.misses = 0
+
+    def init_app(self, app):
+        backend = app.config.get(self.backend_setting, 'local')
+        backend_class = CACHE_BACKENDS.get(backend) or import_string(backend)
+        self.backend = backend_class(
+            max_entries=app.config.get('CACHE_MAX_ENTRIES', 1024),
+            default_ttl=app.config.get(self.ttl_setting, 300)
+        )
+
+    def get(self, key):
+        value = self.backend.get(key)
+        # Counters are best-effort; a lost increment under contention is fine
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key, value, ttl=None):
+        self.backend.set(key, value, ttl)
+
+    def delete(self, key):
+        self.backend.delete(key)
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'backend': type(self.backend).__name__,
+            'entries': len(self.backend),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0
+        }
+
+
+response_cache = Cache()
+# Session users loaded by flask-login, kept briefly so authenticated
+# requests don't each start with a SELECT on users
+user_cache = Cache(backend_setting='USER_CACHE_BACKEND', ttl_setting='USER_CACHE_TTL')
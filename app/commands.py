@@ -0,0 +1,102 @@
+import click
+from flask.cli import AppGroup
+from app.models import db, User, MonthlyCategoryTotal, ResourceVersion, CacheEpoch
+from app.query_plans import check_query_plans
+from app.recurring import detect_all, materialize, DEFAULT_BATCH_SIZE, DEFAULT_MIN_CONFIDENCE
+from datetime import date
+import time
+
+# Creates a rollups group to hold maintenance commands for derived tables
+# So we can type `flask rollups --help`
+rollup_commands = AppGroup('rollups')
+
+
+# Creates the `flask rollups rebuild` command
+@rollup_commands.command('rebuild')
+@click.option('--user-id', type=int, default=None, help='Only rebuild this user\'s rows.')
+def rebuild(user_id):
+    MonthlyCategoryTotal.rebuild(user_id)
+    # Reports are cached under the transactions version, so retire them
+    if user_id:
+        ResourceVersion.bump(user_id, 'transactions')
+    else:
+        CacheEpoch.advance()
+    db.session.commit()
+    click.echo('Rebuilt monthly category totals' + (f' for user {user_id}' if user_id else ''))
+
+
+# Creates a queries group for checks on the SQL the API runs
+# So we can type `flask queries --help`
+query_commands = AppGroup('queries')
+
+
+# Creates the `flask queries explain` command
+@query_commands.command('explain')
+@click.option('--user-id', type=int, default=None, help='Run the endpoints as this user (default: the first user).')
+def explain(user_id):
+    """
+    EXPLAINs the queries behind each read endpoint and fails if any of them
+    reads a per-user table with a full scan instead of an index.
+    """
+    if user_id is None:
+        user_id = db.session.query(db.func.min(User.id)).scalar()
+    if user_id is None:
+        raise click.ClickException('No users to run the endpoints as; run `flask seed all` first')
+
+    failures = 0
+    for method, url, status, count, scans in check_query_plans(user_id):
+        click.echo(f'{method} {url} -> {status}, {count} queries' + (', FULL SCAN' if scans else ''))
+        for table, statement in scans:
+            failures += 1
+            click.echo(f'    full scan of {table}: {" ".join(statement.split())}')
+    if failures:
+        raise click.ClickException(f'{failures} queries read a table with a full scan')
+
+
+# Creates a recurring group for the recurring transaction detector
+# So we can type `flask recurring --help`
+recurring_commands = AppGroup('recurring')
+
+
+# Creates the `flask recurring detect` command, meant to run nightly
+@recurring_commands.command('detect')
+@click.option('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, show_default=True,
+              help='Users per query and vectorized pass.')
+@click.option('--time-budget', type=float, default=None,
+              help='Seconds after which no new batch is started (default: no limit).')
+@click.option('--after-user-id', type=int, default=0, show_default=True,
+              help='Resume after this user id, as printed by a run that ran out of time.')
+@click.option('--min-confidence', type=float, default=DEFAULT_MIN_CONFIDENCE, show_default=True)
+def detect(batch_size, time_budget, after_user_id, min_confidence):
+    """
+    Finds recurring transactions for every user and replaces their stored
+    candidates, one committed batch of users at a time.
+    """
+    start = time.perf_counter()
+    users = candidates = 0
+    last_user_id = after_user_id
+    for last_user_id, batch_users, batch_candidates in detect_all(
+        batch_size, time_budget, after_user_id, min_confidence
+    ):
+        users += batch_users
+        candidates += batch_candidates
+        click.echo(f'Users up to {last_user_id}: {users} users, {candidates} candidates')
+
+    click.echo(f'Found {candidates} recurring candidates for {users} users in {time.perf_counter() - start:.1f}s')
+    remaining = db.session.query(db.func.count(User.id)).filter(User.id > last_user_id).scalar()
+    if remaining:
+        click.echo(f'Out of time with {remaining} users left; resume with --after-user-id {last_user_id}')
+
+
+# Creates the `flask recurring materialize` command
+@recurring_commands.command('materialize')
+@click.option('--through', type=click.DateTime(formats=['%Y-%m-%d']), default=None,
+              help='Create occurrences due on or before this date (default: today).')
+def materialize_rules(through):
+    """
+    Creates the transactions of every recurring rule occurrence that has
+    come due. Safe to run repeatedly: occurrences are only created once.
+    """
+    count = materialize(through.date() if through else date.today())
+    db.session.commit()
+    click.echo(f'Created {count} recurring transactions')
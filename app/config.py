@@ -1,4 +1,33 @@
 import os
+import tempfile
+from app.pool import TimedQueuePool
+
+
+def engine_options(database_url):
+    """
+    Connection pool settings from the environment. They only apply to
+    PostgreSQL; SQLite keeps Flask-SQLAlchemy's own defaults.
+    """
+    if not database_url.startswith('postgresql'):
+        return {}
+
+    options = {
+        'poolclass': TimedQueuePool,
+        # Connections kept open per worker process, and how many more may be
+        # opened under load; size them to the worker's threads
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+        # Seconds a request waits for a free connection before failing
+        'pool_timeout': float(os.environ.get('DB_POOL_TIMEOUT', 30)),
+        # Replace connections the server or a proxy has dropped
+        'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', 'true').lower() in ('1', 'true', 'yes'),
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+    }
+    # Server-side cap on any one statement, in milliseconds (0 disables it)
+    statement_timeout = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 0))
+    if statement_timeout:
+        options['connect_args'] = {'options': f'-c statement_timeout={statement_timeout}'}
+    return options
 
 
 class Config:
@@ -11,4 +40,47 @@ class Config:
     # so the connection uri must be updated here (for production)
     SQLALCHEMY_DATABASE_URI = os.environ.get(
         'DATABASE_URL').replace('postgres://', 'postgresql://')
-    SQLALCHEMY_ECHO = True
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+    # Statement echo is for local debugging only; set SQLALCHEMY_ECHO=1 to
+    # turn it on. Per-request query counts and timings come from
+    # app.instrumentation instead, and statements slower than SLOW_QUERY_MS
+    # are logged with their endpoint.
+    SQLALCHEMY_ECHO = os.environ.get('SQLALCHEMY_ECHO', '').lower() in ('1', 'true', 'yes')
+    SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', 200))
+    # Response cache for read-heavy list endpoints: 'local' (in-process
+    # LRU), 'null' (disabled) or the import path of a backend class
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'local')
+    CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 1024))
+    CACHE_TTL = int(os.environ.get('CACHE_TTL', 300))
+    # Bearer token for the /api/ops stats endpoints; unset, they are off
+    OPS_TOKEN = os.environ.get('OPS_TOKEN')
+    # Cache of session users, set apart from the response cache: a backend
+    # as for CACHE_BACKEND ('null' loads the user on every request), and
+    # the seconds a user is served from it. A change to a user only evicts
+    # it in the process that made the change, so other workers may keep
+    # serving an updated or deleted user for up to this long; keep it short.
+    USER_CACHE_BACKEND = os.environ.get('USER_CACHE_BACKEND', 'local')
+    USER_CACHE_TTL = int(os.environ.get('USER_CACHE_TTL', 10))
+    # werkzeug hash method for passwords as 'method:hash:iterations'; left
+    # out, the iteration count is werkzeug's default.
+    # Stored hashes made with different parameters are upgraded on login.
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'pbkdf2:sha256:260000')
+    PASSWORD_SALT_LENGTH = int(os.environ.get('PASSWORD_SALT_LENGTH', 16))
+    # In-process scheduler (see app.scheduler); intervals are in seconds.
+    # Due times are shared through the database, so each job runs once per
+    # interval however many workers there are. With cron, leave it off and
+    # run `flask recurring materialize` and `flask recurring detect` instead.
+    SCHEDULER_ENABLED = os.environ.get('SCHEDULER_ENABLED', '').lower() in ('1', 'true', 'yes')
+    SCHEDULER_POLL_INTERVAL = float(os.environ.get('SCHEDULER_POLL_INTERVAL', 60))
+    RECURRING_MATERIALIZE_INTERVAL = float(os.environ.get('RECURRING_MATERIALIZE_INTERVAL', 3600))
+    RECURRING_DETECT_INTERVAL = float(os.environ.get('RECURRING_DETECT_INTERVAL', 86400))
+    RECURRING_DETECT_TIME_BUDGET = float(os.environ.get('RECURRING_DETECT_TIME_BUDGET', 600))
+    # Background jobs (see app.jobs): worker threads per web process, where
+    # uploads wait for their import job, how often a running job's process
+    # touches its heartbeat, and how many seconds without one before the
+    # job is marked interrupted. Keep JOB_STALE_AFTER several heartbeats
+    # long.
+    JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 2))
+    JOB_UPLOAD_DIR = os.environ.get('JOB_UPLOAD_DIR', os.path.join(tempfile.gettempdir(), 'budgetbuddy-jobs'))
+    JOB_HEARTBEAT_INTERVAL = float(os.environ.get('JOB_HEARTBEAT_INTERVAL', 15))
+    JOB_STALE_AFTER = float(os.environ.get('JOB_STALE_AFTER', 120))
@@ -4,19 +4,24 @@ from wtforms.validators import DataRequired, Email, ValidationError
 from app.models import User
 
 
+def find_user(form):
+    # Look the user up once per form; both validators and the login route
+    # share the result through form.user
+    if not hasattr(form, 'user'):
+        form.user = User.query.filter(User.email == form.data['email']).first()
+    return form.user
+
+
 def user_exists(form, field):
     # Checking if user exists
-    email = field.data
-    user = User.query.filter(User.email == email).first()
-    if not user:
+    if not find_user(form):
         raise ValidationError('Email provided not found.')
 
 
 def password_matches(form, field):
     # Checking if password matches
     password = field.data
-    email = form.data['email']
-    user = User.query.filter(User.email == email).first()
+    user = find_user(form)
     if not user:
         raise ValidationError('No such user exists.')
     if not user.check_password(password):
@@ -0,0 +1,70 @@
+from flask import g, has_app_context, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class QueryInstrumentation:
+    """
+    Counts the queries each request runs and the time spent in them, using
+    SQLAlchemy cursor events rather than echo. The totals are sent back in
+    a Server-Timing header, and any statement slower than SLOW_QUERY_MS is
+    logged with the endpoint that ran it.
+
+    Queries a streamed response runs while its body is being sent happen
+    after the header is written, so they are only seen by the slow log.
+    """
+
+    def __init__(self):
+        self.slow_query_ms = 200
+
+    def init_app(self, app):
+        self.slow_query_ms = app.config.get('SLOW_QUERY_MS', 200)
+        # Listening on the Engine class covers whichever engine
+        # Flask-SQLAlchemy creates, whenever it creates it
+        if not event.contains(Engine, 'before_cursor_execute', self.before_cursor_execute):
+            event.listen(Engine, 'before_cursor_execute', self.before_cursor_execute)
+            event.listen(Engine, 'after_cursor_execute', self.after_cursor_execute)
+        app.before_request(self.start_request)
+        app.after_request(self.add_server_timing)
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # Kept on the statement's own execution context: a statement that
+        # fails never reaches after_cursor_execute, and its start time
+        # goes with it instead of lingering on the pooled connection
+        context._query_start_time = time.perf_counter()
+
+    def after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = (time.perf_counter() - context._query_start_time) * 1000
+
+        if has_app_context():
+            g.query_count = g.get('query_count', 0) + 1
+            g.query_time = g.get('query_time', 0.0) + elapsed
+
+        if elapsed >= self.slow_query_ms:
+            endpoint = request.endpoint if has_request_context() else None
+            logger.warning(
+                'Slow query (%.1f ms) in %s: %s',
+                elapsed, endpoint or '<no request>', ' '.join(statement.split())
+            )
+
+    def start_request(self):
+        g.request_start = time.perf_counter()
+        g.query_count = 0
+        g.query_time = 0.0
+
+    def add_server_timing(self, response):
+        if 'request_start' not in g:
+            return response
+        total = (time.perf_counter() - g.request_start) * 1000
+        response.headers.add(
+            'Server-Timing',
+            f'db;dur={g.query_time:.1f};desc="{g.query_count} queries", app;dur={total:.1f}'
+        )
+        return response
+
+
+query_instrumentation = QueryInstrumentation()
@@ -0,0 +1,228 @@
+from app.models import db, Job
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from sqlalchemy.exc import OperationalError
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class JobRunner:
+    """
+    Runs long operations on a small thread pool inside the web process, so
+    a gunicorn worker hands them off instead of blocking on them. Each job
+    is a row in the jobs table, which is all the status and result
+    endpoints read, so any process can answer for any job; no broker is
+    involved.
+
+    Kinds of job are registered with @job_runner.kind(name, parse=...,
+    cleanup=...): parse validates the request's params (raising
+    ValueError) and the handler is called as handler(job, params,
+    progress) in a fresh app context, where progress(fraction) reports how
+    far it has got. The handler commits its own work and returns the JSON
+    result. cleanup(params), if given, runs when a job is found
+    interrupted, to release what the handler would have (uploads).
+
+    The pool starts with the first job or request, not in CLI commands.
+    Queued jobs are picked up again by the next process to start, and a
+    job is claimed with a conditional UPDATE, so it runs once even when
+    several processes see it. While a job runs, its process touches
+    heartbeat_at every JOB_HEARTBEAT_INTERVAL seconds; every process
+    sweeps for running jobs whose heartbeat is older than JOB_STALE_AFTER
+    (their process died: a worker restart, a crash) and marks them
+    failed. A job's final status is only written while it is still
+    running, so a job marked interrupted stays failed.
+    """
+
+    def __init__(self):
+        self.kinds = {}
+        self.app = None
+        self.executor = None
+        self.heartbeat = None
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        # Live progress of the jobs running in this process, keyed by job
+        # id; persisted as it changes only where the database allows a
+        # second writer (PostgreSQL). Its keys are the jobs this process
+        # sends heartbeats for.
+        self.progress = {}
+
+    def init_app(self, app):
+        self.app = app
+        app.before_request(self.start)
+
+    def kind(self, name, parse=None, cleanup=None):
+        def decorator(handler):
+            self.kinds[name] = {
+                'handler': handler,
+                'parse': parse or (lambda params: params),
+                'cleanup': cleanup
+            }
+            return handler
+        return decorator
+
+    def parse(self, kind, params):
+        # Validated params for a job of the given kind; raises ValueError
+        if not isinstance(kind, str) or kind not in self.kinds:
+            raise ValueError(f'Kind must be one of: {", ".join(sorted(self.kinds))}')
+        if not isinstance(params, dict):
+            raise ValueError('params must be an object')
+        return self.kinds[kind]['parse'](params)
+
+    def start(self):
+        if self.executor is not None:
+            return
+        with self.lock:
+            if self.executor is not None:
+                return
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.app.config['JOB_WORKERS'], thread_name_prefix='jobs'
+            )
+            self.heartbeat = threading.Thread(target=self.beat, name='jobs-heartbeat', daemon=True)
+            self.heartbeat.start()
+        self.recover()
+
+    def stop(self):
+        self.stopping.set()
+
+    def enqueue(self, user_id, kind, params):
+        """
+        Records a job and hands it to the pool once the row is committed.
+        params must already be validated with parse(). Commits.
+        """
+        job = Job(user_id=user_id, kind=kind, params=params, status='queued')
+        db.session.add(job)
+        db.session.commit()
+        self.start()
+        self.executor.submit(self.run, job.id)
+        return job
+
+    def recover(self):
+        # Fails stale jobs and resubmits the queued ones, when a process starts
+        with self.app.app_context():
+            self.fail_stale()
+            queued = [id for id, in db.session.query(Job.id).filter(Job.status == 'queued').order_by(Job.id)]
+            db.session.commit()
+        for job_id in queued:
+            self.executor.submit(self.run, job_id)
+
+    def fail_stale(self):
+        """
+        Marks running jobs whose heartbeat is older than JOB_STALE_AFTER
+        seconds as failed, then runs their kind's cleanup. Commits.
+        """
+        stale = Job.status == 'running', Job.heartbeat_at < datetime.utcnow() - timedelta(
+            seconds=self.app.config['JOB_STALE_AFTER']
+        )
+        jobs = db.session.query(Job.id, Job.kind, Job.params).filter(*stale).all()
+        interrupted = []
+        for job in jobs:
+            # Conditional, in case the job finished or another process
+            # failed it since it was read
+            if db.session.execute(Job.__table__.update().where(Job.id == job.id, *stale).values(
+                status='failed', error='Interrupted', finished_at=datetime.utcnow()
+            )).rowcount:
+                interrupted.append(job)
+        db.session.commit()
+
+        for job in interrupted:
+            logger.warning('Job %s (%s) interrupted', job.id, job.kind)
+            cleanup = self.kinds.get(job.kind, {}).get('cleanup')
+            if cleanup:
+                try:
+                    cleanup(job.params)
+                except Exception:
+                    logger.exception('Cleanup of job %s (%s) failed', job.id, job.kind)
+
+    def beat(self):
+        # Heartbeat thread: touches this process's running jobs, then
+        # sweeps for jobs whose process has gone
+        while not self.stopping.wait(self.app.config['JOB_HEARTBEAT_INTERVAL']):
+            try:
+                with self.app.app_context():
+                    running = list(self.progress)
+                    if running:
+                        db.session.execute(Job.__table__.update().where(
+                            Job.id.in_(running),
+                            Job.status == 'running'
+                        ).values(heartbeat_at=datetime.utcnow()))
+                        db.session.commit()
+                    self.fail_stale()
+            except OperationalError as e:
+                # SQLite is locked while a job writes; its handler's
+                # progress reports carry the heartbeat instead
+                logger.debug('Job heartbeat skipped: %s', e)
+            except Exception:
+                logger.exception('Job heartbeat failed')
+
+    def claim(self, job_id):
+        # Moves the job from queued to running; False if another thread or
+        # process got there first
+        now = datetime.utcnow()
+        claimed = db.session.execute(Job.__table__.update().where(
+            Job.id == job_id,
+            Job.status == 'queued'
+        ).values(status='running', started_at=now, heartbeat_at=now)).rowcount
+        db.session.commit()
+        return claimed == 1
+
+    def run(self, job_id):
+        with self.app.app_context():
+            if not self.claim(job_id):
+                return
+            self.progress[job_id] = 0.0
+            job = Job.query.get(job_id)
+            try:
+                result = self.kinds[job.kind]['handler'](job, job.params, lambda fraction: self.report(job_id, fraction))
+            except Exception as e:
+                db.session.rollback()
+                logger.exception('Job %s (%s) failed', job_id, job.kind)
+                self.finish(job_id, 'failed', error=str(e)[:255] or type(e).__name__)
+            else:
+                self.finish(job_id, 'succeeded', result=result)
+            finally:
+                self.progress.pop(job_id, None)
+
+    def report(self, job_id, fraction):
+        self.progress[job_id] = min(max(float(fraction), 0), 1)
+        update = Job.__table__.update().where(Job.id == job_id, Job.status == 'running').values(
+            progress=self.progress[job_id],
+            heartbeat_at=datetime.utcnow()
+        )
+        if db.engine.dialect.name == 'postgresql':
+            # On its own connection: the job's transaction is not committed
+            # yet, and the status endpoint should see progress now
+            with db.engine.begin() as connection:
+                connection.execute(update)
+        else:
+            # SQLite has one writer, the job itself; the heartbeat lands
+            # with the job's own commit, before any sweep can run
+            db.session.execute(update)
+
+    def finish(self, job_id, status, result=None, error=None):
+        # Only a job still running is finished: one that was marked
+        # interrupted meanwhile keeps that status
+        finished = db.session.execute(Job.__table__.update().where(
+            Job.id == job_id,
+            Job.status == 'running'
+        ).values(
+            status=status,
+            progress=1 if status == 'succeeded' else Job.progress,
+            result=result,
+            error=error,
+            finished_at=datetime.utcnow()
+        )).rowcount
+        db.session.commit()
+        if not finished:
+            logger.warning('Job %s ended after it was marked interrupted', job_id)
+
+    def job_dict(self, job):
+        # to_dict() with this process's live progress, when it is running here
+        data = job.to_dict()
+        if job.status == 'running' and job.id in self.progress:
+            data['progress'] = self.progress[job.id]
+        return data
+
+
+job_runner = JobRunner()
@@ -1,6 +1,13 @@
 from .db import db, environment, SCHEMA, add_prefix_for_prod
-from .user import User
+from .user import User, SessionUser
 from .category import Category
 from .transaction import Transaction
 from .budget import Budget
-from .saving import SavingsGoal
\ No newline at end of file
+from .saving import SavingsGoal
+from .monthly_category_total import MonthlyCategoryTotal
+from .resource_version import ResourceVersion, CacheEpoch
+from .recurring_candidate import RecurringCandidate
+from .recurring_rule import RecurringRule
+from .transaction_search import transactions_fts
+from .job import Job
+from .scheduled_job import ScheduledJob
@@ -4,8 +4,16 @@ from datetime import datetime
 class Budget(db.Model):
     __tablename__ = 'budgets'
 
+    # One budget per category and month; the unique index also serves the
+    # per-user list and status queries. category_id is indexed on its own
+    # for the cascade when a category is deleted.
+    __table_args__ = (
+        db.Index('ix_budgets_user_id_category_id_year_month', 'user_id', 'category_id', 'year', 'month', unique=True),
+        db.Index('ix_budgets_category_id', 'category_id'),
+    )
+
     if environment == "production":
-        __table_args__ = {'schema': SCHEMA}
+        __table_args__ += ({'schema': SCHEMA},)
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id')), nullable=False)
@@ -20,8 +28,8 @@ class Budget(db.Model):
     user = db.relationship('User', back_populates='budgets')
     category = db.relationship('Category', back_populates='budgets')
 
-    def to_dict(self):
-        return {
+    def to_dict(self, include_category=True):
+        data = {
             'id': self.id,
             'user_id': self.user_id,
             'category_id': self.category_id,
@@ -30,5 +38,7 @@ class Budget(db.Model):
             'year': self.year,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat(),
-            'category': self.category.to_dict() if self.category else None
-        }
\ No newline at end of file
+        }
+        if include_category:
+            data['category'] = self.category.to_dict() if self.category else None
+        return data
\ No newline at end of file
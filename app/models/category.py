@@ -4,8 +4,12 @@ from datetime import datetime
 class Category(db.Model):
     __tablename__ = 'categories'
 
+    __table_args__ = (
+        db.Index('ix_categories_user_id', 'user_id'),
+    )
+
     if environment == "production":
-        __table_args__ = {'schema': SCHEMA}
+        __table_args__ += ({'schema': SCHEMA},)
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id')), nullable=False)
@@ -18,6 +22,9 @@ class Category(db.Model):
     user = db.relationship('User', back_populates='categories')
     transactions = db.relationship('Transaction', back_populates='category', cascade='all, delete-orphan')
     budgets = db.relationship('Budget', back_populates='category', cascade='all, delete-orphan')
+    monthly_totals = db.relationship('MonthlyCategoryTotal', back_populates='category', cascade='all, delete-orphan')
+    recurring_candidates = db.relationship('RecurringCandidate', back_populates='category', cascade='all, delete-orphan')
+    recurring_rules = db.relationship('RecurringRule', back_populates='category', cascade='all, delete-orphan')
 
     def to_dict(self):
         return {
@@ -0,0 +1,56 @@
+from .db import db, environment, SCHEMA, add_prefix_for_prod
+from datetime import datetime
+
+JOB_STATUSES = ('queued', 'running', 'succeeded', 'failed')
+
+# A long operation (import, rollup rebuild, annual report) run off the
+# request by app.jobs. The row is the job's durable state: any web process
+# can answer status and result requests from it.
+class Job(db.Model):
+    __tablename__ = 'jobs'
+
+    __table_args__ = (
+        db.Index('ix_jobs_user_id_created_at', 'user_id', 'created_at'),
+        # Recovery looks for jobs left queued or running
+        db.Index('ix_jobs_status', 'status'),
+    )
+
+    if environment == "production":
+        __table_args__ += ({'schema': SCHEMA},)
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id')), nullable=False)
+    kind = db.Column(db.String(30), nullable=False)
+    status = db.Column(db.String(10), nullable=False, default='queued')  # one of JOB_STATUSES
+    params = db.Column(db.JSON, nullable=False, default=dict)
+    progress = db.Column(db.Float, nullable=False, default=0)  # 0-1
+    result = db.Column(db.JSON)
+    error = db.Column(db.String(255))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    started_at = db.Column(db.DateTime)
+    # Touched by the running process every JOB_HEARTBEAT_INTERVAL seconds;
+    # a running job whose heartbeat stops has lost its process
+    heartbeat_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+    # Relationships
+    user = db.relationship('User', back_populates='jobs')
+
+    @property
+    def finished(self):
+        return self.status in ('succeeded', 'failed')
+
+    def to_dict(self):
+        # The result is left out; it can be large and has its own endpoint
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'kind': self.kind,
+            'status': self.status,
+            'params': self.params,
+            'progress': self.progress,
+            'error': self.error,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
@@ -0,0 +1,137 @@
+from .db import db, environment, SCHEMA, add_prefix_for_prod
+from sqlalchemy.dialects import postgresql, sqlite
+from decimal import Decimal
+
+# Rollup of a user's transactions per category, month and type. Kept current
+# by the transaction write paths in the same DB transaction, so reports can
+# read a handful of pre-summed rows instead of the whole ledger.
+class MonthlyCategoryTotal(db.Model):
+    __tablename__ = 'monthly_category_totals'
+
+    # The primary key leads with user_id; category_id needs its own index
+    # for the cascade when a category is deleted
+    __table_args__ = (
+        db.Index('ix_monthly_category_totals_category_id', 'category_id'),
+    )
+
+    if environment == "production":
+        __table_args__ += ({'schema': SCHEMA},)
+
+    user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id')), primary_key=True)
+    category_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('categories.id')), primary_key=True)
+    year = db.Column(db.Integer, primary_key=True)
+    month = db.Column(db.Integer, primary_key=True)  # 1-12 for Jan-Dec
+    type = db.Column(db.String(10), primary_key=True)  # 'income' or 'expense'
+    total = db.Column(db.Numeric(12, 2), nullable=False, default=0)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+    # Relationships
+    user = db.relationship('User', back_populates='monthly_totals')
+    category = db.relationship('Category', back_populates='monthly_totals')
+
+    @staticmethod
+    def add_delta(deltas, user_id, category_id, transaction_date, type, amount, sign=1):
+        # Accumulates the change one transaction makes to its rollup row
+        key = (user_id, int(category_id), transaction_date.year, transaction_date.month, type)
+        delta = deltas.setdefault(key, [Decimal('0'), 0])
+        delta[0] += sign * Decimal(str(amount))
+        delta[1] += sign
+        return deltas
+
+    @classmethod
+    def add_transaction_delta(cls, deltas, transaction, sign=1):
+        return cls.add_delta(
+            deltas,
+            transaction.user_id,
+            transaction.category_id,
+            transaction.transaction_date,
+            transaction.type,
+            transaction.amount,
+            sign
+        )
+
+    @classmethod
+    def apply_deltas(cls, deltas):
+        """
+        Adds accumulated deltas to the rollup with one upsert statement and
+        drops rows whose transactions have all gone. Does not commit.
+        """
+        params = [
+            {'user_id': key[0], 'category_id': key[1], 'year': key[2], 'month': key[3],
+             'type': key[4], 'total': total, 'count': count}
+            for key, (total, count) in deltas.items()
+            if total or count
+        ]
+        if not params:
+            return
+
+        table = cls.__table__
+        dialect = db.session.get_bind().dialect.name
+        insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+        stmt = insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.category_id, table.c.year, table.c.month, table.c.type],
+            set_={
+                'total': table.c.total + stmt.excluded.total,
+                'count': table.c.count + stmt.excluded.count
+            }
+        )
+        db.session.execute(stmt, params)
+
+        user_ids = {param['user_id'] for param in params}
+        db.session.execute(table.delete().where(
+            table.c.user_id.in_(user_ids),
+            table.c.count <= 0
+        ))
+
+    @classmethod
+    def record(cls, transaction, sign=1):
+        # Adds (sign=1) or removes (sign=-1) one transaction from the rollup
+        cls.apply_deltas(cls.add_transaction_delta({}, transaction, sign))
+
+    @classmethod
+    def rebuild(cls, user_id=None):
+        """
+        Recomputes the rollup from the transactions table with one
+        INSERT ... SELECT, for one user or everyone. Does not commit.
+        """
+        from .transaction import Transaction
+
+        table = cls.__table__
+        delete = table.delete()
+        source = db.select(
+            Transaction.user_id,
+            Transaction.category_id,
+            db.cast(db.extract('year', Transaction.transaction_date), db.Integer),
+            db.cast(db.extract('month', Transaction.transaction_date), db.Integer),
+            Transaction.type,
+            db.func.sum(Transaction.amount),
+            db.func.count(Transaction.id)
+        )
+        if user_id is not None:
+            delete = delete.where(table.c.user_id == user_id)
+            source = source.where(Transaction.user_id == user_id)
+        source = source.group_by(
+            Transaction.user_id,
+            Transaction.category_id,
+            db.extract('year', Transaction.transaction_date),
+            db.extract('month', Transaction.transaction_date),
+            Transaction.type
+        )
+
+        db.session.execute(delete)
+        db.session.execute(table.insert().from_select(
+            ['user_id', 'category_id', 'year', 'month', 'type', 'total', 'count'],
+            source
+        ))
+
+    def to_dict(self):
+        return {
+            'user_id': self.user_id,
+            'category_id': self.category_id,
+            'year': self.year,
+            'month': self.month,
+            'type': self.type,
+            'total': float(self.total),
+            'count': self.count
+        }
@@ -0,0 +1,66 @@
+from .db import db, environment, SCHEMA, add_prefix_for_prod
+from datetime import datetime
+
+# A series of a user's transactions that looks like it repeats (rent,
+# salary, subscriptions), as found by the recurring detector. Derived data:
+# each detection run replaces the user's rows.
+class RecurringCandidate(db.Model):
+    __tablename__ = 'recurring_candidates'
+
+    __table_args__ = (
+        db.Index('ix_recurring_candidates_user_id', 'user_id'),
+        # Used by the cascade when a category is deleted
+        db.Index('ix_recurring_candidates_category_id', 'category_id'),
+    )
+
+    if environment == "production":
+        __table_args__ += ({'schema': SCHEMA},)
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id')), nullable=False)
+    category_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('categories.id')), nullable=False)
+    type = db.Column(db.String(10), nullable=False)  # 'income' or 'expense'
+    description = db.Column(db.String(255), nullable=False)
+    cadence = db.Column(db.String(10), nullable=False)  # 'weekly', 'biweekly', 'monthly' or 'yearly'
+    amount = db.Column(db.Numeric(10, 2), nullable=False)
+    occurrences = db.Column(db.Integer, nullable=False)
+    first_date = db.Column(db.Date, nullable=False)
+    last_date = db.Column(db.Date, nullable=False)
+    next_date = db.Column(db.Date, nullable=False)
+    confidence = db.Column(db.Float, nullable=False)  # 0-1
+    detected_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    user = db.relationship('User', back_populates='recurring_candidates')
+    category = db.relationship('Category', back_populates='recurring_candidates')
+
+    @classmethod
+    def replace(cls, user_ids, candidates):
+        """
+        Replaces the stored candidates of the given users with one DELETE and
+        one executemany INSERT. Does not commit.
+        """
+        table = cls.__table__
+        db.session.execute(table.delete().where(table.c.user_id.in_(list(user_ids))))
+        if candidates:
+            now = datetime.utcnow()
+            db.session.execute(table.insert(), [
+                {**candidate, 'detected_at': now} for candidate in candidates
+            ])
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'category_id': self.category_id,
+            'type': self.type,
+            'description': self.description,
+            'cadence': self.cadence,
+            'amount': float(self.amount),
+            'occurrences': self.occurrences,
+            'first_date': self.first_date.isoformat(),
+            'last_date': self.last_date.isoformat(),
+            'next_date': self.next_date.isoformat(),
+            'confidence': self.confidence,
+            'detected_at': self.detected_at.isoformat()
+        }
@@ -0,0 +1,104 @@
+from .db import db, environment, SCHEMA, add_prefix_for_prod
+from datetime import datetime, timedelta
+import calendar
+
+CADENCES = ('weekly', 'biweekly', 'monthly', 'yearly')
+
+# A transaction that repeats on a schedule (rent, salary). Due occurrences
+# are materialized into transactions by `flask recurring materialize`;
+# next_date is the first occurrence not materialized yet.
+class RecurringRule(db.Model):
+    __tablename__ = 'recurring_rules'
+
+    __table_args__ = (
+        db.Index('ix_recurring_rules_user_id', 'user_id'),
+        # Used by the cascade when a category is deleted
+        db.Index('ix_recurring_rules_category_id', 'category_id'),
+        # The materializer reads the rules that have come due
+        db.Index('ix_recurring_rules_next_date', 'next_date'),
+    )
+
+    if environment == "production":
+        __table_args__ += ({'schema': SCHEMA},)
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id')), nullable=False)
+    category_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('categories.id')), nullable=False)
+    amount = db.Column(db.Numeric(10, 2), nullable=False)
+    description = db.Column(db.String(255), nullable=False)
+    type = db.Column(db.String(10), nullable=False)  # 'income' or 'expense'
+    cadence = db.Column(db.String(10), nullable=False)  # one of CADENCES
+    start_date = db.Column(db.Date, nullable=False)
+    end_date = db.Column(db.Date)
+    next_date = db.Column(db.Date, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # Relationships
+    user = db.relationship('User', back_populates='recurring_rules')
+    category = db.relationship('Category', back_populates='recurring_rules')
+    transactions = db.relationship('Transaction', back_populates='recurring_rule')
+
+    def occurrence(self, n):
+        """
+        The nth occurrence (0 is start_date). Monthly and yearly dates are
+        counted from start_date rather than from the previous occurrence,
+        so a rule starting on the 31st falls on the last day of shorter
+        months and returns to the 31st after them.
+        """
+        start = self.start_date
+        if self.cadence == 'weekly':
+            return start + timedelta(weeks=n)
+        if self.cadence == 'biweekly':
+            return start + timedelta(weeks=2 * n)
+        months = n if self.cadence == 'monthly' else 12 * n
+        year, month = divmod(start.year * 12 + start.month - 1 + months, 12)
+        return start.replace(year=year, month=month + 1, day=min(start.day, calendar.monthrange(year, month + 1)[1]))
+
+    def first_index(self, day):
+        # A lower bound on the index of the first occurrence on or after day
+        start = self.start_date
+        if day <= start:
+            return 0
+        if self.cadence == 'weekly':
+            return (day - start).days // 7
+        if self.cadence == 'biweekly':
+            return (day - start).days // 14
+        months = (day.year * 12 + day.month) - (start.year * 12 + start.month)
+        return max(months - 1, 0) if self.cadence == 'monthly' else max(months // 12 - 1, 0)
+
+    def occurrences(self, after, through):
+        # Occurrences on or after `after` and on or before `through` (and
+        # end_date), oldest first
+        last = min(through, self.end_date) if self.end_date else through
+        n = self.first_index(after)
+        while True:
+            current = self.occurrence(n)
+            if current > last:
+                return
+            if current >= after:
+                yield current
+            n += 1
+
+    def following(self, day):
+        # The first occurrence after `day`
+        n = self.first_index(day)
+        while self.occurrence(n) <= day:
+            n += 1
+        return self.occurrence(n)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'category_id': self.category_id,
+            'amount': float(self.amount),
+            'description': self.description,
+            'type': self.type,
+            'cadence': self.cadence,
+            'start_date': self.start_date.isoformat(),
+            'end_date': self.end_date.isoformat() if self.end_date else None,
+            'next_date': self.next_date.isoformat(),
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat()
+        }
@@ -0,0 +1,86 @@
+from .db import db, environment, SCHEMA, add_prefix_for_prod
+from sqlalchemy.dialects import postgresql, sqlite
+import hashlib
+
+# Per-user change counter for each API resource ('categories',
+# 'transactions', 'budgets', 'savings'). Writes bump it in the same DB
+# transaction, and list endpoints derive their ETag from it, so an
+# unchanged list can be answered with 304 without being queried.
+class ResourceVersion(db.Model):
+    __tablename__ = 'resource_versions'
+
+    if environment == "production":
+        __table_args__ = {'schema': SCHEMA}
+
+    user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id')), primary_key=True)
+    resource = db.Column(db.String(30), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+    # Relationships
+    user = db.relationship('User', back_populates='resource_versions')
+
+    @classmethod
+    def bump(cls, user_id, *resources):
+        # Increments the version of each resource with one upsert. Does not commit.
+        cls.bump_users([user_id], *resources)
+
+    @classmethod
+    def bump_users(cls, user_ids, *resources):
+        # bump() for several users in the same statement
+        if not user_ids:
+            return
+        table = cls.__table__
+        dialect = db.session.get_bind().dialect.name
+        insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+        stmt = insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.resource],
+            set_={'version': table.c.version + 1}
+        )
+        db.session.execute(stmt, [
+            {'user_id': user_id, 'resource': resource, 'version': 1}
+            for user_id in user_ids
+            for resource in resources
+        ])
+
+    @classmethod
+    def etag(cls, user_id, resources):
+        """
+        A strong ETag over the current versions of the given resources and
+        the cache epoch, read in one query
+        """
+        stmt = db.select(cls.resource, cls.version).where(
+            cls.user_id == user_id,
+            cls.resource.in_(resources)
+        ).union_all(db.select(db.literal(EPOCH_KEY), CacheEpoch.epoch))
+        versions = dict(db.session.execute(stmt).all())
+        key = ';'.join(f'{resource}={versions.get(resource, 0)}' for resource in sorted(resources))
+        return hashlib.sha1(f'{versions.get(EPOCH_KEY, 0)}:{user_id}:{key}'.encode()).hexdigest()
+
+
+# Stands for the epoch among the resource names in an ETag query
+EPOCH_KEY = '*'
+
+
+# A single row whose counter is part of every ETag. Commands that rewrite
+# data behind the API's back (seeding, resets, rollup rebuilds) advance
+# it, since they don't bump resource versions and may even reuse user ids:
+# every ETag and response cache key issued before then stops matching.
+class CacheEpoch(db.Model):
+    __tablename__ = 'cache_epochs'
+
+    if environment == "production":
+        __table_args__ = {'schema': SCHEMA}
+
+    id = db.Column(db.Integer, primary_key=True)
+    epoch = db.Column(db.Integer, nullable=False, default=0)
+
+    @classmethod
+    def advance(cls):
+        # Does not commit
+        table = cls.__table__
+        insert = postgresql.insert if db.session.get_bind().dialect.name == 'postgresql' else sqlite.insert
+        db.session.execute(insert(table).values(id=1, epoch=1).on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_={'epoch': table.c.epoch + 1}
+        ))
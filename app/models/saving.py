@@ -4,8 +4,12 @@ from datetime import datetime
 class SavingsGoal(db.Model):
     __tablename__ = 'savings_goals'
 
+    __table_args__ = (
+        db.Index('ix_savings_goals_user_id', 'user_id'),
+    )
+
     if environment == "production":
-        __table_args__ = {'schema': SCHEMA}
+        __table_args__ += ({'schema': SCHEMA},)
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id')), nullable=False)
@@ -0,0 +1,46 @@
+from .db import db, environment, SCHEMA
+from sqlalchemy.dialects import postgresql, sqlite
+from datetime import datetime, timedelta
+
+# When each job of app.scheduler is next due. Shared by every web process,
+# so a job runs once per interval across all of them, and a restarted
+# worker does not start its schedule over.
+class ScheduledJob(db.Model):
+    __tablename__ = 'scheduled_jobs'
+
+    if environment == "production":
+        __table_args__ = {'schema': SCHEMA}
+
+    name = db.Column(db.String(50), primary_key=True)
+    next_run_at = db.Column(db.DateTime, nullable=False)
+    last_started_at = db.Column(db.DateTime)
+    last_finished_at = db.Column(db.DateTime)
+
+    @classmethod
+    def claim(cls, name, interval):
+        """
+        Moves the job's next run `interval` seconds ahead if it is due (a
+        job never seen before is due at once) and returns whether this
+        caller did so, and so should run it. Of several processes checking
+        at the same time, only one gets True. Commits.
+        """
+        table = cls.__table__
+        now = datetime.utcnow()
+        insert = postgresql.insert if db.session.get_bind().dialect.name == 'postgresql' else sqlite.insert
+        db.session.execute(insert(table).values(name=name, next_run_at=now).on_conflict_do_nothing(
+            index_elements=[table.c.name]
+        ))
+        claimed = db.session.execute(table.update().where(
+            table.c.name == name,
+            table.c.next_run_at <= now
+        ).values(next_run_at=now + timedelta(seconds=interval), last_started_at=now)).rowcount
+        db.session.commit()
+        return claimed == 1
+
+    @classmethod
+    def finished(cls, name):
+        # Commits
+        db.session.execute(cls.__table__.update().where(cls.name == name).values(
+            last_finished_at=datetime.utcnow()
+        ))
+        db.session.commit()
@@ -1,11 +1,29 @@
 from .db import db, environment, SCHEMA, add_prefix_for_prod
 from datetime import datetime
+from decimal import Decimal
+
+# The largest amount Numeric(10, 2) holds; anything more precise than a
+# cent is compared as given, so nothing larger is stored after rounding
+MAX_AMOUNT = Decimal('99999999.99')
 
 class Transaction(db.Model):
     __tablename__ = 'transactions'
 
+    # Composite indexes backing the filter and sort options of the list
+    # endpoint; each ends in a column the keyset cursor can seek on
+    __table_args__ = (
+        db.Index('ix_transactions_user_id_transaction_date', 'user_id', 'transaction_date', 'id'),
+        db.Index('ix_transactions_user_id_category_id_transaction_date', 'user_id', 'category_id', 'transaction_date'),
+        db.Index('ix_transactions_user_id_amount', 'user_id', 'amount', 'id'),
+        # Used by the cascade when a category is deleted
+        db.Index('ix_transactions_category_id', 'category_id'),
+        # One transaction per rule and date, so materializing is idempotent;
+        # rows entered by hand have no rule and are not constrained
+        db.Index('ix_transactions_recurring_rule_id_transaction_date', 'recurring_rule_id', 'transaction_date', unique=True),
+    )
+
     if environment == "production":
-        __table_args__ = {'schema': SCHEMA}
+        __table_args__ += ({'schema': SCHEMA},)
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id')), nullable=False)
@@ -14,15 +32,17 @@ class Transaction(db.Model):
     description = db.Column(db.String(255), nullable=False)
     type = db.Column(db.String(10), nullable=False)  # 'income' or 'expense'
     transaction_date = db.Column(db.Date, nullable=False)
+    recurring_rule_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('recurring_rules.id'), ondelete='SET NULL'))
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     # Relationships
     user = db.relationship('User', back_populates='transactions')
     category = db.relationship('Category', back_populates='transactions')
+    recurring_rule = db.relationship('RecurringRule', back_populates='transactions')
 
-    def to_dict(self):
-        return {
+    def to_dict(self, include_category=True):
+        data = {
             'id': self.id,
             'user_id': self.user_id,
             'category_id': self.category_id,
@@ -30,7 +50,10 @@ class Transaction(db.Model):
             'description': self.description,
             'type': self.type,
             'transaction_date': self.transaction_date.isoformat(),
+            'recurring_rule_id': self.recurring_rule_id,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat(),
-            'category': self.category.to_dict() if self.category else None
-        }
\ No newline at end of file
+        }
+        if include_category:
+            data['category'] = self.category.to_dict() if self.category else None
+        return data
\ No newline at end of file
@@ -0,0 +1,50 @@
+from .db import db
+from .transaction import Transaction
+from sqlalchemy import DDL, event
+
+# Full-text index over transactions.description, one per dialect:
+#
+# - PostgreSQL: a GIN index on to_tsvector('english', description). Search
+#   queries use the same expression, so the planner can use the index, and
+#   PostgreSQL keeps it current on every write.
+# - SQLite: an FTS5 table holding only the index (content= points back at
+#   transactions), kept current by triggers on insert, update and delete.
+#
+# Migrations create the same objects. They are also attached to the
+# table's after_create event so db.create_all() (benchmarks, local
+# databases) builds them. SQLite drops the triggers whenever a batch
+# migration rebuilds the transactions table, so such a migration must
+# recreate them.
+SEARCH_CONFIG = 'english'
+
+POSTGRESQL_DDL = [
+    f"CREATE INDEX ix_transactions_description_search ON %(fullname)s "
+    f"USING gin (to_tsvector('{SEARCH_CONFIG}', description))",
+]
+
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE transactions_fts USING fts5("
+    "description, content='transactions', content_rowid='id', tokenize='porter unicode61')",
+    "CREATE TRIGGER transactions_fts_insert AFTER INSERT ON transactions BEGIN "
+    "INSERT INTO transactions_fts(rowid, description) VALUES (new.id, new.description); END",
+    "CREATE TRIGGER transactions_fts_delete AFTER DELETE ON transactions BEGIN "
+    "INSERT INTO transactions_fts(transactions_fts, rowid, description) "
+    "VALUES ('delete', old.id, old.description); END",
+    "CREATE TRIGGER transactions_fts_update AFTER UPDATE OF description ON transactions BEGIN "
+    "INSERT INTO transactions_fts(transactions_fts, rowid, description) "
+    "VALUES ('delete', old.id, old.description); "
+    "INSERT INTO transactions_fts(rowid, description) VALUES (new.id, new.description); END",
+]
+
+for statement in POSTGRESQL_DDL:
+    event.listen(Transaction.__table__, 'after_create', DDL(statement).execute_if(dialect='postgresql'))
+for statement in SQLITE_DDL:
+    event.listen(Transaction.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+# The FTS table is not in the metadata, so drop it with its content table
+event.listen(
+    Transaction.__table__, 'after_drop',
+    DDL('DROP TABLE IF EXISTS transactions_fts').execute_if(dialect='sqlite')
+)
+
+# The FTS5 table, for joining on rowid and matching against
+transactions_fts = db.table('transactions_fts', db.column('rowid'), db.column('transactions_fts'))
@@ -1,7 +1,19 @@
 from .db import db, environment, SCHEMA, add_prefix_for_prod
 from werkzeug.security import generate_password_hash, check_password_hash
+from flask import current_app
 from flask_login import UserMixin
 from datetime import datetime
+from functools import lru_cache
+from app.cache import user_cache
+
+
+@lru_cache()
+def stored_method(method):
+    # The method part werkzeug stores for a hash method, with its defaults
+    # filled in ('pbkdf2:sha256' is stored as 'pbkdf2:sha256:260000');
+    # found by hashing once, so it follows whatever the installed werkzeug does
+    return generate_password_hash('', method=method, salt_length=1).split('$', 1)[0]
+
 
 class User(db.Model, UserMixin):
     __tablename__ = 'users'
@@ -21,6 +33,11 @@ class User(db.Model, UserMixin):
     categories = db.relationship('Category', back_populates='user', cascade='all, delete-orphan')
     budgets = db.relationship('Budget', back_populates='user', cascade='all, delete-orphan')
     savings_goals = db.relationship('SavingsGoal', back_populates='user', cascade='all, delete-orphan')
+    monthly_totals = db.relationship('MonthlyCategoryTotal', back_populates='user', cascade='all, delete-orphan')
+    resource_versions = db.relationship('ResourceVersion', back_populates='user', cascade='all, delete-orphan')
+    recurring_candidates = db.relationship('RecurringCandidate', back_populates='user', cascade='all, delete-orphan')
+    recurring_rules = db.relationship('RecurringRule', back_populates='user', cascade='all, delete-orphan')
+    jobs = db.relationship('Job', back_populates='user', cascade='all, delete-orphan')
 
     @property
     def password(self):
@@ -28,11 +45,24 @@ class User(db.Model, UserMixin):
 
     @password.setter
     def password(self, password):
-        self.hashed_password = generate_password_hash(password)
+        self.hashed_password = generate_password_hash(
+            password,
+            method=current_app.config['PASSWORD_HASH_METHOD'],
+            salt_length=current_app.config['PASSWORD_SALT_LENGTH']
+        )
 
     def check_password(self, password):
         return check_password_hash(self.password, password)
 
+    def needs_rehash(self):
+        # Hashes are stored as 'method$salt$hash'; compare the method part
+        # (including the iteration count) and the salt length with the config
+        method, salt, _ = self.hashed_password.split('$', 2)
+        return (
+            method != stored_method(current_app.config['PASSWORD_HASH_METHOD'])
+            or len(salt) != current_app.config['PASSWORD_SALT_LENGTH']
+        )
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -40,4 +70,25 @@ class User(db.Model, UserMixin):
             'email': self.email,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat()
-        }
\ No newline at end of file
+        }
+
+
+# Lightweight stand-in for User used as flask-login's current_user. Built
+# from User.to_dict() so it can be cached without holding a DB session.
+class SessionUser(UserMixin):
+    def __init__(self, data):
+        self._data = data
+        self.id = data['id']
+        self.username = data['username']
+        self.email = data['email']
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+# Drop a cached session user as soon as the row changes. This only reaches
+# this process's cache; other workers' copies age out after USER_CACHE_TTL.
+@db.event.listens_for(User, 'after_update')
+@db.event.listens_for(User, 'after_delete')
+def invalidate_session_user(mapper, connection, user):
+    user_cache.delete(f'user:{user.id}')
\ No newline at end of file
@@ -0,0 +1,62 @@
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import QueuePool
+import threading
+import time
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool that also records how long checkouts wait for a connection,
+    including the time to open a new one, and how many of them timed out.
+    Used as the engine's poolclass for PostgreSQL (see Config).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._wait_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except TimeoutError:
+            with self._wait_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            wait = time.perf_counter() - start
+            with self._wait_lock:
+                self.checkouts += 1
+                self.wait_total += wait
+                self.wait_max = max(self.wait_max, wait)
+
+
+def pool_stats(engine):
+    """
+    Occupancy of the engine's connection pool in this worker, plus checkout
+    wait times when the pool records them
+    """
+    pool = engine.pool
+    stats = {'pool': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            'size': pool.size(),
+            'checked_out': pool.checkedout(),
+            'checked_in': pool.checkedin(),
+            'overflow': max(pool.overflow(), 0),
+            'max_overflow': pool._max_overflow,
+            'timeout': pool.timeout()
+        })
+    if isinstance(pool, TimedQueuePool):
+        checkouts = pool.checkouts
+        stats.update({
+            'checkouts': checkouts,
+            'timeouts': pool.timeouts,
+            'wait_avg_ms': round(pool.wait_total / checkouts * 1000, 2) if checkouts else 0.0,
+            'wait_max_ms': round(pool.wait_max * 1000, 2)
+        })
+    return stats
@@ -0,0 +1,147 @@
+from flask import current_app
+from sqlalchemy import event
+from app.models import db, Budget, Category, SavingsGoal, Transaction
+import json
+import re
+
+# Per-user tables that must only ever be reached through an index. The
+# users table is left out on purpose: /api/users lists everyone.
+WATCHED_TABLES = (
+    'transactions',
+    'categories',
+    'budgets',
+    'savings_goals',
+    'monthly_category_totals',
+    'resource_versions',
+    'jobs'
+)
+
+SQLITE_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)')
+
+
+def endpoint_requests(user_id):
+    """
+    The requests whose queries are checked, as (method, url, json body),
+    built around one of the user's existing rows of each kind.
+    """
+    category = Category.query.filter(Category.user_id == user_id).first()
+    budget = Budget.query.filter(Budget.user_id == user_id).first()
+    goal = SavingsGoal.query.filter(SavingsGoal.user_id == user_id).first()
+    transaction = Transaction.query.filter(Transaction.user_id == user_id).first()
+
+    requests = [
+        ('GET', '/api/auth/', None),
+        ('GET', '/api/categories', None),
+        ('GET', '/api/transactions', None),
+        ('GET', '/api/transactions?sort=amount&order=asc', None),
+        ('GET', '/api/transactions?type=expense&start_date=2000-01-01&end_date=2100-12-31', None),
+        ('GET', '/api/transactions?min_amount=10&max_amount=1000&sideload=categories', None),
+        ('GET', '/api/transactions/export?format=ndjson', None),
+        ('GET', '/api/transactions/search?q=rent', None),
+        ('GET', '/api/budgets', None),
+        ('GET', '/api/budgets?sideload=categories', None),
+        ('GET', '/api/budgets/status', None),
+        ('GET', '/api/savings', None),
+        ('GET', '/api/reports/monthly', None),
+        ('GET', '/api/reports/monthly?start=2000-01&end=2100-12', None),
+        ('GET', '/api/recurring/candidates', None),
+        ('GET', '/api/recurring/rules', None),
+        ('GET', '/api/jobs', None),
+    ]
+    if category:
+        requests += [
+            ('GET', f'/api/categories/{category.id}', None),
+            ('GET', f'/api/transactions?category_id={category.id}', None),
+        ]
+    if budget:
+        requests += [
+            ('GET', f'/api/budgets/{budget.id}', None),
+            ('GET', f'/api/budgets/status?month={budget.month}&year={budget.year}', None),
+            # Re-creating an existing budget runs the uniqueness check and
+            # is rejected before anything is written
+            ('POST', '/api/budgets', {
+                'category_id': budget.category_id,
+                'amount': float(budget.amount),
+                'month': budget.month,
+                'year': budget.year
+            }),
+        ]
+    if goal:
+        requests.append(('GET', f'/api/savings/{goal.id}', None))
+    if transaction:
+        requests.append(('GET', f'/api/transactions/{transaction.id}', None))
+    return requests
+
+
+def capture_queries(client, method, url, body):
+    # Runs one request and returns the SELECT statements it sent, with the
+    # parameters they were sent with
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(('SELECT', 'WITH')):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        response = client.open(url, method=method, json=body)
+        # Streamed responses only query while their body is read
+        response.get_data()
+        response.close()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    return response.status_code, statements
+
+
+def sqlite_full_scans(connection, statement, parameters):
+    rows = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters)
+    scans = []
+    for row in rows:
+        match = SQLITE_SCAN.match(row[-1])
+        if match and match.group(1) in WATCHED_TABLES:
+            scans.append(match.group(1))
+    return scans
+
+
+def postgresql_full_scans(connection, statement, parameters):
+    # With sequential scans priced out, the planner only picks one when no
+    # index can answer the query, so tiny test tables don't hide a regression
+    connection.exec_driver_sql('SET LOCAL enable_seqscan = off')
+    plan = connection.exec_driver_sql(f'EXPLAIN (FORMAT JSON) {statement}', parameters).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    scans = []
+    nodes = [plan[0]['Plan']]
+    while nodes:
+        node = nodes.pop()
+        if node['Node Type'] == 'Seq Scan' and node.get('Relation Name') in WATCHED_TABLES:
+            scans.append(node['Relation Name'])
+        nodes.extend(node.get('Plans', []))
+    return scans
+
+
+def check_query_plans(user_id):
+    """
+    Runs each checked endpoint as the given user, EXPLAINs every SELECT it
+    issued and yields (method, url, status, query count, full scans) where
+    full scans lists (table, statement) for each per-user table read
+    without an index.
+    """
+    dialect = db.engine.dialect.name
+    full_scans = postgresql_full_scans if dialect == 'postgresql' else sqlite_full_scans
+
+    client = current_app.test_client()
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user_id)
+        session['_fresh'] = True
+
+    for method, url, body in endpoint_requests(user_id):
+        status, statements = capture_queries(client, method, url, body)
+        scans = []
+        with db.engine.connect() as connection:
+            with connection.begin() as transaction:
+                for statement, parameters in statements:
+                    scans += [(table, statement) for table in full_scans(connection, statement, parameters)]
+                transaction.rollback()
+        yield method, url, status, len(statements), scans
@@ -0,0 +1,300 @@
+from app.models import (
+    db, User, Transaction, RecurringCandidate, RecurringRule, MonthlyCategoryTotal, ResourceVersion
+)
+from app.scheduler import scheduler
+from flask import current_app
+from sqlalchemy.dialects import postgresql, sqlite
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+import calendar
+import re
+import time
+import numpy as np
+
+# (name, period in days, tolerance in days, gaps for full confidence)
+CADENCES = (
+    ('weekly', 7, 1, 8),
+    ('biweekly', 14, 2, 6),
+    ('monthly', 365.25 / 12, 3, 5),
+    ('yearly', 365.25, 10, 2),
+)
+# Amounts within a band differ by at most this ratio
+AMOUNT_BAND = 1.25
+MIN_OCCURRENCES = 3
+MIN_YEARLY_OCCURRENCES = 2
+DEFAULT_MIN_CONFIDENCE = 0.5
+# A series whose next occurrence is this many periods overdue has stopped
+STALE_PERIODS = 2
+DEFAULT_BATCH_SIZE = 500
+# Occurrences per multi-row INSERT ... RETURNING when materializing
+MATERIALIZE_BATCH_SIZE = 1000
+
+NON_WORD = re.compile(r'[^a-z]+')
+
+
+def normalize_description(description):
+    # 'NETFLIX.COM #4521' and 'Netflix.com 4522' both become 'netflix com'
+    return NON_WORD.sub(' ', description.lower()).strip()
+
+
+def load_columns(user_ids):
+    """
+    The transactions of the given users as parallel arrays, from one query:
+    user, category, expense flag, description code, amount and day number,
+    plus the original description of each row.
+    """
+    rows = db.session.connection().execute(db.select(
+        Transaction.user_id,
+        Transaction.category_id,
+        Transaction.type,
+        Transaction.description,
+        db.cast(Transaction.amount, db.Float),
+        Transaction.transaction_date
+    ).where(Transaction.user_id.in_(list(user_ids)))).all()
+
+    codes = {}
+    descriptions = []
+    description_codes = []
+    days = []
+    for row in rows:
+        descriptions.append(row[3])
+        description_codes.append(codes.setdefault(normalize_description(row[3]), len(codes)))
+        days.append(row[5].toordinal())
+
+    return {
+        'user_ids': np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows)),
+        'category_ids': np.fromiter((row[1] for row in rows), dtype=np.int64, count=len(rows)),
+        'is_expense': np.fromiter((row[2] == 'expense' for row in rows), dtype=bool, count=len(rows)),
+        'description_codes': np.array(description_codes, dtype=np.int64),
+        'amounts': np.fromiter((row[4] for row in rows), dtype=float, count=len(rows)),
+        'days': np.array(days, dtype=np.int64),
+        'descriptions': descriptions,
+    }
+
+
+def next_occurrence(last, cadence, period):
+    if cadence == 'monthly':
+        year, month = divmod(last.year * 12 + last.month, 12)
+        return date(year, month + 1, min(last.day, calendar.monthrange(year, month + 1)[1]))
+    if cadence == 'yearly':
+        day = min(last.day, calendar.monthrange(last.year + 1, last.month)[1])
+        return date(last.year + 1, last.month, day)
+    return last + timedelta(days=period)
+
+
+def detect(columns, today=None, min_confidence=DEFAULT_MIN_CONFIDENCE):
+    """
+    Finds recurring series in the given columns (see load_columns), for
+    all of their users at once. Transactions are grouped by user, category,
+    type, normalized description and amount band; each group's cadence is
+    the one matching the median gap between its dates. Confidence is the
+    share of gaps that fit the cadence, discounted for amount variation and
+    for short histories. Returns RecurringCandidate rows as dicts.
+    """
+    today = today or date.today()
+    if len(columns['days']) == 0:
+        return []
+
+    amounts = columns['amounts']
+    bands = np.floor(np.log(np.maximum(amounts, 0.01)) / np.log(AMOUNT_BAND)).astype(np.int64)
+    order = np.lexsort((
+        columns['days'], bands, columns['description_codes'], columns['is_expense'],
+        columns['category_ids'], columns['user_ids']
+    ))
+    keys = [columns[name][order] for name in ('user_ids', 'category_ids', 'is_expense', 'description_codes')]
+    keys.append(bands[order])
+    days = columns['days'][order]
+    amounts = amounts[order]
+
+    # Rows are sorted by group, then date; a group starts where a key changes
+    same = np.ones(len(days) - 1, dtype=bool)
+    for key in keys:
+        same &= key[1:] == key[:-1]
+    starts = np.concatenate(([True], ~same))
+    group = np.cumsum(starts) - 1
+    groups = group[-1] + 1
+    counts = np.bincount(group, minlength=groups)
+
+    # Gaps between consecutive dates of the same group
+    gaps = (days[1:] - days[:-1])[same].astype(float)
+    gap_group = group[1:][same]
+    gap_counts = np.bincount(gap_group, minlength=groups)
+
+    # Median gap per group: sort gaps within their group and take the middle
+    gap_order = np.lexsort((gaps, gap_group))
+    sorted_gaps = gaps[gap_order]
+    gap_starts = np.concatenate(([0], np.cumsum(gap_counts)[:-1]))
+    has_gaps = gap_counts > 0
+    low = gap_starts + np.maximum(gap_counts - 1, 0) // 2
+    high = gap_starts + gap_counts // 2
+    median = np.zeros(groups)
+    median[has_gaps] = (sorted_gaps[low[has_gaps]] + sorted_gaps[high[has_gaps]]) / 2
+
+    # Cadence whose period the median gap falls within
+    periods = np.array([period for _, period, _, _ in CADENCES])
+    tolerances = np.array([tolerance for _, _, tolerance, _ in CADENCES])
+    full_gaps = np.array([full for _, _, _, full in CADENCES])
+    matches = np.abs(median[:, None] - periods) <= tolerances
+    cadence = np.where(matches.any(axis=1), matches.argmax(axis=1), -1)
+    matched = cadence >= 0
+    cadence_index = np.maximum(cadence, 0)
+
+    # Share of each group's gaps within tolerance of its period
+    gap_cadence = cadence_index[gap_group]
+    fits = np.abs(gaps - periods[gap_cadence]) <= tolerances[gap_cadence]
+    regularity = np.divide(
+        np.bincount(gap_group, weights=fits, minlength=groups), gap_counts,
+        out=np.zeros(groups), where=has_gaps
+    )
+
+    sums = np.bincount(group, weights=amounts, minlength=groups)
+    squares = np.bincount(group, weights=amounts * amounts, minlength=groups)
+    means = sums / counts
+    spread = np.sqrt(np.maximum(squares / counts - means ** 2, 0)) / np.maximum(means, 0.01)
+    history = np.minimum(gap_counts / full_gaps[cadence_index], 1)
+    confidence = regularity * (1 - np.minimum(spread, 1)) * history
+
+    first_rows = np.flatnonzero(starts)
+    last_rows = np.concatenate((first_rows[1:] - 1, [len(days) - 1]))
+    minimum = np.where(cadence_index == len(CADENCES) - 1, MIN_YEARLY_OCCURRENCES, MIN_OCCURRENCES)
+    active = days[last_rows] + periods[cadence_index] * STALE_PERIODS >= today.toordinal()
+    selected = np.flatnonzero(matched & (counts >= minimum) & active & (confidence >= min_confidence))
+
+    candidates = []
+    for n in selected:
+        name, period, _, _ = CADENCES[cadence[n]]
+        last_row = last_rows[n]
+        last = date.fromordinal(int(days[last_row]))
+        candidates.append({
+            'user_id': int(keys[0][last_row]),
+            'category_id': int(keys[1][last_row]),
+            'type': 'expense' if keys[2][last_row] else 'income',
+            'description': columns['descriptions'][order[last_row]],
+            'cadence': name,
+            'amount': Decimal(f'{means[n]:.2f}'),
+            'occurrences': int(counts[n]),
+            'first_date': date.fromordinal(int(days[first_rows[n]])),
+            'last_date': last,
+            'next_date': next_occurrence(last, name, period),
+            'confidence': round(float(confidence[n]), 3),
+        })
+    return candidates
+
+
+def detect_users(user_ids, today=None, min_confidence=DEFAULT_MIN_CONFIDENCE):
+    # Detects and stores the candidates of the given users. Does not commit.
+    candidates = detect(load_columns(user_ids), today, min_confidence)
+    RecurringCandidate.replace(user_ids, candidates)
+    return candidates
+
+
+def detect_all(batch_size=DEFAULT_BATCH_SIZE, time_budget=None, after_user_id=0,
+               min_confidence=DEFAULT_MIN_CONFIDENCE):
+    """
+    Runs detection over every user with an id above after_user_id, in
+    batches of batch_size users with one query and one vectorized pass
+    each, committing after every batch. No batch is started once
+    time_budget seconds have passed. Yields (last user id, users,
+    candidates) per batch, so a run that ran out of time can be resumed
+    from the last user id.
+    """
+    start = time.monotonic()
+    today = date.today()
+    while time_budget is None or time.monotonic() - start < time_budget:
+        user_ids = [user_id for user_id, in db.session.query(User.id).filter(
+            User.id > after_user_id
+        ).order_by(User.id).limit(batch_size)]
+        if not user_ids:
+            return
+        candidates = detect_users(user_ids, today, min_confidence)
+        db.session.commit()
+        after_user_id = user_ids[-1]
+        yield after_user_id, len(user_ids), len(candidates)
+
+
+def materialize(through=None):
+    """
+    Creates the transactions of every rule occurrence due on or before
+    `through` (default today) for all users, then updates the rollup and
+    resource versions, and moves each rule's next_date past `through`.
+    Idempotent: the unique index on (recurring_rule_id, transaction_date)
+    makes an occurrence that was already inserted a no-op, and the rollup
+    only counts the rows that were actually inserted, so re-runs and
+    overlapping runs never count an occurrence twice. Due rules are also
+    locked while they are read on PostgreSQL. Does not commit. Returns the
+    number of transactions written.
+    """
+    through = through or date.today()
+    rules = RecurringRule.query.filter(
+        RecurringRule.next_date <= through,
+        db.or_(RecurringRule.end_date.is_(None), RecurringRule.next_date <= RecurringRule.end_date)
+    ).order_by(RecurringRule.id).with_for_update().all()
+
+    rows = []
+    for rule in rules:
+        for day in rule.occurrences(rule.next_date, through):
+            rows.append({
+                'user_id': rule.user_id,
+                'category_id': rule.category_id,
+                'amount': rule.amount,
+                'description': rule.description,
+                'type': rule.type,
+                'transaction_date': day,
+                'recurring_rule_id': rule.id
+            })
+        rule.next_date = rule.following(through)
+
+    inserted = insert_occurrences(rows)
+    if inserted:
+        rollup_deltas = {}
+        for row in inserted:
+            MonthlyCategoryTotal.add_delta(
+                rollup_deltas, row['user_id'], row['category_id'], row['transaction_date'],
+                row['type'], row['amount']
+            )
+        MonthlyCategoryTotal.apply_deltas(rollup_deltas)
+        ResourceVersion.bump_users(sorted({row['user_id'] for row in inserted}), 'transactions')
+    db.session.flush()
+    return len(inserted)
+
+
+def insert_occurrences(rows):
+    """
+    Inserts occurrence rows, skipping any whose (recurring_rule_id,
+    transaction_date) already exists, and returns the rows that were
+    inserted. PostgreSQL sends multi-row INSERT ... RETURNING statements;
+    SQLAlchemy does not support RETURNING on SQLite, where rows go one at
+    a time and the row count tells whether each was new (SQLite has a
+    single writer, so no other run can insert in between).
+    """
+    if not rows:
+        return []
+    table = Transaction.__table__
+    now = datetime.utcnow()
+    rows = [{**row, 'created_at': now, 'updated_at': now} for row in rows]
+
+    if db.session.get_bind().dialect.name == 'postgresql':
+        inserted = []
+        for start in range(0, len(rows), MATERIALIZE_BATCH_SIZE):
+            stmt = postgresql.insert(table).values(rows[start:start + MATERIALIZE_BATCH_SIZE]).on_conflict_do_nothing(
+                index_elements=[table.c.recurring_rule_id, table.c.transaction_date]
+            ).returning(table.c.user_id, table.c.category_id, table.c.transaction_date, table.c.type, table.c.amount)
+            inserted += [dict(row._mapping) for row in db.session.execute(stmt)]
+        return inserted
+
+    stmt = sqlite.insert(table).on_conflict_do_nothing(
+        index_elements=[table.c.recurring_rule_id, table.c.transaction_date]
+    )
+    return [row for row in rows if db.session.execute(stmt, row).rowcount == 1]
+
+
+@scheduler.job('recurring.materialize', 'RECURRING_MATERIALIZE_INTERVAL')
+def scheduled_materialize():
+    materialize()
+    db.session.commit()
+
+
+@scheduler.job('recurring.detect', 'RECURRING_DETECT_INTERVAL')
+def scheduled_detect():
+    for _ in detect_all(time_budget=current_app.config['RECURRING_DETECT_TIME_BUDGET']):
+        pass
@@ -0,0 +1,90 @@
+from app.models import ScheduledJob
+from sqlalchemy.exc import OperationalError
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class Scheduler:
+    """
+    Runs registered jobs every so many seconds on a daemon thread of the
+    web process, each inside an app context, for deployments without
+    cron. Off unless SCHEDULER_ENABLED is set. The thread starts with the
+    first request, so CLI commands (migrations included) never start it.
+
+    Every process that serves requests runs a scheduler thread, but when
+    each job is next due is kept in the scheduled_jobs table: every
+    SCHEDULER_POLL_INTERVAL seconds each thread tries to claim the jobs
+    that are due, and only the one that moves a job's next run forward
+    runs it. So a job runs once per interval across all workers, and
+    worker restarts neither delay nor repeat it. A run that dies part way
+    is not retried before its next interval, so jobs must still be safe
+    to run again.
+    """
+
+    def __init__(self):
+        self.jobs = []
+        self.app = None
+        self.thread = None
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+
+    def init_app(self, app):
+        self.app = app
+        if app.config.get('SCHEDULER_ENABLED'):
+            app.before_request(self.start)
+
+    def job(self, name, interval):
+        # Registers the decorated function to run every `interval` seconds
+        def decorator(func):
+            self.jobs.append({'name': name, 'interval': interval, 'func': func})
+            return func
+        return decorator
+
+    def start(self):
+        if self.thread is not None:
+            return
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name='scheduler', daemon=True)
+                self.thread.start()
+
+    def stop(self):
+        self.stopping.set()
+
+    def run(self):
+        while not self.stopping.is_set():
+            for job in self.jobs:
+                if self.claim(job):
+                    self.run_job(job)
+            self.stopping.wait(self.app.config['SCHEDULER_POLL_INTERVAL'])
+
+    def claim(self, job):
+        try:
+            with self.app.app_context():
+                return ScheduledJob.claim(job['name'], self.interval(job))
+        except OperationalError:
+            # SQLite is locked while another writer commits; try next poll
+            logger.debug('Scheduled job %s not claimed: database busy', job['name'])
+            return False
+
+    def interval(self, job):
+        # Intervals may name a config setting so deployments can tune them
+        interval = job['interval']
+        return float(self.app.config[interval] if isinstance(interval, str) else interval)
+
+    def run_job(self, job):
+        start = time.perf_counter()
+        try:
+            with self.app.app_context():
+                job['func']()
+                ScheduledJob.finished(job['name'])
+        except Exception:
+            logger.exception('Scheduled job %s failed', job['name'])
+        else:
+            logger.info('Scheduled job %s finished in %.1fs', job['name'], time.perf_counter() - start)
+
+
+scheduler = Scheduler()
@@ -4,8 +4,12 @@ from .categories import seed_categories, undo_categories
 from .transactions import seed_transactions, undo_transactions
 from .budgets import seed_budgets, undo_budgets
 from .savings import seed_savings_goals, undo_savings_goals
+from .bulk import seed_bulk, reset_all
+import click
+import time
 
 from app.models.db import db, environment, SCHEMA
+from app.models import MonthlyCategoryTotal, CacheEpoch
 
 # Creates a seed group to hold our commands
 # So we can type `flask seed --help`
@@ -26,6 +30,7 @@ def seed():
     seed_budgets()
     # Add other seed functions here
     seed_savings_goals()
+    seed_rollups()
 
 # Creates the `flask seed undo` command
 @seed_commands.command('undo')
@@ -36,22 +41,74 @@ def undo():
     undo_users()
     # Add other undo functions here
     undo_savings_goals()
+    advance_cache_epoch()
+
+# Seeded transactions bypass the API, so derive their rollup rows here
+def seed_rollups():
+    MonthlyCategoryTotal.rebuild()
+    advance_cache_epoch()
+
+
+# Seeds write behind the API, without bumping resource versions, so
+# retire every ETag (and cached response) issued before them
+def advance_cache_epoch():
+    CacheEpoch.advance()
+    db.session.commit()
+
 
 # Individual seed commands
 @seed_commands.command('categories')
 def seed_cats():
     seed_categories()
+    advance_cache_epoch()
 
 
 @seed_commands.command('transactions')
 def seed_trans():
     seed_transactions()
+    seed_rollups()
 
 
 @seed_commands.command('budgets')
 def seed_budg():
     seed_budgets()
-    
+    advance_cache_epoch()
+
+
 @seed_commands.command('savings')
 def seed_save():
-    seed_savings_goals()
\ No newline at end of file
+    seed_savings_goals()
+    advance_cache_epoch()
+
+
+# Creates the `flask seed bulk` command for large, randomized datasets
+@seed_commands.command('bulk')
+@click.option('--users', type=int, default=10, show_default=True, help='Users to add.')
+@click.option('--transactions-per-user', type=int, default=10000, show_default=True)
+@click.option('--years', type=int, default=3, show_default=True, help='Years of history per user.')
+@click.option('--seed', type=int, default=0, show_default=True, help='Random seed; the same seed gives the same data.')
+@click.option('--reset', is_flag=True, help='Empty every table first.')
+@click.option('--yes', is_flag=True, help='Allow --reset in production.')
+def seed_bulk_data(users, transactions_per_user, years, seed, reset, yes):
+    start = time.perf_counter()
+    if reset:
+        guard_reset(yes)
+        reset_all()
+    counts = seed_bulk(users, transactions_per_user, years, seed)
+    click.echo(', '.join(f'{count} {table}' for table, count in counts.items())
+               + f' added in {time.perf_counter() - start:.1f}s')
+
+
+def guard_reset(yes):
+    # Emptying every table is for local and benchmark databases; production
+    # needs it asked for explicitly
+    if environment == 'production' and not yes:
+        raise click.ClickException('Refusing to empty every table in production without --yes')
+
+
+# Creates the `flask seed reset` command, which empties every table
+@seed_commands.command('reset')
+@click.option('--yes', is_flag=True, help='Allow it in production.')
+def reset(yes):
+    guard_reset(yes)
+    reset_all()
@@ -0,0 +1,223 @@
+from app.models import db, User, Category, Transaction, Budget, SavingsGoal, MonthlyCategoryTotal, CacheEpoch
+from werkzeug.security import generate_password_hash
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+import csv
+import io
+import random
+
+CHUNK_SIZE = 10000
+SAVINGS_GOALS_PER_USER = 5
+
+# Every bulk user gets these categories. The weight is how often a
+# transaction falls in the category, the amount is its typical size.
+# (name, type, weight, typical amount)
+CATEGORIES = [
+    ('Salary', 'income', 2, 3000),
+    ('Freelance', 'income', 2, 600),
+    ('Interest', 'income', 1, 20),
+    ('Groceries', 'expense', 30, 80),
+    ('Rent', 'expense', 2, 1500),
+    ('Utilities', 'expense', 4, 120),
+    ('Transportation', 'expense', 20, 40),
+    ('Dining Out', 'expense', 20, 35),
+    ('Entertainment', 'expense', 8, 50),
+    ('Healthcare', 'expense', 3, 90),
+    ('Shopping', 'expense', 10, 70),
+    ('Savings', 'expense', 2, 300),
+]
+DESCRIPTIONS = {
+    'Salary': ['Monthly salary', 'Payroll'],
+    'Freelance': ['Client invoice', 'Consulting'],
+    'Interest': ['Account interest'],
+    'Groceries': ['Supermarket', 'Farmers market', 'Corner shop'],
+    'Rent': ['Rent'],
+    'Utilities': ['Electricity', 'Water', 'Internet', 'Phone'],
+    'Transportation': ['Fuel', 'Bus pass', 'Taxi', 'Parking'],
+    'Dining Out': ['Restaurant', 'Coffee', 'Takeaway'],
+    'Entertainment': ['Cinema', 'Concert', 'Streaming'],
+    'Healthcare': ['Pharmacy', 'Dentist', 'GP visit'],
+    'Shopping': ['Clothes', 'Electronics', 'Household'],
+    'Savings': ['Transfer to savings'],
+}
+
+
+def copy_rows(table, rows):
+    # Streams rows into PostgreSQL with COPY, CHUNK_SIZE rows per statement,
+    # on the session's connection so it shares the session's transaction
+    columns = None
+    cursor = db.session.connection().connection.cursor()
+    chunk = io.StringIO()
+    writer = csv.writer(chunk)
+    count = 0
+
+    def flush():
+        chunk.seek(0)
+        cursor.copy_expert(
+            f'COPY {table.fullname} ({", ".join(columns)}) FROM STDIN WITH (FORMAT csv)', chunk
+        )
+        chunk.seek(0)
+        chunk.truncate()
+
+    for row in rows:
+        if columns is None:
+            columns = list(row)
+        # Empty unquoted fields are read back as NULL
+        writer.writerow(['' if row[column] is None else row[column] for column in columns])
+        count += 1
+        if count % CHUNK_SIZE == 0:
+            flush()
+    if count % CHUNK_SIZE:
+        flush()
+    cursor.close()
+
+
+def insert_rows(table, rows):
+    # Multi-row executemany inserts, CHUNK_SIZE rows per statement
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= CHUNK_SIZE:
+            db.session.execute(table.insert(), batch)
+            batch.clear()
+    if batch:
+        db.session.execute(table.insert(), batch)
+
+
+def bulk_insert(table, rows):
+    if db.session.get_bind().dialect.name == 'postgresql':
+        copy_rows(table, rows)
+    else:
+        insert_rows(table, rows)
+
+
+def next_id(model):
+    return (db.session.query(db.func.max(model.id)).scalar() or 0) + 1
+
+
+def sync_sequences(*models):
+    # Rows were given explicit ids, so move PostgreSQL's id sequences past
+    # them; SQLite picks max(id) + 1 on its own
+    if db.session.get_bind().dialect.name != 'postgresql':
+        return
+    for model in models:
+        table = model.__table__.fullname
+        db.session.execute(db.text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"(SELECT COALESCE(MAX(id), 1) FROM {table}))"
+        ))
+
+
+def seed_bulk(users, transactions_per_user, years=3, seed=0):
+    """
+    Adds users with randomized but reproducible ledgers: the standard
+    categories, a budget per expense category and month, a few savings
+    goals and transactions_per_user transactions spread over the last
+    `years` years. Existing rows are kept. Commits, and returns the number
+    of rows added per table.
+    """
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    end = date.today()
+    start = end - timedelta(days=365 * years)
+    days = (end - start).days
+    months = [
+        (year, month) for year in range(start.year, end.year + 1) for month in range(1, 13)
+        if (start.year, start.month) <= (year, month) <= (end.year, end.month)
+    ]
+    # One hash for every bulk user; hashing per user would dominate the run
+    password = generate_password_hash('password')
+
+    first_user_id = next_id(User)
+    user_ids = range(first_user_id, first_user_id + users)
+    bulk_insert(User.__table__, (
+        {'id': user_id, 'username': f'bulk{user_id}', 'email': f'bulk{user_id}@aa.io',
+         'hashed_password': password, 'created_at': now, 'updated_at': now}
+        for user_id in user_ids
+    ))
+
+    category_id = next_id(Category)
+    categories = {}
+    for user_id in user_ids:
+        for name, type, weight, amount in CATEGORIES:
+            categories.setdefault(user_id, []).append((category_id, name, type, amount))
+            category_id += 1
+    bulk_insert(Category.__table__, (
+        {'id': id, 'user_id': user_id, 'name': name, 'description': None,
+         'created_at': now, 'updated_at': now}
+        for user_id in user_ids
+        for id, name, type, amount in categories[user_id]
+    ))
+
+    bulk_insert(Budget.__table__, (
+        {'user_id': user_id, 'category_id': id, 'amount': Decimal(amount * 10),
+         'year': year, 'month': month, 'created_at': now, 'updated_at': now}
+        for user_id in user_ids
+        for id, name, type, amount in categories[user_id] if type == 'expense'
+        for year, month in months
+    ))
+
+    bulk_insert(SavingsGoal.__table__, (
+        {'user_id': user_id, 'name': f'Goal {n + 1}',
+         'target_amount': Decimal(rng.randrange(1000, 20000, 100)),
+         'current_amount': Decimal(rng.randrange(0, 1000, 10)),
+         'target_date': end + timedelta(days=rng.randint(90, 1500)),
+         'description': None, 'created_at': now, 'updated_at': now}
+        for user_id in user_ids
+        for n in range(SAVINGS_GOALS_PER_USER)
+    ))
+
+    cum_weights = []
+    for _, _, weight, _ in CATEGORIES:
+        cum_weights.append((cum_weights[-1] if cum_weights else 0) + weight)
+
+    def transactions():
+        for user_id in user_ids:
+            for _ in range(transactions_per_user):
+                id, name, type, amount = rng.choices(categories[user_id], cum_weights=cum_weights)[0]
+                # Amounts are skewed like real spending: mostly near the
+                # typical size with the occasional large one
+                amount = max(amount * rng.lognormvariate(0, 0.5), 1)
+                yield {
+                    'user_id': user_id,
+                    'category_id': id,
+                    'amount': Decimal(f'{amount:.2f}'),
+                    'description': rng.choice(DESCRIPTIONS[name]),
+                    'type': type,
+                    'transaction_date': start + timedelta(days=rng.randrange(days + 1)),
+                    'created_at': now,
+                    'updated_at': now
+                }
+
+    bulk_insert(Transaction.__table__, transactions())
+    sync_sequences(User, Category)
+    MonthlyCategoryTotal.rebuild()
+    CacheEpoch.advance()
+    db.session.commit()
+
+    expense_categories = sum(1 for _, type, _, _ in CATEGORIES if type == 'expense')
+    return {
+        'users': users,
+        'categories': users * len(CATEGORIES),
+        'budgets': users * expense_categories * len(months),
+        'savings_goals': users * SAVINGS_GOALS_PER_USER,
+        'transactions': users * transactions_per_user
+    }
+
+
+def reset_all():
+    """
+    Empties every application table in one statement on PostgreSQL
+    (TRUNCATE ... RESTART IDENTITY CASCADE), or with one DELETE per table,
+    children first, on SQLite. The cache epoch is kept, and advanced, so
+    no ETag from before the reset matches again. Commits.
+    """
+    tables = [table for table in reversed(db.metadata.sorted_tables) if table is not CacheEpoch.__table__]
+    if db.session.get_bind().dialect.name == 'postgresql':
+        names = ', '.join(table.fullname for table in tables)
+        db.session.execute(db.text(f'TRUNCATE TABLE {names} RESTART IDENTITY CASCADE'))
+    else:
+        for table in tables:
+            db.session.execute(table.delete())
+    CacheEpoch.advance()
+    db.session.commit()
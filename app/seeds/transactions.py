@@ -1,4 +1,4 @@
-from app.models import db, Transaction, environment, SCHEMA
+from app.models import db, Transaction, MonthlyCategoryTotal, environment, SCHEMA
 from datetime import datetime, date, timedelta
 
 # Adds sample transactions
@@ -69,10 +69,13 @@ def seed_transactions():
     db.session.commit()
 
 # SQL query to TRUNCATE the transactions table.
+# The monthly rollup is derived from transactions, so it goes with them.
 def undo_transactions():
     if environment == "production":
+        db.session.execute(f"TRUNCATE table {SCHEMA}.monthly_category_totals;")
         db.session.execute(f"TRUNCATE table {SCHEMA}.transactions RESTART IDENTITY CASCADE;")
     else:
+        db.session.execute("DELETE FROM monthly_category_totals")
         db.session.execute("DELETE FROM transactions")
         
     db.session.commit()
\ No newline at end of file
@@ -0,0 +1,238 @@
+"""
+Latency, query count and memory benchmark for the API, run through Flask's
+test client against a synthetic SQLite dataset at one or more sizes.
+
+    python benchmarks/api_latency.py
+    python benchmarks/api_latency.py --sizes 1k 100k 1m --requests 100 --output bench.json
+
+Sizes are total transaction counts (e.g. 1k, 100k, 1m or 2500), loaded
+with the same generator as `flask seed bulk`; the requests are made as the
+first user, who holds 1/--users of them. Writes
+a JSON report with one entry per size and endpoint: latency percentiles
+over --requests timed calls, queries per call, and the peak memory traced
+while serving one call. The response cache is off unless --cache is
+given, so repeated calls measure the database path.
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+DATABASE = os.path.join(tempfile.mkdtemp(), 'api_latency.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{DATABASE}'
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+os.environ['OPS_TOKEN'] = 'benchmark'
+if '--cache' not in sys.argv:
+    os.environ['CACHE_BACKEND'] = 'null'
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sqlalchemy import event  # noqa: E402
+from app import app  # noqa: E402
+from app.models import db, Budget, Category, SavingsGoal, Transaction  # noqa: E402
+from app.seeds.bulk import seed_bulk  # noqa: E402
+
+SIZE_SUFFIXES = {'k': 1000, 'm': 1000000}
+
+
+def parse_size(size):
+    # '1k' -> 1000, '1m' -> 1000000, '2500' -> 2500
+    size = size.lower()
+    if size[-1:] in SIZE_SUFFIXES:
+        return int(float(size[:-1]) * SIZE_SUFFIXES[size[-1]])
+    return int(size)
+
+
+def endpoints(user_id):
+    """
+    (name, method, url, json body) for every blueprint's main routes, built
+    around rows the benchmarked user owns
+    """
+    category = Category.query.filter(Category.user_id == user_id).first()
+    budget = Budget.query.filter(Budget.user_id == user_id).order_by(Budget.year.desc(), Budget.month.desc()).first()
+    goal = SavingsGoal.query.filter(SavingsGoal.user_id == user_id).first()
+    transaction = Transaction.query.filter(Transaction.user_id == user_id).first()
+
+    client = app.test_client()
+    login(client, user_id)
+    cursor = client.get('/api/transactions?limit=50').get_json()['next_cursor']
+
+    return [
+        ('auth.authenticate', 'GET', '/api/auth/', None),
+        ('users.user', 'GET', f'/api/users/{user_id}', None),
+        ('categories.list', 'GET', '/api/categories', None),
+        ('categories.get', 'GET', f'/api/categories/{category.id}', None),
+        ('transactions.list', 'GET', '/api/transactions', None),
+        ('transactions.list_page_2', 'GET', f'/api/transactions?limit=50&cursor={cursor}', None),
+        ('transactions.list_by_amount', 'GET', '/api/transactions?sort=amount&order=asc', None),
+        ('transactions.list_filtered', 'GET',
+         f'/api/transactions?category_id={category.id}&type={"income" if category.name == "Salary" else "expense"}'
+         '&min_amount=10&max_amount=5000', None),
+        ('transactions.list_sideload', 'GET', '/api/transactions?sideload=categories', None),
+        ('transactions.get', 'GET', f'/api/transactions/{transaction.id}', None),
+        ('transactions.export_csv', 'GET', '/api/transactions/export?format=csv', None),
+        ('transactions.create', 'POST', '/api/transactions', {
+            'category_id': category.id, 'amount': 12.5, 'description': 'Benchmark',
+            'type': 'income' if category.name == 'Salary' else 'expense',
+            'transaction_date': transaction.transaction_date.isoformat()
+        }),
+        ('transactions.update', 'PUT', f'/api/transactions/{transaction.id}', {'description': 'Benchmark'}),
+        ('budgets.list', 'GET', '/api/budgets', None),
+        ('budgets.get', 'GET', f'/api/budgets/{budget.id}', None),
+        ('budgets.status', 'GET', '/api/budgets/status', None),
+        ('budgets.status_month', 'GET', f'/api/budgets/status?month={budget.month}&year={budget.year}', None),
+        ('savings.list', 'GET', '/api/savings', None),
+        ('savings.get', 'GET', f'/api/savings/{goal.id}', None),
+        ('reports.monthly', 'GET', '/api/reports/monthly', None),
+        ('ops.cache', 'GET', '/api/ops/cache', None),
+        ('ops.pool', 'GET', '/api/ops/pool', None),
+    ]
+
+
+def login(client, user_id):
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user_id)
+        session['_fresh'] = True
+    # For the ops endpoints
+    client.environ_base['HTTP_AUTHORIZATION'] = f"Bearer {os.environ['OPS_TOKEN']}"
+
+
+def call(client, method, url, body):
+    response = client.open(url, method=method, json=body)
+    # Read streamed bodies so their queries are part of the call
+    response.get_data()
+    response.close()
+    if method == 'POST' and response.status_code == 201:
+        # Undo creates untimed so every call sees the same data
+        client.delete(f"{url}/{response.get_json()['id']}")
+    return response.status_code
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+
+def run_endpoint(client, method, url, body, requests, warmup):
+    queries = []
+
+    def count_query(*args):
+        queries.append(1)
+
+    for _ in range(warmup):
+        call(client, method, url, body)
+
+    timings = []
+    counts = []
+    for _ in range(requests):
+        del queries[:]
+        event.listen(db.engine, 'before_cursor_execute', count_query)
+        start = time.perf_counter()
+        response = client.open(url, method=method, json=body)
+        response.get_data()
+        response.close()
+        timings.append((time.perf_counter() - start) * 1000)
+        event.remove(db.engine, 'before_cursor_execute', count_query)
+        counts.append(len(queries))
+        status = response.status_code
+        if method == 'POST' and status == 201:
+            # Undo creates outside the timing so every call sees the same data
+            client.delete(f"{url}/{response.get_json()['id']}")
+
+    # Trace one more call on its own; tracing slows everything down too
+    # much to run alongside the timed calls
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    call(client, method, url, body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'status': status,
+        'requests': requests,
+        'p50_ms': round(percentile(timings, 50), 3),
+        'p95_ms': round(percentile(timings, 95), 3),
+        'p99_ms': round(percentile(timings, 99), 3),
+        'mean_ms': round(sum(timings) / len(timings), 3),
+        'queries': max(counts),
+        'peak_memory_kib': round(peak / 1024, 1)
+    }
+
+
+def run_size(size, transactions, args):
+    with app.app_context():
+        db.engine.dispose()
+        if os.path.exists(DATABASE):
+            os.remove(DATABASE)
+        db.create_all()
+        start = time.perf_counter()
+        rows = seed_bulk(args.users, transactions // args.users, args.years, args.seed)
+        print(f'{size}: generated {rows} in {time.perf_counter() - start:.1f}s', file=sys.stderr)
+
+        user_id = 1
+        client = app.test_client()
+        login(client, user_id)
+        results = []
+        for name, method, url, body in endpoints(user_id):
+            result = run_endpoint(client, method, url, body, args.requests, args.warmup)
+            print(f'{size} {name}: p50 {result["p50_ms"]}ms, p99 {result["p99_ms"]}ms, '
+                  f'{result["queries"]} queries', file=sys.stderr)
+            results.append({'size': size, 'endpoint': name, 'method': method, **result})
+        return {'size': size, 'rows': rows, 'results': results}
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], cwd=ROOT, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', nargs='+', default=['1k', '100k'])
+    parser.add_argument('--users', type=int, default=5)
+    parser.add_argument('--years', type=int, default=3)
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--warmup', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--cache', action='store_true', help='Keep the response cache on')
+    parser.add_argument('--output', help='Write the JSON report here instead of stdout')
+    args = parser.parse_args()
+    try:
+        sizes = [(size, parse_size(size)) for size in args.sizes]
+    except ValueError:
+        parser.error('sizes must be numbers, optionally suffixed with k or m')
+
+    report = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'settings': {
+            'users': args.users, 'years': args.years, 'requests': args.requests,
+            'warmup': args.warmup, 'seed': args.seed, 'cache': args.cache
+        },
+        'sizes': [
+            run_size(size, transactions, args)
+            for size, transactions in sizes
+        ]
+    }
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
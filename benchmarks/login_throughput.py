@@ -0,0 +1,84 @@
+"""
+Measures login throughput through the real /api/auth/login route against a
+throwaway SQLite database, once per password hash method.
+
+    python benchmarks/login_throughput.py
+    python benchmarks/login_throughput.py --logins 200 \\
+        --methods pbkdf2:sha256:260000 pbkdf2:sha256:600000 pbkdf2:sha512:260000
+
+Methods are whatever the installed werkzeug's generate_password_hash takes
+(2.2 has pbkdf2 but not scrypt); an unsupported one is rejected up front.
+Prints one JSON line per method with logins/second and latency percentiles.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+DATABASE = os.path.join(tempfile.mkdtemp(), 'login_throughput.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{DATABASE}'
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app  # noqa: E402
+from app.models import db, User  # noqa: E402
+from app.models.user import stored_method  # noqa: E402
+
+EMAIL = 'benchmark@aa.io'
+PASSWORD = 'password'
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+
+def run(method, logins):
+    app.config['PASSWORD_HASH_METHOD'] = method
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        db.session.add(User(username='benchmark', email=EMAIL, password=PASSWORD))
+        db.session.commit()
+
+    client = app.test_client()
+    client.get('/api/auth/')  # sets the csrf_token cookie
+    timings = []
+    started = time.perf_counter()
+    for _ in range(logins):
+        start = time.perf_counter()
+        response = client.post('/api/auth/login', json={'email': EMAIL, 'password': PASSWORD})
+        timings.append((time.perf_counter() - start) * 1000)
+        if response.status_code != 200:
+            raise SystemExit(f'login failed with {response.status_code}: {response.get_data(as_text=True)}')
+    elapsed = time.perf_counter() - started
+
+    return {
+        'method': method,
+        'logins': logins,
+        'logins_per_second': round(logins / elapsed, 1),
+        'p50_ms': round(percentile(timings, 50), 2),
+        'p95_ms': round(percentile(timings, 95), 2),
+        'p99_ms': round(percentile(timings, 99), 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--logins', type=int, default=50)
+    parser.add_argument('--methods', nargs='+', default=[app.config['PASSWORD_HASH_METHOD']])
+    args = parser.parse_args()
+    for method in args.methods:
+        try:
+            stored_method(method)
+        except ValueError as e:
+            parser.error(f'--methods {method}: {e}')
+
+    for method in args.methods:
+        print(json.dumps(run(method, args.logins)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# Gunicorn settings for the production image, overridable from the
+# environment. Each worker process holds its own SQLAlchemy connection
+# pool, so keep threads per worker within DB_POOL_SIZE + DB_MAX_OVERFLOW
+# and workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) within DB_MAX_CONNECTIONS,
+# the connections the web workers may hold between them. Gunicorn refuses
+# to start with more workers than that allows.
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Threaded workers let a process keep serving while requests wait on the
+# database; 'sync' restores one request per process
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+
+# Postgres allows 100 connections by default; 90 leaves room for
+# migrations, cron commands and a psql session. The pool settings only
+# apply to PostgreSQL, so SQLite is not held to the budget.
+max_connections = int(os.environ.get('DB_MAX_CONNECTIONS', 90))
+connections_per_worker = int(os.environ.get('DB_POOL_SIZE', 5)) + int(os.environ.get('DB_MAX_OVERFLOW', 10))
+uses_pool = os.environ.get('DATABASE_URL', '').startswith('postgres')
+
+# Two per core, as gunicorn suggests, but no more than the budget allows
+workers = multiprocessing.cpu_count() * 2 + 1
+if uses_pool:
+    workers = max(1, min(workers, max_connections // connections_per_worker))
+workers = int(os.environ.get('WEB_CONCURRENCY', workers))
+if uses_pool and workers * connections_per_worker > max_connections:
+    raise RuntimeError(
+        f'{workers} workers with up to {connections_per_worker} connections each exceed '
+        f'DB_MAX_CONNECTIONS={max_connections}; lower WEB_CONCURRENCY or '
+        'DB_POOL_SIZE + DB_MAX_OVERFLOW, or raise DB_MAX_CONNECTIONS'
+    )
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+# Recycling workers every so many requests bounds slow memory growth, but
+# it is off by default: background jobs and the scheduler run on threads
+# inside the workers (app.jobs, app.scheduler), and a recycled worker
+# takes its running jobs with it (they are marked failed as interrupted
+# after JOB_STALE_AFTER). Only set it if that is acceptable.
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 0))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+# The app (and its engine) is loaded in each worker after the fork, so no
+# pooled connection is ever shared between processes
+preload_app = False
+
+accesslog = '-'
+errorlog = '-'
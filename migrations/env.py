@@ -77,6 +77,16 @@ def run_migrations_online():
                 directives[:] = []
                 logger.info('No changes in schema detected.')
 
+    # The full-text search objects are created by hand (see
+    # app/models/transaction_search.py) and are not in the metadata, so
+    # keep autogenerate from dropping them
+    def include_object(object, name, type_, reflected, compare_to):
+        if reflected and compare_to is None and name and (
+            name.startswith('transactions_fts') or name == 'ix_transactions_description_search'
+        ):
+            return False
+        return True
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section),
         prefix='sqlalchemy.',
@@ -88,6 +98,7 @@ def run_migrations_online():
             connection=connection,
             target_metadata=target_metadata,
             process_revision_directives=process_revision_directives,
+            include_object=include_object,
             **current_app.extensions['migrate'].configure_args
         )
         # Create a schema (only in production)
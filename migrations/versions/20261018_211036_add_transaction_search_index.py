@@ -0,0 +1,58 @@
+"""Add full-text search index on transaction descriptions
+
+Revision ID: 9b4e1d7c3a68
+Revises: 2f8d6a0e4c19
+Create Date: 2026-10-18 21:10:36.205847
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9b4e1d7c3a68'
+down_revision = '2f8d6a0e4c19'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Same objects as app/models/transaction_search.py creates on create_all
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "CREATE INDEX ix_transactions_description_search ON transactions "
+            "USING gin (to_tsvector('english', description))"
+        )
+        return
+
+    op.execute(
+        "CREATE VIRTUAL TABLE transactions_fts USING fts5("
+        "description, content='transactions', content_rowid='id', tokenize='porter unicode61')"
+    )
+    op.execute(
+        "CREATE TRIGGER transactions_fts_insert AFTER INSERT ON transactions BEGIN "
+        "INSERT INTO transactions_fts(rowid, description) VALUES (new.id, new.description); END"
+    )
+    op.execute(
+        "CREATE TRIGGER transactions_fts_delete AFTER DELETE ON transactions BEGIN "
+        "INSERT INTO transactions_fts(transactions_fts, rowid, description) "
+        "VALUES ('delete', old.id, old.description); END"
+    )
+    op.execute(
+        "CREATE TRIGGER transactions_fts_update AFTER UPDATE OF description ON transactions BEGIN "
+        "INSERT INTO transactions_fts(transactions_fts, rowid, description) "
+        "VALUES ('delete', old.id, old.description); "
+        "INSERT INTO transactions_fts(rowid, description) VALUES (new.id, new.description); END"
+    )
+    # Index the rows that are already there
+    op.execute("INSERT INTO transactions_fts(transactions_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP INDEX ix_transactions_description_search")
+        return
+
+    op.execute("DROP TRIGGER transactions_fts_update")
+    op.execute("DROP TRIGGER transactions_fts_delete")
+    op.execute("DROP TRIGGER transactions_fts_insert")
+    op.execute("DROP TABLE transactions_fts")
@@ -1,8 +1,11 @@
 import { useEffect, useState, useMemo } from "react";
 import { useDispatch, useSelector } from "react-redux";
-import { getBudgets, deleteBudget } from "../../redux/budgets";
+import {
+  getBudgets,
+  getBudgetStatus,
+  deleteBudget,
+} from "../../redux/budgets";
 import { getCategories } from "../../redux/categories";
-import { getTransactions } from "../../redux/transactions";
 import { Link, useNavigate } from "react-router-dom";
 import "./Budgets.css";
 
@@ -21,10 +24,6 @@ function BudgetList() {
     byId: {},
     allIds: [],
   };
-  const transactionsState = useSelector((state) => state.transactions) || {
-    byId: {},
-    allIds: [],
-  };
 
   // Memoize data
   const budgets = useMemo(() => {
@@ -37,12 +36,6 @@ function BudgetList() {
     return categoriesState.byId || {};
   }, [categoriesState]);
 
-  const transactions = useMemo(() => {
-    return (transactionsState.allIds || [])
-      .map((id) => transactionsState.byId?.[id])
-      .filter(Boolean);
-  }, [transactionsState]);
-
   // Filter budgets by current month/year
   const currentBudgets = useMemo(() => {
     return budgets.filter(
@@ -50,40 +43,18 @@ function BudgetList() {
     );
   }, [budgets, currentMonth, currentYear]);
 
-  // Calculate spending for each budget
+  // Spending for each budget is computed on the server
   const budgetProgress = useMemo(() => {
     const progress = {};
-
-    // Format month with leading zero if needed
-    const monthStr = String(currentMonth).padStart(2, "0");
-    const monthPrefix = `${currentYear}-${monthStr}`;
-
-    // Filter transactions by selected month
-    const monthTransactions = transactions.filter((transaction) => {
-      if (!transaction?.transaction_date) return false;
-      return transaction.transaction_date.startsWith(monthPrefix);
-    });
-
-    // Calculate totals by category
-    currentBudgets.forEach((budget) => {
-      const categoryTransactions = monthTransactions.filter(
-        (t) => t.category_id === budget.category_id && t.type === "expense"
-      );
-
-      const spent = categoryTransactions.reduce(
-        (sum, t) => sum + parseFloat(t.amount || 0),
-        0
-      );
-
-      progress[budget.id] = {
-        spent,
-        remaining: parseFloat(budget.amount) - spent,
-        percentage: Math.min(100, (spent / parseFloat(budget.amount)) * 100),
+    Object.values(budgetsState.statusById || {}).forEach((status) => {
+      progress[status.budget_id] = {
+        spent: status.spent,
+        remaining: status.remaining,
+        percentage: Math.min(100, status.percent),
       };
     });
-
     return progress;
-  }, [currentBudgets, transactions, currentMonth, currentYear]);
+  }, [budgetsState]);
 
   useEffect(() => {
     const fetchData = async () => {
@@ -91,13 +62,13 @@ function BudgetList() {
       await Promise.all([
         dispatch(getBudgets()),
         dispatch(getCategories()),
-        dispatch(getTransactions()),
+        dispatch(getBudgetStatus(currentMonth, currentYear)),
       ]);
       setIsLoading(false);
     };
 
     fetchData();
-  }, [dispatch]);
+  }, [dispatch, currentMonth, currentYear]);
 
   const handleDelete = async (budgetId) => {
     if (window.confirm("Are you sure you want to delete this budget?")) {
@@ -3,8 +3,9 @@ import { useDispatch, useSelector } from "react-redux";
 import { useLocation } from "react-router-dom";
 import { getTransactions } from "../../redux/transactions";
 import { getCategories } from "../../redux/categories";
-import { getBudgets } from "../../redux/budgets";
+import { getBudgets, getBudgetStatus } from "../../redux/budgets";
 import { getSavingsGoals } from "../../redux/savings";
+import { getMonthlyReport } from "../../redux/reports";
 import { Link } from "react-router-dom";
 import "./Dashboard.css";
 
@@ -33,6 +34,7 @@ function Dashboard() {
     byId: {},
     allIds: [],
   };
+  const monthlyReport = useSelector((state) => state.reports?.monthly);
 
   // Create a refresh function
   const refreshData = useCallback(async () => {
@@ -41,7 +43,9 @@ function Dashboard() {
       dispatch(getTransactions()),
       dispatch(getCategories()),
       dispatch(getBudgets()),
+      dispatch(getBudgetStatus()),
       dispatch(getSavingsGoals()),
+      dispatch(getMonthlyReport()),
     ]);
     setIsLoading(false);
   }, [dispatch]);
@@ -72,12 +76,6 @@ function Dashboard() {
       .filter(Boolean);
   }, [savingsState]);
 
-  const [monthlyData, setMonthlyData] = useState({
-    income: 0,
-    expenses: 0,
-    balance: 0,
-  });
-
   // Refresh when the component mounts or when navigating to this page
   useEffect(() => {
     refreshData();
@@ -90,24 +88,15 @@ function Dashboard() {
     }
   }, [sessionUser, refreshData]);
 
-  useEffect(() => {
-    if (transactions.length > 0) {
-      // Calculate totals across all transactions
-      const income = transactions
-        .filter((t) => t && t.type === "income")
-        .reduce((sum, t) => sum + parseFloat(t.amount || 0), 0);
-
-      const expenses = transactions
-        .filter((t) => t && t.type === "expense")
-        .reduce((sum, t) => sum + parseFloat(t.amount || 0), 0);
-
-      setMonthlyData({
-        income,
-        expenses,
-        balance: income - expenses,
-      });
-    }
-  }, [transactions]);
+  // Totals are aggregated on the server from the whole ledger
+  const monthlyData = useMemo(() => {
+    const totals = monthlyReport?.totals || {};
+    return {
+      income: totals.income || 0,
+      expenses: totals.expense || 0,
+      balance: totals.balance || 0,
+    };
+  }, [monthlyReport]);
 
   // Memoize recent transactions
   const recentTransactions = useMemo(() => {
@@ -122,16 +111,11 @@ function Dashboard() {
 
   // Memoize category totals and top categories
   const topCategories = useMemo(() => {
-    // Calculate category totals for expenses
-    const categoryTotals = transactions
-      .filter((t) => t && t.type === "expense")
-      .reduce((acc, transaction) => {
-        if (!transaction) return acc;
-        const categoryId = transaction.category_id;
-        if (!acc[categoryId]) {
-          acc[categoryId] = 0;
-        }
-        acc[categoryId] += parseFloat(transaction.amount || 0);
+    // Sum the per-month expense rows of the report for each category
+    const categoryTotals = (monthlyReport?.categories || [])
+      .filter((row) => row.type === "expense")
+      .reduce((acc, row) => {
+        acc[row.category_id] = (acc[row.category_id] || 0) + row.total;
         return acc;
       }, {});
 
@@ -143,7 +127,7 @@ function Dashboard() {
         name: categories[categoryId]?.name || "Unknown",
         total,
       }));
-  }, [transactions, categories]);
+  }, [monthlyReport, categories]);
 
   // Budget Summary Component
   const BudgetSummary = () => {
@@ -152,42 +136,22 @@ function Dashboard() {
       return budgets.slice(0, 3); // Just show the first 3 budgets
     }, []);
 
-    // Calculate budget progress for each budget based on its own month/year
+    // Budget progress for each budget's own month/year comes from the server
     const budgetProgress = useMemo(() => {
       const progress = {};
-
       currentBudgets.forEach((budget) => {
-        // Format month with leading zero if needed
-        const monthStr = String(budget.month).padStart(2, "0");
-        const monthPrefix = `${budget.year}-${monthStr}`;
-
-        // Get transactions for this budget's month/year
-        const monthTransactions = transactions.filter((transaction) => {
-          if (!transaction?.transaction_date) return false;
-          return transaction.transaction_date.startsWith(monthPrefix);
-        });
-
-        // Calculate totals for this category
-        const categoryTransactions = monthTransactions.filter(
-          (t) => t.category_id === budget.category_id && t.type === "expense"
-        );
-
-        const spent = categoryTransactions.reduce(
-          (sum, t) => sum + parseFloat(t.amount || 0),
-          0
-        );
-
+        const status = budgetsState.statusById?.[budget.id];
+        if (!status) return;
         progress[budget.id] = {
-          spent,
-          remaining: parseFloat(budget.amount) - spent,
-          percentage: Math.min(100, (spent / parseFloat(budget.amount)) * 100),
+          spent: status.spent,
+          remaining: status.remaining,
+          percentage: Math.min(100, status.percent),
           month: budget.month,
           year: budget.year,
         };
       });
-
       return progress;
-    }, [currentBudgets, transactions]);
+    }, [currentBudgets]);
 
     if (currentBudgets.length === 0) {
       return (
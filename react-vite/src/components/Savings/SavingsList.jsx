@@ -1,6 +1,10 @@
 import { useEffect, useState, useMemo } from "react";
 import { useDispatch, useSelector } from "react-redux";
-import { getSavingsGoals, deleteSavingsGoal } from "../../redux/savings";
+import {
+  getSavingsGoals,
+  getSavingsProjections,
+  deleteSavingsGoal,
+} from "../../redux/savings";
 import { Link, useNavigate } from "react-router-dom";
 import "./Savings.css";
 
@@ -24,7 +28,10 @@ function SavingsList() {
   useEffect(() => {
     const fetchData = async () => {
       setIsLoading(true);
-      await dispatch(getSavingsGoals());
+      await Promise.all([
+        dispatch(getSavingsGoals()),
+        dispatch(getSavingsProjections()),
+      ]);
       setIsLoading(false);
     };
 
@@ -34,6 +41,7 @@ function SavingsList() {
   const handleDelete = async (goalId) => {
     if (window.confirm("Are you sure you want to delete this savings goal?")) {
       await dispatch(deleteSavingsGoal(goalId));
+      dispatch(getSavingsProjections());
     }
   };
 
@@ -75,6 +83,7 @@ function SavingsList() {
             const progressPercentage =
               (goal.current_amount / goal.target_amount) * 100;
             const remaining = goal.target_amount - goal.current_amount;
+            const projection = savingsState.projectionsById?.[goal.id];
 
             return (
               <div key={goal.id} className="savings-card">
@@ -126,6 +135,33 @@ function SavingsList() {
                   </div>
                 )}
 
+                {projection && remaining > 0 && (
+                  <div className="savings-projection">
+                    <div className="savings-amount">
+                      <span className="label">Projected:</span>
+                      <span className="value">
+                        {projection.projected_completion_date
+                          ? new Date(
+                              projection.projected_completion_date
+                            ).toLocaleDateString()
+                          : "No recent savings"}
+                      </span>
+                    </div>
+                    {projection.required_monthly !== null && (
+                      <div
+                        className={`savings-amount ${
+                          projection.on_track ? "on-track" : "behind"
+                        }`}
+                      >
+                        <span className="label">Needed per month:</span>
+                        <span className="value">
+                          ${projection.required_monthly.toFixed(2)}
+                        </span>
+                      </div>
+                    )}
+                  </div>
+                )}
+
                 <div className="savings-progress-container">
                   <div
                     className={`savings-progress-bar ${
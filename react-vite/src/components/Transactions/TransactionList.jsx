@@ -1,6 +1,11 @@
 import { useEffect, useState, useMemo } from "react";
 import { useDispatch, useSelector } from "react-redux";
-import { getTransactions, deleteTransaction } from "../../redux/transactions";
+import {
+  getTransactions,
+  searchTransactions,
+  getMoreTransactions,
+  deleteTransaction,
+} from "../../redux/transactions";
 import { getCategories } from "../../redux/categories";
 import { Link } from "react-router-dom";
 import "./Transactions.css";
@@ -34,22 +39,56 @@ function TransactionList() {
     category: "all",
     startDate: "",
     endDate: "",
+    sort: "transaction_date:desc",
+    search: "",
   });
+  const [searchInput, setSearchInput] = useState("");
 
   const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
 
+  useEffect(() => {
+    dispatch(getCategories());
+  }, [dispatch]);
+
+  // Only search once typing pauses, not on every keystroke
+  useEffect(() => {
+    const timeout = setTimeout(() => {
+      setFilters((current) =>
+        current.search === searchInput.trim()
+          ? current
+          : { ...current, search: searchInput.trim() }
+      );
+    }, 300);
+    return () => clearTimeout(timeout);
+  }, [searchInput]);
+
+  // Filtering, sorting and search happen on the server; refetch the first
+  // page whenever the filters change
   useEffect(() => {
     const fetchData = async () => {
       setIsLoading(true);
-      await Promise.all([
-        dispatch(getTransactions()),
-        dispatch(getCategories()),
-      ]);
+      const params = {
+        type: filters.type === "all" ? "" : filters.type,
+        category_id: filters.category === "all" ? "" : filters.category,
+        start_date: filters.startDate,
+        end_date: filters.endDate,
+      };
+      // Search results come back most relevant first
+      await dispatch(
+        filters.search
+          ? searchTransactions({ ...params, q: filters.search })
+          : getTransactions({
+              ...params,
+              sort: filters.sort.split(":")[0],
+              order: filters.sort.split(":")[1],
+            })
+      );
       setIsLoading(false);
     };
 
     fetchData();
-  }, [dispatch]);
+  }, [dispatch, filters]);
 
   const handleDelete = async (transactionId) => {
     if (window.confirm("Are you sure you want to delete this transaction?")) {
@@ -57,6 +96,12 @@ function TransactionList() {
     }
   };
 
+  const handleLoadMore = async () => {
+    setIsLoadingMore(true);
+    await dispatch(getMoreTransactions());
+    setIsLoadingMore(false);
+  };
+
   const handleFilterChange = (e) => {
     const { name, value } = e.target;
     setFilters({
@@ -65,66 +110,7 @@ function TransactionList() {
     });
   };
 
-  // Log transactions for debugging
-  useEffect(() => {
-    console.log("All transactions:", transactions);
-  }, [transactions]);
-
-  // Memoize filtered transactions
-  const filteredTransactions = useMemo(() => {
-    return transactions.filter((transaction) => {
-      if (!transaction) return false;
-
-      // Filter by type
-      if (filters.type !== "all" && transaction.type !== filters.type) {
-        return false;
-      }
-
-      // Filter by category
-      if (
-        filters.category !== "all" &&
-        transaction.category_id?.toString() !== filters.category
-      ) {
-        return false;
-      }
-
-      // Filter by date range
-      if (filters.startDate) {
-        const transactionDate = new Date(transaction.transaction_date);
-        const startDate = new Date(filters.startDate);
-        // Reset hours to compare dates only
-        transactionDate.setHours(0, 0, 0, 0);
-        startDate.setHours(0, 0, 0, 0);
-
-        if (transactionDate < startDate) {
-          return false;
-        }
-      }
-
-      if (filters.endDate) {
-        const transactionDate = new Date(transaction.transaction_date);
-        const endDate = new Date(filters.endDate);
-        // Reset hours and set to end of day for proper comparison
-        transactionDate.setHours(0, 0, 0, 0);
-        endDate.setHours(23, 59, 59, 999);
-
-        if (transactionDate > endDate) {
-          return false;
-        }
-      }
-
-      return true;
-    });
-  }, [transactions, filters]);
-
-  // Memoize sorted transactions
-  const sortedTransactions = useMemo(() => {
-    return [...filteredTransactions].sort(
-      (a, b) => new Date(b.transaction_date) - new Date(a.transaction_date)
-    );
-  }, [filteredTransactions]);
-
-  if (isLoading) {
+  if (isLoading && transactions.length === 0) {
     return <div className="loading">Loading transactions...</div>;
   }
 
@@ -138,6 +124,18 @@ function TransactionList() {
       </div>
 
       <div className="transaction-filters">
+        <div className="filter-group">
+          <label htmlFor="search">Search:</label>
+          <input
+            type="search"
+            id="search"
+            name="search"
+            placeholder="Description"
+            value={searchInput}
+            onChange={(e) => setSearchInput(e.target.value)}
+          />
+        </div>
+
         <div className="filter-group">
           <label htmlFor="type">Type:</label>
           <select
@@ -190,9 +188,25 @@ function TransactionList() {
             onChange={handleFilterChange}
           />
         </div>
+
+        <div className="filter-group">
+          <label htmlFor="sort">Sort:</label>
+          <select
+            id="sort"
+            name="sort"
+            value={filters.sort}
+            onChange={handleFilterChange}
+            disabled={Boolean(filters.search)}
+          >
+            <option value="transaction_date:desc">Newest first</option>
+            <option value="transaction_date:asc">Oldest first</option>
+            <option value="amount:desc">Highest amount</option>
+            <option value="amount:asc">Lowest amount</option>
+          </select>
+        </div>
       </div>
 
-      {sortedTransactions.length === 0 ? (
+      {transactions.length === 0 ? (
         <p>No transactions found matching your filters.</p>
       ) : (
         <div className="transaction-table-container">
@@ -207,7 +221,7 @@ function TransactionList() {
               </tr>
             </thead>
             <tbody>
-              {sortedTransactions.map((transaction) => (
+              {transactions.map((transaction) => (
                 <tr key={transaction.id} className={transaction.type}>
                   <td>
                     {new Date(
@@ -244,6 +258,16 @@ function TransactionList() {
           </table>
         </div>
       )}
+
+      {transactionsState.nextCursor && (
+        <button
+          className="btn btn-secondary load-more"
+          onClick={handleLoadMore}
+          disabled={isLoadingMore}
+        >
+          {isLoadingMore ? "Loading..." : "Load More"}
+        </button>
+      )}
     </div>
   );
 }
@@ -3,6 +3,7 @@ const LOAD_BUDGETS = "budgets/LOAD_BUDGETS";
 const ADD_BUDGET = "budgets/ADD_BUDGET";
 const UPDATE_BUDGET = "budgets/UPDATE_BUDGET";
 const REMOVE_BUDGET = "budgets/REMOVE_BUDGET";
+const LOAD_BUDGET_STATUS = "budgets/LOAD_BUDGET_STATUS";
 
 // Action Creators
 const loadBudgets = (budgets) => ({
@@ -25,6 +26,11 @@ const removeBudget = (budgetId) => ({
   budgetId,
 });
 
+const loadBudgetStatus = (statuses) => ({
+  type: LOAD_BUDGET_STATUS,
+  statuses,
+});
+
 // Thunks
 export const getBudgets = () => async (dispatch) => {
   const response = await fetch("/api/budgets");
@@ -36,6 +42,22 @@ export const getBudgets = () => async (dispatch) => {
   }
 };
 
+// Fetches budgeted vs. spent for each budget, optionally for one month
+export const getBudgetStatus =
+  (month, year) =>
+  async (dispatch) => {
+    const params = new URLSearchParams();
+    if (month) params.append("month", month);
+    if (year) params.append("year", year);
+    const response = await fetch(`/api/budgets/status?${params.toString()}`);
+
+    if (response.ok) {
+      const statuses = await response.json();
+      dispatch(loadBudgetStatus(statuses));
+      return statuses;
+    }
+  };
+
 export const createBudget = (budgetData) => async (dispatch) => {
   const response = await fetch("/api/budgets", {
     method: "POST",
@@ -89,7 +111,7 @@ export const deleteBudget = (budgetId) => async (dispatch) => {
 };
 
 // Reducer
-const initialState = { byId: {}, allIds: [] };
+const initialState = { byId: {}, allIds: [], statusById: {} };
 
 const budgetReducer = (state = initialState, action) => {
   switch (action.type) {
@@ -100,11 +122,20 @@ const budgetReducer = (state = initialState, action) => {
         byId[budget.id] = budget;
         allIds.push(budget.id);
       });
-      return { byId, allIds };
+      return { ...state, byId, allIds };
+    }
+
+    case LOAD_BUDGET_STATUS: {
+      const statusById = {};
+      action.statuses.forEach((status) => {
+        statusById[status.budget_id] = status;
+      });
+      return { ...state, statusById };
     }
 
     case ADD_BUDGET:
       return {
+        ...state,
         byId: { ...state.byId, [action.budget.id]: action.budget },
         allIds: [...state.allIds, action.budget.id],
       };
@@ -119,13 +150,14 @@ const budgetReducer = (state = initialState, action) => {
       const newById = { ...state.byId };
       delete newById[action.budgetId];
       return {
+        ...state,
         byId: newById,
         allIds: state.allIds.filter((id) => id !== action.budgetId),
       };
     }
 
     case "session/clearUserData": {
-      return { byId: {}, allIds: [] };
+      return initialState;
     }
 
     default:
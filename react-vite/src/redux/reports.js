@@ -0,0 +1,44 @@
+// Action Types
+const LOAD_MONTHLY_REPORT = "reports/LOAD_MONTHLY_REPORT";
+
+// Action Creators
+const loadMonthlyReport = (report) => ({
+  type: LOAD_MONTHLY_REPORT,
+  report,
+});
+
+// Thunks
+export const getMonthlyReport = () => async (dispatch) => {
+  const response = await fetch("/api/reports/monthly");
+
+  if (response.ok) {
+    const report = await response.json();
+    dispatch(loadMonthlyReport(report));
+    return report;
+  }
+};
+
+// Reducer
+const initialState = {
+  monthly: {
+    months: [],
+    categories: [],
+    totals: { income: 0, expense: 0, balance: 0 },
+  },
+};
+
+const reportReducer = (state = initialState, action) => {
+  switch (action.type) {
+    case LOAD_MONTHLY_REPORT:
+      return { ...state, monthly: action.report };
+
+    case "session/clearUserData": {
+      return initialState;
+    }
+
+    default:
+      return state;
+  }
+};
+
+export default reportReducer;
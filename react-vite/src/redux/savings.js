@@ -3,6 +3,7 @@ const LOAD_SAVINGS_GOALS = "savings/LOAD_SAVINGS_GOALS";
 const ADD_SAVINGS_GOAL = "savings/ADD_SAVINGS_GOAL";
 const UPDATE_SAVINGS_GOAL = "savings/UPDATE_SAVINGS_GOAL";
 const REMOVE_SAVINGS_GOAL = "savings/REMOVE_SAVINGS_GOAL";
+const LOAD_SAVINGS_PROJECTIONS = "savings/LOAD_SAVINGS_PROJECTIONS";
 
 // Action Creators
 const loadSavingsGoals = (goals) => ({
@@ -25,6 +26,11 @@ const removeSavingsGoal = (goalId) => ({
   goalId,
 });
 
+const loadSavingsProjections = (projections) => ({
+  type: LOAD_SAVINGS_PROJECTIONS,
+  projections,
+});
+
 // Thunks
 export const getSavingsGoals = () => async (dispatch) => {
   const response = await fetch("/api/savings");
@@ -36,6 +42,17 @@ export const getSavingsGoals = () => async (dispatch) => {
   }
 };
 
+// Projections for every goal come back from one request
+export const getSavingsProjections = () => async (dispatch) => {
+  const response = await fetch("/api/savings/projections");
+
+  if (response.ok) {
+    const projections = await response.json();
+    dispatch(loadSavingsProjections(projections));
+    return projections;
+  }
+};
+
 export const createSavingsGoal = (goalData) => async (dispatch) => {
   const response = await fetch("/api/savings", {
     method: "POST",
@@ -89,7 +106,12 @@ export const deleteSavingsGoal = (goalId) => async (dispatch) => {
 };
 
 // Reducer
-const initialState = { byId: {}, allIds: [] };
+const initialState = {
+  byId: {},
+  allIds: [],
+  projectionsById: {},
+  monthlyContributionRate: 0,
+};
 
 const savingsReducer = (state = initialState, action) => {
   switch (action.type) {
@@ -100,11 +122,24 @@ const savingsReducer = (state = initialState, action) => {
         byId[goal.id] = goal;
         allIds.push(goal.id);
       });
-      return { byId, allIds };
+      return { ...state, byId, allIds };
+    }
+
+    case LOAD_SAVINGS_PROJECTIONS: {
+      const projectionsById = {};
+      action.projections.projections.forEach((projection) => {
+        projectionsById[projection.goal_id] = projection;
+      });
+      return {
+        ...state,
+        projectionsById,
+        monthlyContributionRate: action.projections.monthly_contribution_rate,
+      };
     }
 
     case ADD_SAVINGS_GOAL:
       return {
+        ...state,
         byId: { ...state.byId, [action.goal.id]: action.goal },
         allIds: [...state.allIds, action.goal.id],
       };
@@ -119,13 +154,14 @@ const savingsReducer = (state = initialState, action) => {
       const newById = { ...state.byId };
       delete newById[action.goalId];
       return {
+        ...state,
         byId: newById,
         allIds: state.allIds.filter((id) => id !== action.goalId),
       };
     }
 
     case "session/clearUserData": {
-      return { byId: {}, allIds: [] };
+      return initialState;
     }
 
     default:
@@ -10,6 +10,7 @@ import categoryReducer from "./categories";
 import transactionReducer from "./transactions";
 import budgetReducer from "./budgets";
 import savingsReducer from "./savings";
+import reportReducer from "./reports";
 
 const rootReducer = combineReducers({
   session: sessionReducer,
@@ -17,6 +18,7 @@ const rootReducer = combineReducers({
   transactions: transactionReducer,
   budgets: budgetReducer,
   savings: savingsReducer,
+  reports: reportReducer,
 });
 
 let enhancer;
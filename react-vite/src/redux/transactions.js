@@ -2,14 +2,23 @@
 import { getCategories } from "./categories";
 
 const LOAD_TRANSACTIONS = "transactions/LOAD_TRANSACTIONS";
+const APPEND_TRANSACTIONS = "transactions/APPEND_TRANSACTIONS";
 const ADD_TRANSACTION = "transactions/ADD_TRANSACTION";
 const UPDATE_TRANSACTION = "transactions/UPDATE_TRANSACTION";
 const REMOVE_TRANSACTION = "transactions/REMOVE_TRANSACTION";
 
 // Action Creators
-const loadTransactions = (transactions) => ({
+const loadTransactions = (transactions, nextCursor, params) => ({
   type: LOAD_TRANSACTIONS,
   transactions,
+  nextCursor,
+  params,
+});
+
+const appendTransactions = (transactions, nextCursor) => ({
+  type: APPEND_TRANSACTIONS,
+  transactions,
+  nextCursor,
 });
 
 const addTransaction = (transaction) => ({
@@ -28,13 +37,61 @@ const removeTransaction = (transactionId) => ({
 });
 
 // Thunks
-export const getTransactions = () => async (dispatch) => {
-  const response = await fetch("/api/transactions");
+// Builds the list query string, dropping empty filters
+const toQueryString = (params) => {
+  const query = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== undefined && value !== null && value !== "") {
+      query.append(key, value);
+    }
+  });
+  return query.toString();
+};
+
+// Fetches the first page of transactions matching the given filters
+// (start_date, end_date, category_id, type, min_amount, max_amount,
+// sort, order)
+export const getTransactions =
+  (params = {}) =>
+  async (dispatch) => {
+    const response = await fetch(`/api/transactions?${toQueryString(params)}`);
+
+    if (response.ok) {
+      const page = await response.json();
+      dispatch(loadTransactions(page.transactions, page.next_cursor, params));
+      return page.transactions;
+    }
+  };
+
+// Fetches the transactions whose description matches params.q, most
+// relevant first, narrowed by the same filters as getTransactions
+export const searchTransactions =
+  (params = {}) =>
+  async (dispatch) => {
+    const response = await fetch(
+      `/api/transactions/search?${toQueryString(params)}`
+    );
+
+    if (response.ok) {
+      const page = await response.json();
+      dispatch(loadTransactions(page.transactions, null, params));
+      return page.transactions;
+    }
+  };
+
+// Fetches the page after the last one loaded, with the same filters
+export const getMoreTransactions = () => async (dispatch, getState) => {
+  const { nextCursor, params } = getState().transactions;
+  if (!nextCursor) return [];
+
+  const response = await fetch(
+    `/api/transactions?${toQueryString({ ...params, cursor: nextCursor })}`
+  );
 
   if (response.ok) {
-    const transactions = await response.json();
-    dispatch(loadTransactions(transactions));
-    return transactions;
+    const page = await response.json();
+    dispatch(appendTransactions(page.transactions, page.next_cursor));
+    return page.transactions;
   }
 };
 
@@ -84,7 +141,7 @@ export const deleteTransaction = (transactionId) => async (dispatch) => {
 };
 
 // Reducer
-const initialState = { byId: {}, allIds: [] };
+const initialState = { byId: {}, allIds: [], nextCursor: null, params: {} };
 
 const transactionReducer = (state = initialState, action) => {
   switch (action.type) {
@@ -95,11 +152,27 @@ const transactionReducer = (state = initialState, action) => {
         byId[transaction.id] = transaction;
         allIds.push(transaction.id);
       });
-      return { byId, allIds };
+      return {
+        byId,
+        allIds,
+        nextCursor: action.nextCursor,
+        params: action.params,
+      };
+    }
+
+    case APPEND_TRANSACTIONS: {
+      const byId = { ...state.byId };
+      const allIds = [...state.allIds];
+      action.transactions.forEach((transaction) => {
+        if (!byId[transaction.id]) allIds.push(transaction.id);
+        byId[transaction.id] = transaction;
+      });
+      return { ...state, byId, allIds, nextCursor: action.nextCursor };
     }
 
     case ADD_TRANSACTION:
       return {
+        ...state,
         byId: { ...state.byId, [action.transaction.id]: action.transaction },
         allIds: [...state.allIds, action.transaction.id],
       };
@@ -114,12 +187,13 @@ const transactionReducer = (state = initialState, action) => {
       const newById = { ...state.byId };
       delete newById[action.transactionId];
       return {
+        ...state,
         byId: newById,
         allIds: state.allIds.filter((id) => id !== action.transactionId),
       };
     }
     case "session/clearUserData": {
-      return { byId: {}, allIds: [] };
+      return initialState;
     }
 
     default:
@@ -0,0 +1,57 @@
+import os
+import tempfile
+
+# The app reads its config from the environment when it is imported
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'test.db')
+os.environ.setdefault('SECRET_KEY', 'test')
+
+import pytest
+from app import app as flask_app
+from app.cache import response_cache, user_cache
+from app.models import db
+from app.seeds import (
+    seed_users, seed_categories, seed_transactions, seed_budgets, seed_savings_goals, seed_rollups
+)
+
+
+@pytest.fixture
+def app():
+    """
+    The app over a fresh database. No app context is left pushed, so each
+    request gets its own (flask-login keeps the current user on g); tests
+    push one around their own database work.
+    """
+    flask_app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    with flask_app.app_context():
+        db.drop_all()
+        db.create_all()
+    response_cache.clear()
+    user_cache.clear()
+    yield flask_app
+    with flask_app.app_context():
+        db.session.remove()
+
+
+@pytest.fixture
+def seeded(app):
+    # The demo data from `flask seed all`
+    with app.app_context():
+        seed_users()
+        seed_categories()
+        seed_transactions()
+        seed_budgets()
+        seed_savings_goals()
+        seed_rollups()
+    return app
+
+
+@pytest.fixture
+def login(app):
+    # login(user_id) returns a test client with that user logged in
+    def login(user_id):
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session['_user_id'] = str(user_id)
+            session['_fresh'] = True
+        return client
+    return login
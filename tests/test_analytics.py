@@ -0,0 +1,25 @@
+import numpy as np
+from app.api.analytics import Ledger, anomalies
+from app.models import Transaction
+
+
+def test_anomalies_only_return_the_users_transactions(seeded):
+    with seeded.app_context():
+        ids = [id for id, in Transaction.query.with_entities(Transaction.id).filter(
+            Transaction.user_id == 1
+        ).order_by(Transaction.id)]
+        amounts = np.full(len(ids), 10.0)
+        amounts[0] = 1000.0
+        # A ledger claiming another user's ids, as a stale one might
+        ledger = Ledger(
+            user_id=2,
+            ids=np.array(ids, dtype=np.int64),
+            category_ids=np.ones(len(ids), dtype=np.int64),
+            is_expense=np.ones(len(ids), dtype=bool),
+            amounts=amounts,
+            months=np.zeros(len(ids), dtype=np.int64)
+        )
+
+        assert anomalies(ledger, 'expense', 2.0, 50)['anomalies'] == []
+        ledger.user_id = 1
+        assert [row['id'] for row in anomalies(ledger, 'expense', 2.0, 50)['anomalies']] == [ids[0]]
@@ -0,0 +1,15 @@
+from app.cache import Cache, LocalCache, NullCache
+
+
+def test_user_cache_backend_is_set_apart_from_the_response_cache(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'CACHE_BACKEND', 'null')
+    monkeypatch.setitem(app.config, 'USER_CACHE_BACKEND', 'local')
+    responses = Cache()
+    users = Cache(backend_setting='USER_CACHE_BACKEND', ttl_setting='USER_CACHE_TTL')
+
+    responses.init_app(app)
+    users.init_app(app)
+
+    assert isinstance(responses.backend, NullCache)
+    assert isinstance(users.backend, LocalCache)
+    assert users.backend.default_ttl == app.config['USER_CACHE_TTL']
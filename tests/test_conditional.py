@@ -0,0 +1,40 @@
+from app.seeds import seed_commands
+from app.commands import rollup_commands
+
+
+def test_unchanged_list_is_not_modified(seeded, login):
+    client = login(1)
+    etag = client.get('/api/categories').headers['ETag']
+
+    assert client.get('/api/categories', headers={'If-None-Match': etag}).status_code == 304
+
+
+def test_write_changes_etag(seeded, login):
+    client = login(1)
+    etag = client.get('/api/categories').headers['ETag']
+    client.post('/api/categories', json={'name': 'Pets'})
+
+    response = client.get('/api/categories', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert 'Pets' in [category['name'] for category in response.get_json()]
+
+
+def test_reseeding_retires_etags_and_cached_responses(seeded, login):
+    client = login(1)
+    before = client.get('/api/budgets')
+    runner = seeded.test_cli_runner()
+    assert runner.invoke(seed_commands, ['reset']).exit_code == 0
+    assert runner.invoke(seed_commands, ['bulk', '--users', '1', '--transactions-per-user', '10']).exit_code == 0
+
+    # User 1 is now a different, bulk-seeded user
+    after = client.get('/api/budgets', headers={'If-None-Match': before.headers['ETag']})
+    assert after.status_code == 200
+    assert after.get_json() != before.get_json()
+
+
+def test_rollup_rebuild_changes_etag(seeded, login):
+    client = login(1)
+    etag = client.get('/api/reports/monthly').headers['ETag']
+    assert seeded.test_cli_runner().invoke(rollup_commands, ['rebuild']).exit_code == 0
+
+    assert client.get('/api/reports/monthly', headers={'If-None-Match': etag}).status_code == 200
@@ -0,0 +1,22 @@
+from app.models import db
+from sqlalchemy.exc import OperationalError
+import logging
+import pytest
+
+
+def test_server_timing_counts_queries(seeded, login):
+    response = login(1).get('/api/categories')
+
+    assert 'queries' in response.headers['Server-Timing']
+
+
+def test_failed_statement_does_not_skew_later_timings(app, caplog):
+    with app.app_context():
+        with db.engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.exec_driver_sql('SELECT * FROM no_such_table')
+            assert 'query_start' not in connection.info
+
+            with caplog.at_level(logging.WARNING, logger='app.instrumentation'):
+                connection.exec_driver_sql('SELECT 1')
+    assert not [record for record in caplog.records if 'Slow query' in record.message]
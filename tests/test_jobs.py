@@ -0,0 +1,47 @@
+import pytest
+import time
+
+
+def wait(client, id):
+    for _ in range(100):
+        job = client.get(f'/api/jobs/{id}').get_json()
+        if job['status'] in ('succeeded', 'failed'):
+            return job
+        time.sleep(0.05)
+    return job
+
+
+def test_annual_report_job(seeded, login):
+    client = login(1)
+    response = client.post('/api/jobs', json={'kind': 'annual_report', 'params': {'year': 2024}})
+
+    assert response.status_code == 202
+    job = wait(client, response.get_json()['id'])
+    assert job['status'] == 'succeeded'
+    assert job['progress'] == 1
+    result = client.get(f'/api/jobs/{job["id"]}/result').get_json()
+    assert result['year'] == 2024
+    assert len(result['months']) == 12
+
+
+@pytest.mark.parametrize('body, error', [
+    ({'kind': ['annual_report']}, 'kind must be a string'),
+    ({'kind': {'annual_report': 1}}, 'kind must be a string'),
+    ([], 'Body must be a JSON object'),
+    ({'kind': 'nope'}, 'Kind must be one of: annual_report, import, rollup_rebuild'),
+    ({'kind': 'import'}, 'Use /api/jobs/import to upload a file'),
+    ({'kind': 'annual_report', 'params': {'year': 'x'}}, 'year must be a number'),
+])
+def test_create_job_rejects_bad_input(seeded, login, body, error):
+    response = login(1).post('/api/jobs', json=body)
+
+    assert response.status_code == 400
+    assert response.get_json() == {'error': error}
+
+
+def test_jobs_are_private(seeded, login):
+    id = login(1).post('/api/jobs', json={'kind': 'rollup_rebuild'}).get_json()['id']
+    assert wait(login(1), id)['status'] == 'succeeded'
+
+    assert login(2).get(f'/api/jobs/{id}').status_code == 403
+    assert login(2).get(f'/api/jobs/{id}/result').status_code == 403
@@ -0,0 +1,24 @@
+import pytest
+
+
+@pytest.mark.parametrize('url', ['/api/ops/cache', '/api/ops/pool'])
+def test_ops_endpoints_are_off_without_a_token(app, login, monkeypatch, url):
+    monkeypatch.setitem(app.config, 'OPS_TOKEN', None)
+
+    assert login(1).get(url).status_code == 404
+
+
+@pytest.mark.parametrize('headers', [{}, {'Authorization': 'Bearer wrong'}, {'Authorization': 'secret'}])
+def test_ops_endpoints_reject_users_without_the_token(seeded, login, monkeypatch, headers):
+    monkeypatch.setitem(seeded.config, 'OPS_TOKEN', 'secret')
+
+    assert login(1).get('/api/ops/cache', headers=headers).status_code == 403
+
+
+@pytest.mark.parametrize('url', ['/api/ops/cache', '/api/ops/pool'])
+def test_ops_endpoints_answer_the_token(app, monkeypatch, url):
+    monkeypatch.setitem(app.config, 'OPS_TOKEN', 'secret')
+
+    response = app.test_client().get(url, headers={'Authorization': 'Bearer secret'})
+
+    assert response.status_code == 200
@@ -0,0 +1,19 @@
+import pytest
+from app.models import User
+
+
+@pytest.mark.parametrize('method', ['pbkdf2:sha256', 'pbkdf2:sha256:260000', 'pbkdf2:sha256:1000'])
+def test_new_password_does_not_need_rehash(app, monkeypatch, method):
+    monkeypatch.setitem(app.config, 'PASSWORD_HASH_METHOD', method)
+    with app.app_context():
+        user = User(username='demo', email='demo@example.com', password='secret')
+
+        assert not user.needs_rehash()
+
+
+def test_password_with_other_iterations_needs_rehash(app, monkeypatch):
+    with app.app_context():
+        user = User(username='demo', email='demo@example.com', password='secret')
+        monkeypatch.setitem(app.config, 'PASSWORD_HASH_METHOD', 'pbkdf2:sha256:1000')
+
+        assert user.needs_rehash()
@@ -0,0 +1,60 @@
+from sqlalchemy import event
+from datetime import date
+from app.models import db, User, Category, Transaction, Budget
+import pytest
+
+
+def add_user(username, rows):
+    """
+    A user with `rows` transactions and budgets, each in a category of its
+    own, so a per-row category lookup would show up as extra queries.
+    Returns the user's id.
+    """
+    user = User(username=username, email=f'{username}@aa.io', password='password')
+    db.session.add(user)
+    db.session.flush()
+    for n in range(rows):
+        category = Category(user_id=user.id, name=f'Category {n}')
+        db.session.add(category)
+        db.session.flush()
+        db.session.add(Transaction(
+            user_id=user.id, category_id=category.id, amount=10 + n, description=f'Item {n}',
+            type='expense', transaction_date=date(2024, 1, 1 + n)
+        ))
+        db.session.add(Budget(user_id=user.id, category_id=category.id, amount=100, month=1, year=2024))
+    db.session.commit()
+    return user.id
+
+
+def count_queries(app, client, url):
+    # A first request outside the count loads the session user and runs
+    # any once-per-process startup work
+    client.get('/api/auth/')
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+    assert response.status_code == 200
+    return len(statements)
+
+
+@pytest.mark.parametrize('url', [
+    '/api/transactions',
+    '/api/transactions?sideload=categories',
+    '/api/budgets',
+    '/api/budgets?sideload=categories',
+])
+def test_list_query_count_does_not_grow_with_rows(app, login, url):
+    with app.app_context():
+        small = add_user('small', 10)
+        large = add_user('large', 20)
+
+    assert count_queries(app, login(small), url) == count_queries(app, login(large), url)
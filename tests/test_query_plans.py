@@ -0,0 +1,19 @@
+from app.models import db, User
+from app.query_plans import check_query_plans
+
+
+def test_endpoints_read_per_user_tables_through_indexes(seeded):
+    # The check `flask queries explain` runs, as the first demo user
+    with seeded.app_context():
+        user_id = db.session.query(db.func.min(User.id)).scalar()
+        results = list(check_query_plans(user_id))
+
+    assert results
+    failures = [
+        f'{method} {url}: full scan of {table}: {" ".join(statement.split())}'
+        for method, url, status, count, scans in results
+        for table, statement in scans
+    ]
+    assert not failures, '\n'.join(failures)
+    errors = [f'{method} {url} -> {status}' for method, url, status, count, scans in results if status >= 500]
+    assert not errors, '\n'.join(errors)
@@ -0,0 +1,59 @@
+from datetime import date, timedelta
+import pytest
+
+VALID = {
+    'category_id': 1,
+    'amount': 12.5,
+    'description': 'Rent',
+    'type': 'expense',
+    'cadence': 'monthly',
+    'start_date': date.today().isoformat()
+}
+
+
+def create(client, **fields):
+    return client.post('/api/recurring/rules', json={**VALID, **fields})
+
+
+def test_create_rule(seeded, login):
+    response = create(login(1))
+
+    assert response.status_code == 201
+    assert response.get_json()['description'] == 'Rent'
+
+
+@pytest.mark.parametrize('fields, error', [
+    ({'category_id': [1]}, 'Invalid category'),
+    ({'amount': 'NaN'}, 'Amount must be a number'),
+    ({'amount': 'Infinity'}, 'Amount must be a number'),
+    ({'amount': True}, 'Amount must be a number'),
+    ({'amount': 0}, 'Amount must be greater than 0'),
+    ({'amount': 100000000}, 'Amount must be at most 99,999,999.99'),
+    ({'description': ''}, 'Description is required'),
+    ({'description': ['Rent']}, 'Description is required'),
+    ({'description': 'x' * 256}, 'Description must be at most 255 characters'),
+    ({'start_date': '0001-01-01'}, 'Start date must be within the last 366 days'),
+])
+def test_create_rule_rejects_invalid_fields(seeded, login, fields, error):
+    response = create(login(1), **fields)
+
+    assert response.status_code == 400
+    assert response.get_json()['error'] == error
+
+
+def test_update_rule_rejects_invalid_amount(seeded, login):
+    client = login(1)
+    rule = create(client).get_json()
+
+    response = client.put(f'/api/recurring/rules/{rule["id"]}', json={'amount': 'NaN'})
+
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Amount must be a number'
+
+
+def test_create_rule_accepts_backdated_start(seeded, login):
+    start = date.today() - timedelta(days=300)
+
+    response = create(login(1), start_date=start.isoformat())
+
+    assert response.status_code == 201
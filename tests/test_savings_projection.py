@@ -0,0 +1,45 @@
+from app.api.savings_projection import project_goals
+from datetime import date
+
+TODAY = date(2026, 1, 15)
+
+
+def goal(id, target_amount, current_amount, target_date=None):
+    return {
+        'id': id,
+        'name': f'Goal {id}',
+        'target_amount': target_amount,
+        'current_amount': current_amount,
+        'target_date': target_date
+    }
+
+
+def test_completion_past_date_max_is_null():
+    [projection] = project_goals([goal(1, 1e15, 0)], 0.01, TODAY)
+
+    assert projection['months_to_complete'] is not None
+    assert projection['projected_completion_date'] is None
+
+
+def test_no_contributions_never_completes():
+    [projection] = project_goals([goal(1, 1000, 0, date(2026, 6, 1))], 0, TODAY)
+
+    assert projection['months_to_complete'] is None
+    assert projection['projected_completion_date'] is None
+    assert projection['on_track'] is False
+
+
+def test_completed_goal_is_on_track_after_its_target_date():
+    [projection] = project_goals([goal(1, 1000, 1000, date(2025, 6, 1))], 100, TODAY)
+
+    assert projection['remaining'] == 0
+    assert projection['projected_completion_date'] == TODAY.isoformat()
+    assert projection['on_track'] is True
+
+
+def test_rate_is_split_by_what_each_goal_needs():
+    first, second = project_goals([goal(1, 1000, 700), goal(2, 1000, 100)], 120, TODAY)
+
+    assert first['monthly_contribution'] == 30
+    assert second['monthly_contribution'] == 90
+    assert first['months_to_complete'] == second['months_to_complete'] == 10
@@ -0,0 +1,26 @@
+from app.models import User
+from app.seeds import seed_commands
+import app.seeds
+
+
+def user_count(app):
+    with app.app_context():
+        return User.query.count()
+
+
+def test_reset_refuses_to_run_in_production(seeded, monkeypatch):
+    monkeypatch.setattr(app.seeds, 'environment', 'production')
+    runner = seeded.test_cli_runner()
+
+    for args in (['reset'], ['bulk', '--reset', '--users', '1']):
+        result = runner.invoke(seed_commands, args)
+        assert result.exit_code != 0
+        assert 'without --yes' in result.output
+    assert user_count(seeded) > 0
+
+
+def test_reset_runs_in_production_with_yes(seeded, monkeypatch):
+    monkeypatch.setattr(app.seeds, 'environment', 'production')
+
+    assert seeded.test_cli_runner().invoke(seed_commands, ['reset', '--yes']).exit_code == 0
+    assert user_count(seeded) == 0
@@ -0,0 +1,61 @@
+import pytest
+
+VALID = {
+    'category_id': 1,
+    'amount': 12.5,
+    'description': 'Lunch',
+    'type': 'expense',
+    'transaction_date': '2024-01-02'
+}
+
+
+def create(client, **fields):
+    return client.post('/api/transactions/bulk', json={'operations': [{'op': 'create', 'data': {**VALID, **fields}}]})
+
+
+def test_bulk_create(seeded, login):
+    response = create(login(1))
+
+    assert response.status_code == 200
+    assert response.get_json()['results'][0]['status'] == 'created'
+
+
+@pytest.mark.parametrize('fields, error', [
+    ({'category_id': True}, 'Invalid category'),
+    ({'amount': 'NaN'}, 'Amount must be a number'),
+    ({'amount': 'Infinity'}, 'Amount must be a number'),
+    ({'amount': True}, 'Amount must be a number'),
+    ({'amount': 0}, 'Amount must be greater than 0'),
+    ({'amount': -5}, 'Amount must be greater than 0'),
+    ({'amount': 100000000}, 'Amount must be at most 99,999,999.99'),
+    ({'description': ''}, 'Description is required'),
+    ({'description': 42}, 'Description is required'),
+    ({'description': ['Lunch']}, 'Description is required'),
+    ({'description': 'x' * 256}, 'Description must be at most 255 characters'),
+])
+def test_bulk_create_rejects_invalid_fields(seeded, login, fields, error):
+    response = create(login(1), **fields)
+
+    assert response.status_code == 400
+    assert response.get_json()['results'][0]['error'] == error
+
+
+def test_bulk_update_rejects_boolean_id(seeded, login):
+    response = login(1).post('/api/transactions/bulk', json={'operations': [
+        {'op': 'update', 'id': True, 'data': {'amount': 1}}
+    ]})
+
+    assert response.status_code == 400
+    assert response.get_json()['results'][0]['error'] == 'Transaction not found'
+
+
+def test_bulk_update_rejects_amount_too_large_to_store(seeded, login):
+    client = login(1)
+    id = create(client).get_json()['results'][0]['id']
+
+    response = client.post('/api/transactions/bulk', json={'operations': [
+        {'op': 'update', 'id': id, 'data': {'amount': '1e12'}}
+    ]})
+
+    assert response.status_code == 400
+    assert response.get_json()['results'][0]['error'] == 'Amount must be at most 99,999,999.99'
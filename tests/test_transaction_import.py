@@ -0,0 +1,59 @@
+from app.models import db, Transaction
+import io
+
+
+def upload(client, content, filename='transactions.csv'):
+    return client.post(
+        '/api/transactions/import?category_id=1',
+        data={'file': (io.BytesIO(content), filename)},
+        content_type='multipart/form-data'
+    )
+
+
+def transaction_count(app):
+    with app.app_context():
+        return Transaction.query.filter(Transaction.user_id == 1).count()
+
+
+def test_import_skips_invalid_rows(seeded, login):
+    before = transaction_count(seeded)
+    response = upload(login(1), b'date,description,amount\n2024-01-02,Coffee,-3.50\nbad,Tea,-2\n')
+
+    assert response.status_code == 201
+    assert response.get_json() == {
+        'imported': 1, 'failed': 1, 'errors': [{'line': 3, 'error': 'Invalid date format. Use YYYY-MM-DD'}]
+    }
+    assert transaction_count(seeded) == before + 1
+
+
+def test_import_skips_amounts_too_large_to_store(seeded, login):
+    before = transaction_count(seeded)
+    response = upload(login(1), b'date,description,amount\n2024-01-02,Coffee,-3.50\n2024-01-02,Typo,-1e12\n')
+
+    assert response.status_code == 201
+    assert response.get_json() == {
+        'imported': 1, 'failed': 1, 'errors': [{'line': 3, 'error': 'Amount must be at most 99,999,999.99'}]
+    }
+    assert transaction_count(seeded) == before + 1
+
+
+def test_import_rejects_a_file_that_is_not_utf8(seeded, login):
+    before = transaction_count(seeded)
+    response = upload(login(1), 'date,description,amount\n2024-01-02,Café,-3.50\n'.encode('latin-1'))
+
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Line 2: the file must be UTF-8 encoded'}
+    assert transaction_count(seeded) == before
+
+
+def test_import_rejects_a_malformed_csv_and_keeps_nothing(seeded, login):
+    before = transaction_count(seeded)
+    rows = ''.join(f'2024-01-02,Row {n},-1\n' for n in range(1500))
+    # Past csv's default field size limit of 128 KiB
+    oversized = 'x' * 200000
+    response = upload(login(1), f'date,description,amount\n{rows}2024-01-03,"{oversized}",-1\n'.encode())
+
+    assert response.status_code == 400
+    assert response.get_json()['error'].startswith('Line 1502: field larger than field limit')
+    # The rows of the batch already inserted are rolled back too
+    assert transaction_count(seeded) == before
@@ -0,0 +1,47 @@
+import pytest
+
+VALID = {
+    'category_id': 1,
+    'amount': 12.5,
+    'description': 'Lunch',
+    'type': 'expense',
+    'transaction_date': '2024-01-02'
+}
+INVALID_AMOUNTS = [
+    ('NaN', 'Amount must be a number'),
+    ('Infinity', 'Amount must be a number'),
+    ('lots', 'Amount must be a number'),
+    (True, 'Amount must be a number'),
+    (0, 'Amount must be greater than 0'),
+    ('1e12', 'Amount must be at most 99,999,999.99'),
+]
+
+
+@pytest.mark.parametrize('amount, error', INVALID_AMOUNTS)
+def test_create_rejects_invalid_amount(seeded, login, amount, error):
+    response = login(1).post('/api/transactions', json={**VALID, 'amount': amount})
+
+    assert response.status_code == 400
+    assert response.get_json()['error'] == error
+
+
+@pytest.mark.parametrize('amount, error', INVALID_AMOUNTS)
+def test_update_rejects_invalid_amount(seeded, login, amount, error):
+    client = login(1)
+    transaction = client.post('/api/transactions', json=VALID).get_json()
+
+    response = client.put(f'/api/transactions/{transaction["id"]}', json={'amount': amount})
+
+    assert response.status_code == 400
+    assert response.get_json()['error'] == error
+    assert client.get(f'/api/transactions/{transaction["id"]}').get_json()['amount'] == 12.5
+
+
+def test_update_amount(seeded, login):
+    client = login(1)
+    transaction = client.post('/api/transactions', json=VALID).get_json()
+
+    response = client.put(f'/api/transactions/{transaction["id"]}', json={'amount': '20.25'})
+
+    assert response.status_code == 200
+    assert response.get_json()['amount'] == 20.25